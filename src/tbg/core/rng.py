@@ -42,9 +42,10 @@ class RNG:
     def export_state(self) -> RNGStatePayload:
         """Return a JSON-friendly snapshot of the underlying RNG state."""
         version, state_tuple, gauss = self._random.getstate()
+        # getstate() already yields plain ints, so one list() copy replaces a per-word conversion.
         return {
             "version": int(version),
-            "state": [int(value) for value in state_tuple],
+            "state": list(state_tuple),
             "gauss": gauss if gauss is None else float(gauss),
         }
 
@@ -58,10 +59,13 @@ class RNG:
             raise ValueError("Invalid RNG state payload (missing keys).") from exc
         if not isinstance(state_values, list):
             raise ValueError("Invalid RNG state payload (state must be a list).")
-        try:
-            state_tuple = tuple(int(value) for value in state_values)
-        except (TypeError, ValueError) as exc:
-            raise ValueError("Invalid RNG state payload (state elements must be integers).") from exc
+        if all(type(value) is int for value in state_values):
+            state_tuple = tuple(state_values)
+        else:
+            try:
+                state_tuple = tuple(int(value) for value in state_values)
+            except (TypeError, ValueError) as exc:
+                raise ValueError("Invalid RNG state payload (state elements must be integers).") from exc
         if gauss is not None and not isinstance(gauss, (int, float)):
             raise ValueError("Invalid RNG state payload (gauss must be numeric or null).")
         gauss_value = None if gauss is None else float(gauss)
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Generic, TypeVar
+from typing import Dict, Generic, Iterable, Mapping, TypeVar
 
 from tbg.data.errors import DataValidationError
 from tbg.data.json_loader import load_json
@@ -41,13 +41,36 @@ class RepositoryBase(Generic[T]):
 
     def get(self, def_id: str) -> T:
         """Return a definition by id."""
-        self._ensure_loaded()
-        assert self._definitions is not None
+        definitions = self._definitions
+        if definitions is None:
+            self._ensure_loaded()
+            definitions = self._definitions
+            assert definitions is not None
         try:
-            return self._definitions[def_id]
+            return definitions[def_id]
         except KeyError as exc:
             raise KeyError(def_id) from exc
 
+    def get_many(self, def_ids: Iterable[str]) -> Dict[str, T]:
+        """Return definitions for several ids in one pass; raises KeyError on the first missing id."""
+        self._ensure_loaded()
+        definitions = self._definitions
+        assert definitions is not None
+        resolved: Dict[str, T] = {}
+        for def_id in def_ids:
+            if def_id not in resolved:
+                try:
+                    resolved[def_id] = definitions[def_id]
+                except KeyError as exc:
+                    raise KeyError(def_id) from exc
+        return resolved
+
+    def as_map(self) -> Mapping[str, T]:
+        """Return a read-only view of all definitions keyed by id, for loops that resolve many ids."""
+        self._ensure_loaded()
+        assert self._definitions is not None
+        return self._definitions
+
     def all(self) -> list[T]:
         """Return all definitions sorted deterministically by id."""
         self._ensure_loaded()
@@ -77,22 +77,21 @@ def apply_attribute_scaling(
     base_stats: BaseStats,
     attributes: Attributes,
     *,
-    current_hp: int,
-    current_mp: int,
+    current_hp: int | None = None,
+    current_mp: int | None = None,
 ) -> Stats:
-    contributions = compute_attribute_contributions(attributes)
-    max_hp = base_stats.max_hp + contributions.max_hp
-    max_mp = base_stats.max_mp + contributions.max_mp
-    hp = min(current_hp, max_hp)
-    mp = min(current_mp, max_mp)
+    """Derive combat stats; omitted current HP/MP means the result starts full."""
+    # Same arithmetic as compute_attribute_contributions, without the intermediate frozen object.
+    max_hp = base_stats.max_hp + attributes.VIT * VIT_HP_PER_POINT
+    max_mp = base_stats.max_mp + attributes.INT * INT_MP_PER_POINT
     return Stats(
         max_hp=max_hp,
-        hp=hp,
+        hp=max_hp if current_hp is None else min(current_hp, max_hp),
         max_mp=max_mp,
-        mp=mp,
-        attack=base_stats.attack + contributions.attack,
+        mp=max_mp if current_mp is None else min(current_mp, max_mp),
+        attack=base_stats.attack + attributes.STR * STR_ATK_PER_POINT,
         defense=base_stats.defense,
-        speed=base_stats.speed + contributions.speed,
+        speed=base_stats.speed + attributes.DEX * DEX_SPEED_PER_POINT,
     )
 
 
@@ -63,6 +63,31 @@ class BattleState:
     round_last_actor_id: str | None = None
     enemy_skill_uses: Dict[str, Dict[str, int]] = field(default_factory=dict)
     temp_knowledge_reveals: set[str] = field(default_factory=set)
+    # instance_id -> (side, position); entries are re-checked against the live lists on every lookup.
+    _side_index: Dict[str, Tuple[Side, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def side_of(self, combatant_id: str) -> Side | None:
+        """Return the side a combatant belongs to, or None if it is not in this battle."""
+        entry = self._side_index.get(combatant_id)
+        if entry is None or not self._side_entry_is_current(combatant_id, entry):
+            # Lists may be appended to, reassigned, or have members swapped; rebuild from them.
+            index: Dict[str, Tuple[Side, int]] = {
+                ally.instance_id: ("allies", position) for position, ally in enumerate(self.allies)
+            }
+            for position, enemy in enumerate(self.enemies):
+                index[enemy.instance_id] = ("enemies", position)
+            self._side_index = index
+            entry = index.get(combatant_id)
+            if entry is None:
+                return None
+        return entry[0]
+
+    def _side_entry_is_current(self, combatant_id: str, entry: Tuple[Side, int]) -> bool:
+        side, position = entry
+        members = self.allies if side == "allies" else self.enemies
+        return position < len(members) and members[position].instance_id == combatant_id
 
 
 @dataclass(frozen=True, slots=True)
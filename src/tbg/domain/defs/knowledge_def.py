@@ -1,7 +1,7 @@
 """Knowledge definition data structures."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Tuple
 
 
@@ -15,4 +15,8 @@ class KnowledgeEntry:
     hp_range: Tuple[int, int] | None
     speed_hint: str | None
     behavior: str | None
+    enemy_tag_set: frozenset[str] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        # Cached once so battle-time tag matching does not rebuild sets per lookup.
+        self.enemy_tag_set = frozenset(self.enemy_tags)
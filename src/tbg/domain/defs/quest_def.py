@@ -1,10 +1,11 @@
 """Quest definition data structures."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Literal, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, Literal, Tuple
 
 QuestObjectiveType = Literal["kill_tag", "collect_item", "visit_area"]
+IndexedObjectives = Tuple[Tuple[int, "QuestObjectiveDef"], ...]
 
 
 @dataclass(slots=True)
@@ -53,3 +54,29 @@ class QuestDef:
     rewards: QuestRewardDef
     accept_flags: Tuple[str, ...]
     complete_flags: Tuple[str, ...]
+    kill_objectives_by_tag: Dict[str, IndexedObjectives] = field(init=False, repr=False, compare=False)
+    visit_objectives_by_area: Dict[str, IndexedObjectives] = field(init=False, repr=False, compare=False)
+    collect_objectives: IndexedObjectives = field(init=False, repr=False, compare=False)
+    collect_item_ids: frozenset[str] = field(init=False, repr=False, compare=False)
+    accept_flag_updates: Dict[str, bool] = field(init=False, repr=False, compare=False)
+    complete_flag_updates: Dict[str, bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Indexed once so progress events only visit the objectives they can affect.
+        kills: Dict[str, list[tuple[int, QuestObjectiveDef]]] = {}
+        visits: Dict[str, list[tuple[int, QuestObjectiveDef]]] = {}
+        collects: list[tuple[int, QuestObjectiveDef]] = []
+        for index, objective in enumerate(self.objectives):
+            if objective.objective_type == "kill_tag" and objective.tag is not None:
+                kills.setdefault(objective.tag, []).append((index, objective))
+            elif objective.objective_type == "visit_area" and objective.area_id:
+                visits.setdefault(objective.area_id, []).append((index, objective))
+            elif objective.objective_type == "collect_item" and objective.item_id:
+                collects.append((index, objective))
+        self.kill_objectives_by_tag = {tag: tuple(entries) for tag, entries in kills.items()}
+        self.visit_objectives_by_area = {area_id: tuple(entries) for area_id, entries in visits.items()}
+        self.collect_objectives = tuple(collects)
+        self.collect_item_ids = frozenset(objective.item_id for _, objective in collects if objective.item_id)
+        # Prebuilt so accepting or completing sets every flag with a single dict.update().
+        self.accept_flag_updates = dict.fromkeys(self.accept_flags, True)
+        self.complete_flag_updates = dict.fromkeys(self.complete_flags, True)
@@ -22,13 +22,12 @@ def scale_enemy_stats(base: Stats, *, battle_level: int) -> Stats:
     attack = base.attack + (ATTACK_PER_LEVEL * level)
     defense = base.defense + (DEFENSE_PER_LEVEL * level)
     speed = base.speed + (SPEED_PER_LEVEL * level)
-    hp = min(base.hp, max_hp)
-    mp = min(base.mp, base.max_mp)
+    # Scaled enemies are freshly spawned, so they start at full HP and MP.
     return Stats(
         max_hp=max_hp,
-        hp=hp,
+        hp=max_hp,
         max_mp=base.max_mp,
-        mp=mp,
+        mp=base.max_mp,
         attack=attack,
         defense=defense,
         speed=speed,
@@ -4,8 +4,11 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List
 
+from tbg.domain.defs import WeaponDef
+
 
 ARMOUR_SLOTS: tuple[str, ...] = ("head", "body", "hands", "boots")
+ARMOUR_SLOT_SET: frozenset[str] = frozenset(ARMOUR_SLOTS)
 
 
 def _default_armour_slots() -> Dict[str, str | None]:
@@ -18,6 +21,26 @@ class MemberEquipment:
 
     weapon_slots: List[str | None] = field(default_factory=lambda: [None, None])
     armour_slots: Dict[str, str | None] = field(default_factory=_default_armour_slots)
+    # Resolved definitions parallel to weapon_slots. An entry is only trusted while its id
+    # still matches the slot, so code that assigns weapon_slots directly stays correct.
+    weapon_slot_defs: List[WeaponDef | None] = field(
+        default_factory=lambda: [None, None], repr=False, compare=False
+    )
+
+    def equipped_armour_ids(self) -> List[str]:
+        """Return equipped armour ids in ARMOUR_SLOTS order."""
+        armour_slots = self.armour_slots
+        return [armour_id for armour_id in map(armour_slots.get, ARMOUR_SLOTS) if armour_id]
+
+
+class EquipmentMap(Dict[str, MemberEquipment]):
+    """Per-member equipment that creates an empty loadout on first access."""
+
+    __slots__ = ()
+
+    def __missing__(self, member_id: str) -> MemberEquipment:
+        equipment = self[member_id] = MemberEquipment()
+        return equipment
 
 
 @dataclass(slots=True)
@@ -0,0 +1,30 @@
+"""Party member EXP curve helpers shared by battle, story, and quest rewards."""
+from __future__ import annotations
+
+from math import isqrt
+
+# Level 1 -> 2 costs 10 EXP and every later level costs 5 more than the one before.
+BASE_EXP_TO_LEVEL = 10
+EXP_STEP_PER_LEVEL = 5
+
+
+def exp_to_next_level(level: int) -> int:
+    return BASE_EXP_TO_LEVEL + (level - 1) * EXP_STEP_PER_LEVEL
+
+
+def exp_for_levels(level: int, count: int) -> int:
+    """Total EXP needed to climb ``count`` levels starting at ``level``."""
+    # Arithmetic series: count * first_threshold + step * (0 + 1 + ... + count - 1).
+    return count * exp_to_next_level(level) + EXP_STEP_PER_LEVEL * count * (count - 1) // 2
+
+
+def levels_gained(level: int, exp: int) -> int:
+    """Return how many consecutive thresholds ``exp`` covers starting at ``level``."""
+    first = exp_to_next_level(level)
+    if exp < first:
+        return 0
+    # Largest integer n with step * n^2 + (2 * first - step) * n - 2 * exp <= 0. Every term is an
+    # integer, so flooring the root from isqrt and then dividing by 2 * step stays exact.
+    linear = 2 * first - EXP_STEP_PER_LEVEL
+    discriminant = linear * linear + 8 * EXP_STEP_PER_LEVEL * exp
+    return (isqrt(discriminant) - linear) // (2 * EXP_STEP_PER_LEVEL)
@@ -19,3 +19,8 @@ class QuestProgress:
 
     quest_id: str
     objectives: List[QuestObjectiveProgress] = field(default_factory=list)
+    # Objectives not yet completed; the quest service decrements it as entries complete.
+    remaining: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.remaining = [entry.completed for entry in self.objectives].count(False)
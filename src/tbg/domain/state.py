@@ -7,7 +7,7 @@ from typing import Dict, List, Tuple
 from tbg.core.rng import RNG
 from tbg.core.types import GameMode
 from tbg.domain.entities import Attributes, Player
-from tbg.domain.inventory import MemberEquipment, PartyInventory
+from tbg.domain.inventory import EquipmentMap, PartyInventory
 from tbg.domain.quest_state import QuestProgress
 
 
@@ -34,7 +34,7 @@ class GameState:
     pending_narration: List[Tuple[str, str]] = field(default_factory=list)
     pending_story_node_id: str | None = None
     inventory: PartyInventory = field(default_factory=PartyInventory)
-    equipment: Dict[str, MemberEquipment] = field(default_factory=dict)
+    equipment: EquipmentMap = field(default_factory=EquipmentMap)
     member_levels: Dict[str, int] = field(default_factory=dict)
     member_exp: Dict[str, int] = field(default_factory=dict)
     camp_message: str | None = None
@@ -835,9 +835,7 @@ def _load_game_flow(save_service: SaveService, slot_store: SaveSlotStore) -> Gam
         if action == "back":
             continue
         if action == "delete":
-            if _confirm_delete_slot(selection):
-                slot_store.delete_slot(selection.slot)
-                print(f"Deleted Slot {selection.slot}.")
+            _delete_slot_if_confirmed(selection, slot_store)
             continue
         if action != "load":
             continue
@@ -849,9 +847,13 @@ def _load_game_flow(save_service: SaveService, slot_store: SaveSlotStore) -> Gam
         except FileNotFoundError:
             print("Slot is empty.")
             continue
-        except ValueError as exc:
-            print(f"Load failed: {exc}")
-            return None
+        except ValueError:
+            # The slot list only decodes the metadata header, so a damaged body surfaces here.
+            selection.is_corrupt = True
+            print("Slot data is corrupt. Overwrite it from the Camp Menu.")
+            if _prompt_load_slot_action(selection, allow_load=False) == "delete":
+                _delete_slot_if_confirmed(selection, slot_store)
+            continue
         try:
             state = save_service.deserialize(payload)
         except SaveLoadError as exc:
@@ -2131,7 +2133,8 @@ def _handle_save_request(state: GameState, save_service: SaveService, slot_store
         if not _prompt_confirmation("Overwrite this save?"):
             return
     try:
-        payload = save_service.serialize(state)
+        # The payload is encoded immediately, so it can share the live state containers.
+        payload = save_service.serialize(state, copy_containers=False)
         slot_store.write_slot(selection.slot, payload)
     except OSError as exc:
         print(f"Save failed: {exc}")
@@ -2160,6 +2163,12 @@ def _confirm_delete_slot(selection: SlotMetadata) -> bool:
     return _prompt_confirmation(f"Delete Slot {selection.slot} permanently?")
 
 
+def _delete_slot_if_confirmed(selection: SlotMetadata, slot_store: SaveSlotStore) -> None:
+    if _confirm_delete_slot(selection):
+        slot_store.delete_slot(selection.slot)
+        print(f"Deleted Slot {selection.slot}.")
+
+
 def _prompt_slot_choice(slot_store: SaveSlotStore, *, title: str) -> SlotMetadata | None:
     entries = slot_store.list_slots()
     options = [_format_slot_label(entry) for entry in entries]
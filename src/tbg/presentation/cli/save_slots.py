@@ -8,6 +8,14 @@ from typing import Any, Dict, List
 
 from tbg.presentation.cli import config
 
+# Shared encoder for slot payloads. json only takes its C fast path when no indent is set, so slots are
+# written compactly; sort_keys keeps the output stable across saves of the same state.
+_SLOT_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+# With sorted compact keys, "metadata" is always the first member of a slot file. The slot list decodes
+# just that object as a header instead of parsing the whole save; other layouts take the full parse.
+_METADATA_HEADER = '{"metadata":'
+_SLOT_DECODER = json.JSONDecoder()
+
 
 @dataclass(slots=True)
 class SlotMetadata:
@@ -35,9 +43,7 @@ class SaveSlotStore:
                 slots.append(SlotMetadata(slot=slot_index, exists=False))
                 continue
             try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
-                raw_metadata = payload.get("metadata") if isinstance(payload, dict) else None
-                metadata = raw_metadata if isinstance(raw_metadata, dict) else None
+                metadata = _read_metadata(path.read_text(encoding="utf-8"))
                 slots.append(SlotMetadata(slot=slot_index, exists=True, metadata=metadata))
             except Exception:
                 slots.append(SlotMetadata(slot=slot_index, exists=True, metadata=None, is_corrupt=True))
@@ -60,7 +66,7 @@ class SaveSlotStore:
         self._validate_slot(slot)
         self._base_dir.mkdir(parents=True, exist_ok=True)
         path = self._slot_path(slot)
-        path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+        path.write_text(_SLOT_ENCODER.encode(payload), encoding="utf-8")
 
     def delete_slot(self, slot: int) -> None:
         """Delete the requested slot payload if it exists."""
@@ -77,3 +83,12 @@ class SaveSlotStore:
     def _validate_slot(self, slot: int) -> None:
         if not 1 <= slot <= self._slot_count:
             raise ValueError(f"Slot index must be between 1 and {self._slot_count}.")
+
+
+def _read_metadata(text: str) -> Dict[str, Any] | None:
+    if text.startswith(_METADATA_HEADER):
+        raw_metadata, _ = _SLOT_DECODER.raw_decode(text, len(_METADATA_HEADER))
+    else:
+        payload = json.loads(text)
+        raw_metadata = payload.get("metadata") if isinstance(payload, dict) else None
+    return raw_metadata if isinstance(raw_metadata, dict) else None
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import math
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 from tbg.core.rng import RNG
 from tbg.data.repositories import (
@@ -48,11 +48,17 @@ from tbg.domain.debuffs import (
 )
 from tbg.domain.knowledge_models import EnemyHpVisibilityMode, KnowledgeTier
 from tbg.domain.item_effects import apply_item_effects
+from tbg.domain.leveling import exp_for_levels, levels_gained
 from tbg.domain.entities import Attributes, BaseStats, Stats
-from tbg.domain.inventory import ARMOUR_SLOTS, MemberEquipment
+from tbg.domain.inventory import MemberEquipment
 from tbg.domain.state import GameState
 from tbg.services.errors import FactoryError
-from tbg.services.factories import create_enemy_instance, create_summon_combatant, make_instance_id
+from tbg.services.factories import (
+    create_enemy_group,
+    create_enemy_instance,
+    create_summon_combatant,
+    make_instance_id,
+)
 from tbg.services.knowledge_keys import resolve_enemy_knowledge_key
 from tbg.services.knowledge_service import KnowledgeService
 from tbg.services.quest_service import QuestService
@@ -301,6 +307,9 @@ class BattleService:
         self._items_repo = items_repo
         self._loot_tables_repo = loot_tables_repo
         self._loot_tables_cache: List[LootTableDef] | None = None
+        self._item_names: Dict[str, str] | None = None
+        self._skills_by_weapon_tags: Dict[Tuple[str, ...], Tuple[SkillDef, ...]] = {}
+        self._known_tags_by_member: Dict[str, Tuple[List[KnowledgeEntry], frozenset[str]]] = {}
         self._summons_repo = summons_repo or SummonsRepository()
         self._floors_repo = floors_repo
         self._locations_repo = locations_repo
@@ -318,22 +327,34 @@ class BattleService:
 
         try:
             self._enemies_repo.get(enemy_id)
-            enemy_ids = [enemy_id]
+            is_group = False
         except KeyError:
-            group_def = self._enemies_repo.get_group(enemy_id)
-            enemy_ids = list(group_def.enemy_ids or [])
+            self._enemies_repo.get_group(enemy_id)
+            is_group = True
 
         battle_level_info = self._resolve_battle_level(state)
-        enemies: List[Combatant] = []
-        for _id in enemy_ids:
-            enemy_instance = create_enemy_instance(
-                _id,
+        if is_group:
+            enemy_instances = create_enemy_group(
+                enemy_id,
                 enemies_repo=self._enemies_repo,
                 weapons_repo=self._weapons_repo,
                 armour_repo=self._armour_repo,
                 rng=state.rng,
                 battle_level=battle_level_info.level,
             )
+        else:
+            enemy_instances = [
+                create_enemy_instance(
+                    enemy_id,
+                    enemies_repo=self._enemies_repo,
+                    weapons_repo=self._weapons_repo,
+                    armour_repo=self._armour_repo,
+                    rng=state.rng,
+                    battle_level=battle_level_info.level,
+                )
+            ]
+        enemies: List[Combatant] = []
+        for enemy_instance in enemy_instances:
             enemies.append(
                 Combatant(
                     instance_id=enemy_instance.id,
@@ -526,13 +547,40 @@ class BattleService:
     def get_battle_view(self, battle_state: BattleState) -> BattleView:
         """Return structured information for rendering."""
         snapshot = battle_state.knowledge_snapshot
+        allies: List[BattleCombatantView] = []
+        for ally in battle_state.allies:
+            stats = ally.stats
+            allies.append(
+                BattleCombatantView(
+                    instance_id=ally.instance_id,
+                    name=ally.display_name,
+                    hp_display=f"{stats.hp}/{stats.max_hp}",
+                    side=ally.side,
+                    is_alive=stats.hp > 0,
+                    current_hp=stats.hp,
+                    max_hp=stats.max_hp,
+                    defense=stats.defense,
+                )
+            )
+        enemies: List[BattleCombatantView] = []
+        for enemy in battle_state.enemies:
+            stats = enemy.stats
+            enemies.append(
+                BattleCombatantView(
+                    instance_id=enemy.instance_id,
+                    name=enemy.display_name,
+                    hp_display=self._resolve_enemy_hp_display(enemy, snapshot),
+                    side=enemy.side,
+                    is_alive=stats.hp > 0,
+                    current_hp=stats.hp,
+                    max_hp=stats.max_hp,
+                    defense=stats.defense,
+                )
+            )
         return BattleView(
             battle_id=battle_state.battle_id,
-            allies=[self._to_view(ally, hp_display=f"{ally.stats.hp}/{ally.stats.max_hp}") for ally in battle_state.allies],
-            enemies=[
-                self._to_view(enemy, hp_display=self._resolve_enemy_hp_display(enemy, snapshot))
-                for enemy in battle_state.enemies
-            ],
+            allies=allies,
+            enemies=enemies,
             current_actor_id=battle_state.current_actor_id,
         )
 
@@ -567,50 +615,72 @@ class BattleService:
     def basic_attack(self, battle_state: BattleState, attacker_id: str, target_id: str) -> List[BattleEvent]:
         attacker = self._get_combatant(battle_state, attacker_id)
         target = self._get_combatant(battle_state, target_id)
+        events: List[BattleEvent] = []
+        self._resolve_basic_attack(battle_state, attacker, target, events)
+        return events
+
+    def _resolve_basic_attack(
+        self,
+        battle_state: BattleState,
+        attacker: Combatant,
+        target: Combatant,
+        events: List[BattleEvent],
+    ) -> None:
         action_attack = self._action_attack_for_skill(attacker, (PHYSICAL_SKILL_TAG,))
         damage, debuff_events = self._resolve_damage(
             battle_state, attacker, target, bonus_power=0, minimum=1, action_attack=action_attack
         )
 
-        events: List[BattleEvent] = [
+        attacker_instance_id = attacker.instance_id
+        target_instance_id = target.instance_id
+        target_name = target.display_name
+        target_hp = target.stats.hp
+        events.append(
             AttackResolvedEvent(
-                attacker_id=attacker.instance_id,
+                attacker_id=attacker_instance_id,
                 attacker_name=attacker.display_name,
-                target_id=target.instance_id,
-                target_name=target.display_name,
+                target_id=target_instance_id,
+                target_name=target_name,
                 damage=damage,
-                target_hp=target.stats.hp,
+                target_hp=target_hp,
             )
-        ]
+        )
         events.extend(debuff_events)
-        if not target.is_alive:
-            events.append(CombatantDefeatedEvent(combatant_id=target.instance_id, combatant_name=target.display_name))
+        if target_hp <= 0:
+            events.append(CombatantDefeatedEvent(combatant_id=target_instance_id, combatant_name=target_name))
 
         player_defeat_event = self._check_player_defeat(battle_state)
         if player_defeat_event:
             events.append(player_defeat_event)
-            return events
+            return
 
         maybe_resolved = self._update_victory(battle_state)
         if maybe_resolved:
             events.append(maybe_resolved)
         else:
-            round_events = self._advance_turn(battle_state, attacker.instance_id)
-            events.extend(round_events)
-        return events
+            self._advance_turn(battle_state, attacker_instance_id, events)
 
     def get_available_skills(self, battle_state: BattleState, combatant_id: str) -> List[SkillDef]:
         combatant = self._get_combatant(battle_state, combatant_id)
-        if not combatant.weapon_tags:
-            return []
+        return list(self._skills_for_weapon_tags(combatant.weapon_tags))
+
+    def _skills_for_weapon_tags(self, weapon_tags: Tuple[str, ...]) -> Tuple[SkillDef, ...]:
+        if not weapon_tags:
+            return ()
+        cached = self._skills_by_weapon_tags.get(weapon_tags)
+        if cached is not None:
+            return cached
+        weapon_tag_set = set(weapon_tags)
         available: List[SkillDef] = []
         for skill in self._skills_repo.all():
             # Enemy-tagged skills are not available to allies
             if "enemy" in skill.tags:
                 continue
-            if set(skill.required_weapon_tags).issubset(set(combatant.weapon_tags)):
+            if weapon_tag_set.issuperset(skill.required_weapon_tags):
                 available.append(skill)
-        return available
+        cached = tuple(available)
+        self._skills_by_weapon_tags[weapon_tags] = cached
+        return cached
 
     def use_skill(
         self, battle_state: BattleState, attacker_id: str, skill_id: str, target_ids: Sequence[str]
@@ -677,8 +747,7 @@ class BattleService:
         if maybe_resolved:
             events.append(maybe_resolved)
         else:
-            round_events = self._advance_turn(battle_state, attacker.instance_id)
-            events.extend(round_events)
+            self._advance_turn(battle_state, attacker.instance_id, events)
         return events
 
     def party_talk(self, battle_state: BattleState, state: GameState, speaker_id: str) -> List[BattleEvent]:
@@ -870,16 +939,19 @@ class BattleService:
         # Fall back to basic attack
         target, anti_repeat_applied = self._select_enemy_target(battle_state, actor, living_allies, rng)
         aggro_value = battle_state.enemy_aggro.get(actor.instance_id, {}).get(target.instance_id, 0)
-        events = self.basic_attack(battle_state, actor.instance_id, target.instance_id)
-        debug_event = EnemyTargetingDebugEvent(
-            attacker_id=actor.instance_id,
-            attacker_name=actor.display_name,
-            target_id=target.instance_id,
-            target_name=target.display_name,
-            top_value=aggro_value,
-            anti_repeat_applied=anti_repeat_applied,
-        )
-        return [debug_event, *events]
+        # The debug event only depends on the selection, so it can lead the list the attack appends to.
+        events: List[BattleEvent] = [
+            EnemyTargetingDebugEvent(
+                attacker_id=actor.instance_id,
+                attacker_name=actor.display_name,
+                target_id=target.instance_id,
+                target_name=target.display_name,
+                top_value=aggro_value,
+                anti_repeat_applied=anti_repeat_applied,
+            )
+        ]
+        self._resolve_basic_attack(battle_state, actor, target, events)
+        return events
 
     def _try_enemy_skill(
         self,
@@ -1019,8 +1091,7 @@ class BattleService:
         if not living_enemies:
             return []
 
-        available_skills = self.get_available_skills(battle_state, actor_id)
-        for skill in available_skills:
+        for skill in self._skills_for_weapon_tags(actor.weapon_tags):
             if actor.stats.mp < skill.mp_cost:
                 continue
             target_ids = self._select_ai_skill_targets(battle_state, skill, actor, living_enemies, rng)
@@ -1112,14 +1183,7 @@ class BattleService:
             speed=member_def.speed,
         )
         attributes = state.party_member_attributes.get(member_id, member_def.starting_attributes)
-        stats = apply_attribute_scaling(
-            base_stats,
-            attributes,
-            current_hp=base_stats.max_hp,
-            current_mp=base_stats.max_mp,
-        )
-        stats.hp = stats.max_hp
-        stats.mp = stats.max_mp
+        stats = apply_attribute_scaling(base_stats, attributes)
         return Combatant(
             instance_id=f"party_{member_id}",
             display_name=member_def.name,
@@ -1133,15 +1197,14 @@ class BattleService:
         )
 
     def _get_combatant(self, battle_state: BattleState, combatant_id: str) -> Combatant:
-        for combatant in self._iter_combatants(battle_state):
+        for combatant in battle_state.allies:
+            if combatant.instance_id == combatant_id:
+                return combatant
+        for combatant in battle_state.enemies:
             if combatant.instance_id == combatant_id:
                 return combatant
         raise ValueError(f"Combatant '{combatant_id}' not found.")
 
-    def _iter_combatants(self, battle_state: BattleState) -> Iterable[Combatant]:
-        yield from battle_state.allies
-        yield from battle_state.enemies
-
     def _initialize_enemy_aggro(self, battle_state: BattleState) -> None:
         battle_state.enemy_aggro = {}
         battle_state.last_target = {}
@@ -1180,16 +1243,24 @@ class BattleService:
         return max(1, base)
 
     def _rebuild_turn_queue(self, battle_state: BattleState) -> None:
-        living = [c for c in self._iter_combatants(battle_state) if c.is_alive]
+        living = [c for c in battle_state.allies if c.is_alive]
+        living += [c for c in battle_state.enemies if c.is_alive]
         living.sort(key=lambda c: (-c.stats.speed, c.instance_id))
         battle_state.turn_queue = [c.instance_id for c in living]
         if not living:
             battle_state.current_actor_id = None
 
-    def _advance_turn(self, battle_state: BattleState, last_actor_id: str) -> List[BattleEvent]:
+    def _advance_turn(
+        self,
+        battle_state: BattleState,
+        last_actor_id: str,
+        events: List[BattleEvent] | None = None,
+    ) -> List[BattleEvent]:
+        """Move to the next actor, appending round events into ``events`` when provided."""
         self._rebuild_turn_queue(battle_state)
         queue = battle_state.turn_queue
-        events: List[BattleEvent] = []
+        if events is None:
+            events = []
         if not queue:
             battle_state.current_actor_id = None
             return events
@@ -1426,18 +1497,6 @@ class BattleService:
 
         return " ".join(parts)
 
-    def _to_view(self, combatant: Combatant, *, hp_display: str) -> BattleCombatantView:
-        return BattleCombatantView(
-            instance_id=combatant.instance_id,
-            name=combatant.display_name,
-            hp_display=hp_display,
-            side=combatant.side,
-            is_alive=combatant.is_alive,
-            current_hp=combatant.stats.hp,
-            max_hp=combatant.stats.max_hp,
-            defense=combatant.stats.defense,
-        )
-
     def _resolve_enemy_hp_display(
         self,
         enemy: Combatant,
@@ -1547,12 +1606,7 @@ class BattleService:
     def _armour_ids_from_equipment(self, equipment: MemberEquipment | None) -> List[str]:
         if equipment is None:
             return []
-        ids: List[str] = []
-        for slot in ARMOUR_SLOTS:
-            armour_id = equipment.armour_slots.get(slot)
-            if armour_id:
-                ids.append(armour_id)
-        return ids
+        return equipment.equipped_armour_ids()
 
     def _calculate_attack(self, weapon_ids: Sequence[str], fallback: int) -> int:
         for weapon_id in weapon_ids:
@@ -1653,35 +1707,42 @@ class BattleService:
         minimum: int,
         action_attack: int | None = None,
     ) -> tuple[int, List[BattleEvent]]:
+        target_stats = target.stats
         effective_attack = (
             compute_effective_action_attack(action_attack, attacker.debuffs)
             if action_attack is not None
             else compute_effective_attack(attacker.stats, attacker.debuffs)
         )
-        effective_defense = compute_effective_defense(target.stats, target.debuffs)
-        base_damage = max(minimum, effective_attack + bonus_power - effective_defense)
-        damage = base_damage
-        if target.guard_reduction > 0:
-            absorbed = min(damage, target.guard_reduction)
-            damage -= absorbed
+        effective_defense = compute_effective_defense(target_stats, target.debuffs)
+        damage = max(minimum, effective_attack + bonus_power - effective_defense)
+        guard_reduction = target.guard_reduction
+        if guard_reduction > 0:
+            damage -= min(damage, guard_reduction)
             target.guard_reduction = 0
         damage = max(0, damage)
-        target.stats.hp = max(0, target.stats.hp - damage)
+        remaining_hp = max(0, target_stats.hp - damage)
+        target_stats.hp = remaining_hp
         debuff_events: List[BattleEvent] = []
-        if not target.is_alive and target.debuffs:
+        if remaining_hp <= 0 and target.debuffs:
             target.debuffs = []
 
-        if damage > 0 and attacker.side == "allies" and target.side == "enemies":
-            aggro_map = battle_state.enemy_aggro.setdefault(target.instance_id, {})
-            if attacker.instance_id not in aggro_map:
-                aggro_map[attacker.instance_id] = self._base_threat_for_target(attacker)
-            aggro_map[attacker.instance_id] += damage + AGGRO_HIT_BONUS
-            threat_map = battle_state.party_threat.setdefault(attacker.instance_id, {})
-            if target.instance_id not in threat_map:
-                threat_map[target.instance_id] = self._base_threat_for_target(target)
-            threat_map[target.instance_id] += damage + AGGRO_HIT_BONUS
-        elif damage > 0 and attacker.side == "enemies" and target.side == "allies":
-            battle_state.last_target[attacker.instance_id] = target.instance_id
+        if damage <= 0:
+            return damage, debuff_events
+        attacker_id = attacker.instance_id
+        target_id = target.instance_id
+        attacker_side = attacker.side
+        target_side = target.side
+        if attacker_side == "allies" and target_side == "enemies":
+            aggro_map = battle_state.enemy_aggro.setdefault(target_id, {})
+            if attacker_id not in aggro_map:
+                aggro_map[attacker_id] = self._base_threat_for_target(attacker)
+            aggro_map[attacker_id] += damage + AGGRO_HIT_BONUS
+            threat_map = battle_state.party_threat.setdefault(attacker_id, {})
+            if target_id not in threat_map:
+                threat_map[target_id] = self._base_threat_for_target(target)
+            threat_map[target_id] += damage + AGGRO_HIT_BONUS
+        elif attacker_side == "enemies" and target_side == "allies":
+            battle_state.last_target[attacker_id] = target_id
 
         return damage, debuff_events
 
@@ -1704,15 +1765,18 @@ class BattleService:
             if len(requested_target_ids) > skill.max_targets:
                 raise ValueError("Too many targets selected for skill.")
 
+        attacker_side = attacker.side
         targets: List[Combatant] = []
+        seen_ids: set[str] = set()
         for target_id in requested_target_ids:
             target = self._get_combatant(battle_state, target_id)
-            if target.side == attacker.side:
+            if target.side == attacker_side:
                 raise ValueError("Cannot target allies with this skill.")
             if not target.is_alive:
                 raise ValueError("Cannot target defeated combatants.")
-            if target in targets:
+            if target.instance_id in seen_ids:
                 raise ValueError("Duplicate targets are not allowed.")
+            seen_ids.add(target.instance_id)
             targets.append(target)
         return targets
 
@@ -1732,7 +1796,7 @@ class BattleService:
                         knowledge_key = source_id
                 groups[source_id] = {
                     "name": enemy.display_name,
-                    "tags": tuple(enemy.tags),
+                    "tags": frozenset(enemy.tags),
                     "max_hp": enemy.stats.max_hp,
                     "knowledge_key": knowledge_key,
                     "instance_id": enemy.instance_id,
@@ -1743,15 +1807,14 @@ class BattleService:
 
     @staticmethod
     def _match_knowledge_entry(
-        entries: Sequence[KnowledgeEntry], knowledge_key: str, tags: Tuple[str, ...]
+        entries: Sequence[KnowledgeEntry], knowledge_key: str, tag_set: frozenset[str]
     ) -> KnowledgeEntry | None:
-        tag_set = set(tags)
         for entry in entries:
             if entry.knowledge_keys:
                 if knowledge_key in entry.knowledge_keys:
                     return entry
                 continue
-            if set(entry.enemy_tags) & tag_set:
+            if not tag_set.isdisjoint(entry.enemy_tag_set):
                 return entry
         return None
 
@@ -1828,10 +1891,10 @@ class BattleService:
                     if member_id == state.player.id:
                         share += remainder
                     if share > 0:
-                        reward_events.extend(self._award_exp(state, member_id, share))
+                        self._award_exp(state, member_id, share, reward_events)
 
-        reward_events.extend(self._roll_loot(defeated, state))
-        reward_events.extend(self._apply_floor_one_side_quest_rewards(defeated, state))
+        self._roll_loot(defeated, state, reward_events)
+        self._apply_floor_one_side_quest_rewards(defeated, state)
         if self._quest_service and defeated:
             defeated_tags = [tuple(getattr(enemy_def, "tags", ())) for _, enemy_def in defeated]
             self._quest_service.record_battle_victory(state, defeated_tags)
@@ -1844,10 +1907,8 @@ class BattleService:
 
     def _apply_floor_one_side_quest_rewards(
         self, defeated: List[tuple[Combatant, object]], state: GameState
-    ) -> List[BattleEvent]:
+    ) -> None:
         """Handle Floor One side quest progress and rewards using flags only."""
-        events: List[BattleEvent] = []
-
         # Dana side quest: collect 3 wolf teeth (tracked via inventory).
         if state.flags.get("flag_sq_dana_accepted") and not state.flags.get("flag_sq_dana_completed"):
             teeth = state.inventory.items.get("wolf_tooth", 0)
@@ -1863,18 +1924,19 @@ class BattleService:
                     goblin_kills += 1
                 if getattr(enemy_def, "id", "") == "half_orc_raider":
                     orc_kills += 1
-            if goblin_kills:
+            goblin_count = (
                 self._increment_flag_counter(state, "flag_kill_goblin_grunt", 10, goblin_kills)
-            if orc_kills:
+                if goblin_kills
+                else self._flag_counter_value(state, "flag_kill_goblin_grunt", 10)
+            )
+            orc_count = (
                 self._increment_flag_counter(state, "flag_kill_half_orc", 5, orc_kills)
-
-            goblin_count = self._flag_counter_value(state, "flag_kill_goblin_grunt", 10)
-            orc_count = self._flag_counter_value(state, "flag_kill_half_orc", 5)
+                if orc_kills
+                else self._flag_counter_value(state, "flag_kill_half_orc", 5)
+            )
             if goblin_count >= 10 and orc_count >= 5:
                 state.flags["flag_sq_cerel_ready"] = True
 
-        return events
-
     @staticmethod
     def _flag_counter_value(state: GameState, prefix: str, maximum: int) -> int:
         return sum(1 for idx in range(1, maximum + 1) if state.flags.get(f"{prefix}_{idx}"))
@@ -1882,13 +1944,15 @@ class BattleService:
     @staticmethod
     def _increment_flag_counter(
         state: GameState, prefix: str, maximum: int, increment: int = 1
-    ) -> None:
+    ) -> int:
+        """Set the next counter flags and return the updated count."""
         current = 0
         while current < maximum and state.flags.get(f"{prefix}_{current + 1}"):
             current += 1
         new_value = min(maximum, current + max(0, increment))
         for idx in range(current + 1, new_value + 1):
             state.flags[f"{prefix}_{idx}"] = True
+        return new_value
 
 
     def _active_party_ids(self, state: GameState) -> List[str]:
@@ -1898,20 +1962,24 @@ class BattleService:
         ids.extend(state.party_members)
         return ids
 
-    def _award_exp(self, state: GameState, member_id: str, amount: int) -> List[BattleEvent]:
+    def _award_exp(
+        self,
+        state: GameState,
+        member_id: str,
+        amount: int,
+        events: List[BattleEvent] | None = None,
+    ) -> List[BattleEvent]:
+        """Grant exp to a member, appending reward events into ``events`` when provided."""
+        if events is None:
+            events = []
         if amount <= 0:
-            return []
-        events: List[BattleEvent] = []
-        current_level = state.member_levels.get(member_id, 1)
-        current_exp = state.member_exp.get(member_id, 0)
-        current_exp += amount
-        leveled: List[int] = []
-        threshold = self._xp_to_next_level(current_level)
-        while current_exp >= threshold:
-            current_exp -= threshold
-            current_level += 1
-            leveled.append(current_level)
-            threshold = self._xp_to_next_level(current_level)
+            return events
+        start_level = state.member_levels.get(member_id, 1)
+        current_exp = state.member_exp.get(member_id, 0) + amount
+        gained = levels_gained(start_level, current_exp)
+        current_exp -= exp_for_levels(start_level, gained)
+        current_level = start_level + gained
+        leveled = range(start_level + 1, current_level + 1)
         state.member_levels[member_id] = current_level
         state.member_exp[member_id] = current_exp
         member_name = self._resolve_member_name(state, member_id)
@@ -1931,12 +1999,15 @@ class BattleService:
             self._restore_member_resources(state, member_id, restore_hp=True, restore_mp=True)
         return events
 
-    @staticmethod
-    def _xp_to_next_level(level: int) -> int:
-        return 10 + (level - 1) * 5
-
-    def _roll_loot(self, defeated: List[tuple[Combatant, object]], state: GameState) -> List[BattleEvent]:
-        loot_events: List[BattleEvent] = []
+    def _roll_loot(
+        self,
+        defeated: List[tuple[Combatant, object]],
+        state: GameState,
+        loot_events: List[BattleEvent] | None = None,
+    ) -> List[BattleEvent]:
+        """Roll drops for defeated enemies, appending loot events into ``loot_events`` when provided."""
+        if loot_events is None:
+            loot_events = []
         for combatant, _enemy_def in defeated:
             tags = set(combatant.tags)
             for table in self._loot_tables():
@@ -1975,10 +2046,9 @@ class BattleService:
         return True
 
     def _get_item_name(self, item_id: str) -> str:
-        try:
-            return self._items_repo.get(item_id).name
-        except KeyError:
-            return item_id
+        if self._item_names is None:
+            self._item_names = {item.id: item.name for item in self._items_repo.all()}
+        return self._item_names.get(item_id, item_id)
 
     def _resolve_member_name(self, state: GameState, member_id: str) -> str:
         if state.player and member_id == state.player.id:
@@ -2021,14 +2091,23 @@ class BattleService:
         
         Returns True if at least one active party member knows about enemies with these tags.
         """
-        enemy_tag_set = set(enemy_tags)
+        if not enemy_tags:
+            return False
         for member_id in self._active_party_ids(state):
-            entries = self._knowledge_repo.get_entries(member_id)
-            for entry in entries:
-                if set(entry.enemy_tags) & enemy_tag_set:
-                    return True
+            if not self._known_enemy_tags(member_id).isdisjoint(enemy_tags):
+                return True
         return False
 
+    def _known_enemy_tags(self, member_id: str) -> frozenset[str]:
+        entries = self._knowledge_repo.get_entries(member_id)
+        cached = self._known_tags_by_member.get(member_id)
+        # Keyed on the entries list itself so a reloaded or replaced list is re-indexed.
+        if cached is not None and cached[0] is entries:
+            return cached[1]
+        known = frozenset().union(*(entry.enemy_tag_set for entry in entries))
+        self._known_tags_by_member[member_id] = (entries, known)
+        return known
+
     def _restore_member_resources(
         self,
         state: GameState,
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Literal, Sequence, Tuple
+from typing import Callable, Dict, List, Literal, Sequence, Tuple
 
 from tbg.core.rng import RNG
 from tbg.domain.battle_models import BattleState, Combatant
@@ -20,9 +20,12 @@ from tbg.services.battle_service import (
 BattleActionType = Literal["attack", "skill", "talk", "item"]
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class BattleAction:
-    """Represents a structured action decision from the player."""
+    """Represents a structured action decision from the player.
+
+    Actions are immutable and validated once at construction.
+    """
 
     action_type: BattleActionType
     target_id: str | None = None
@@ -31,6 +34,24 @@ class BattleAction:
     speaker_id: str | None = None
     item_id: str | None = None
 
+    def __post_init__(self) -> None:
+        if self.action_type == "attack":
+            if not self.target_id:
+                raise ValueError("Attack action requires target_id.")
+        elif self.action_type == "skill":
+            if not self.skill_id or self.target_ids is None:
+                raise ValueError("Skill action requires skill_id and target_ids.")
+        elif self.action_type == "talk":
+            if not self.speaker_id:
+                raise ValueError("Talk action requires speaker_id.")
+        elif self.action_type == "item":
+            if not self.item_id or not self.target_id:
+                raise ValueError("Item action requires item_id and target_id.")
+        else:
+            raise ValueError(f"Unknown action type: {self.action_type}")
+        if self.target_ids is not None and not isinstance(self.target_ids, tuple):
+            object.__setattr__(self, "target_ids", tuple(self.target_ids))
+
 
 class BattleController:
     """
@@ -53,44 +74,57 @@ class BattleController:
 
     def __init__(self, battle_service: BattleService) -> None:
         self._service = battle_service
+        self._actions_cache: Tuple[Tuple[int, int, str], dict] | None = None
+        self._talk_preview_cache: Dict[tuple, List[PartyTalkPreviewGroup]] = {}
+        self._view_cache: Tuple[Tuple[int, int, str | None], BattleView] | None = None
 
     def get_battle_view(self, battle_state: BattleState) -> BattleView:
-        """Return structured view of current battle state for rendering."""
-        return self._service.get_battle_view(battle_state)
+        """
+        Return structured view of current battle state for rendering.
+
+        The view is reused for redraws until an action, AI turn or knowledge refresh goes through this controller.
+        """
+        cache_key = (id(battle_state), battle_state.round_index, battle_state.current_actor_id)
+        if self._view_cache is not None and self._view_cache[0] == cache_key:
+            return self._view_cache[1]
+        view = self._service.get_battle_view(battle_state)
+        self._view_cache = (cache_key, view)
+        return view
 
     def refresh_knowledge_snapshot(self, battle_state: BattleState, state: GameState) -> None:
+        self._talk_preview_cache.clear()
+        self._view_cache = None
         self._service.refresh_knowledge_snapshot(battle_state, state)
 
+    def _invalidate_turn_caches(self) -> None:
+        """Drop per-turn results once battle state has been advanced."""
+        self._actions_cache = None
+        self._talk_preview_cache.clear()
+        self._view_cache = None
+
     def is_player_controlled_turn(self, battle_state: BattleState, state: GameState) -> bool:
         """Check if the current actor is the player-controlled character."""
-        if not state.player:
+        player = state.player
+        if player is None:
             return False
         actor_id = battle_state.current_actor_id
-        if not actor_id:
-            return False
-        return actor_id == state.player.id
+        return bool(actor_id) and actor_id == player.id
 
     def is_ally_ai_turn(self, battle_state: BattleState, state: GameState) -> bool:
         """Check if the current actor is a non-player ally."""
         actor_id = battle_state.current_actor_id
         if not actor_id:
             return False
-        if self.is_player_controlled_turn(battle_state, state):
+        if state.player and actor_id == state.player.id:
             return False
-        for ally in battle_state.allies:
-            if ally.instance_id == actor_id:
-                return True
-        return False
+        return battle_state.side_of(actor_id) == "allies"
 
     def is_enemy_turn(self, battle_state: BattleState) -> bool:
         """Check if the current actor is an enemy."""
         actor_id = battle_state.current_actor_id
         if not actor_id:
             return False
-        for enemy in battle_state.enemies:
-            if enemy.instance_id == actor_id:
-                return True
-        return False
+        return battle_state.side_of(actor_id) == "enemies"
 
     def get_available_actions(self, battle_state: BattleState, state: GameState) -> dict:
         """
@@ -103,6 +137,8 @@ class BattleController:
         - can_talk: bool
         - available_skills: List[SkillDef]
         - items: List[BattleInventoryItem]
+
+        The result is reused until an action or AI turn is applied through this controller.
         """
         actor_id = battle_state.current_actor_id
         if not actor_id:
@@ -115,9 +151,13 @@ class BattleController:
                 "items": [],
             }
 
+        cache_key = (id(battle_state), battle_state.round_index, actor_id)
+        if self._actions_cache is not None and self._actions_cache[0] == cache_key:
+            return self._actions_cache[1]
+
         available_skills = self._service.get_available_skills(battle_state, actor_id)
         battle_items = self._service.get_battle_items(state)
-        return {
+        actions = {
             "can_attack": True,
             "can_use_skill": bool(available_skills),
             "can_use_item": bool(battle_items),
@@ -125,6 +165,8 @@ class BattleController:
             "available_skills": available_skills,
             "items": battle_items,
         }
+        self._actions_cache = (cache_key, actions)
+        return actions
 
     def apply_player_action(
         self, battle_state: BattleState, state: GameState, action: BattleAction
@@ -137,38 +179,60 @@ class BattleController:
         actor_id = battle_state.current_actor_id
         if not actor_id:
             raise ValueError("No current actor.")
+        self._invalidate_turn_caches()
 
-        if action.action_type == "attack":
-            if not action.target_id:
-                raise ValueError("Attack action requires target_id.")
-            return self._service.basic_attack(battle_state, actor_id, action.target_id)
+        # BattleAction validates its required fields at construction time.
+        handler = self._ACTION_HANDLERS.get(action.action_type)
+        if handler is None:
+            raise ValueError(f"Unknown action type: {action.action_type}")
+        return handler(self._service, battle_state, state, action, actor_id)
 
-        if action.action_type == "skill":
-            if not action.skill_id or action.target_ids is None:
-                raise ValueError("Skill action requires skill_id and target_ids.")
-            return self._service.use_skill(battle_state, actor_id, action.skill_id, action.target_ids)
+    @staticmethod
+    def _apply_attack(
+        service: BattleService, battle_state: BattleState, state: GameState, action: BattleAction, actor_id: str
+    ) -> List[BattleEvent]:
+        assert action.target_id is not None
+        return service.basic_attack(battle_state, actor_id, action.target_id)
 
-        if action.action_type == "talk":
-            if not action.speaker_id:
-                raise ValueError("Talk action requires speaker_id.")
-            return self._service.party_talk(battle_state, state, action.speaker_id)
+    @staticmethod
+    def _apply_skill(
+        service: BattleService, battle_state: BattleState, state: GameState, action: BattleAction, actor_id: str
+    ) -> List[BattleEvent]:
+        assert action.skill_id is not None and action.target_ids is not None
+        return service.use_skill(battle_state, actor_id, action.skill_id, action.target_ids)
 
-        if action.action_type == "item":
-            if not action.item_id or not action.target_id:
-                raise ValueError("Item action requires item_id and target_id.")
-            return self._service.use_item(battle_state, state, actor_id, action.item_id, action.target_id)
+    @staticmethod
+    def _apply_talk(
+        service: BattleService, battle_state: BattleState, state: GameState, action: BattleAction, actor_id: str
+    ) -> List[BattleEvent]:
+        assert action.speaker_id is not None
+        return service.party_talk(battle_state, state, action.speaker_id)
+
+    @staticmethod
+    def _apply_item(
+        service: BattleService, battle_state: BattleState, state: GameState, action: BattleAction, actor_id: str
+    ) -> List[BattleEvent]:
+        assert action.item_id is not None and action.target_id is not None
+        return service.use_item(battle_state, state, actor_id, action.item_id, action.target_id)
 
-        raise ValueError(f"Unknown action type: {action.action_type}")
+    _ACTION_HANDLERS: Dict[str, Callable[..., List[BattleEvent]]] = {
+        "attack": _apply_attack,
+        "skill": _apply_skill,
+        "talk": _apply_talk,
+        "item": _apply_item,
+    }
 
     def run_ally_ai_turn(self, battle_state: BattleState, rng: RNG) -> List[BattleEvent]:
         """Execute ally AI logic and return events."""
         actor_id = battle_state.current_actor_id
         if not actor_id:
             return []
+        self._invalidate_turn_caches()
         return self._service.run_ally_ai_turn(battle_state, actor_id, rng)
 
     def run_enemy_turn(self, battle_state: BattleState, rng: RNG) -> List[BattleEvent]:
         """Execute enemy AI logic and return events."""
+        self._invalidate_turn_caches()
         return self._service.run_enemy_turn(battle_state, rng)
 
     def should_render_state_panel(
@@ -184,17 +248,35 @@ class BattleController:
         """
         if is_first_turn:
             return True
-        return self.is_player_controlled_turn(battle_state, state)
+        player = state.player
+        actor_id = battle_state.current_actor_id
+        return player is not None and bool(actor_id) and actor_id == player.id
 
     def apply_victory_rewards(self, battle_state: BattleState, state: GameState) -> List[BattleEvent]:
         """Apply victory rewards and return events."""
+        self._invalidate_turn_caches()
         return self._service.apply_victory_rewards(battle_state, state)
 
     def party_talk_preview(
         self, battle_state: BattleState, state: GameState, speaker_id: str
     ) -> List[PartyTalkPreviewGroup]:
-        """Preview Party Talk output without mutating state."""
-        return self._service.party_talk_preview(battle_state, state, speaker_id)
+        """
+        Preview Party Talk output without mutating state.
+
+        Previews are reused until an action, AI turn or knowledge refresh goes through this controller.
+        """
+        cache_key = (
+            id(battle_state),
+            battle_state.round_index,
+            battle_state.current_actor_id,
+            speaker_id,
+            tuple(state.party_members),
+        )
+        cached = self._talk_preview_cache.get(cache_key)
+        if cached is None:
+            cached = self._service.party_talk_preview(battle_state, state, speaker_id)
+            self._talk_preview_cache[cache_key] = cached
+        return cached
 
     def has_knowledge_of_enemy(self, state: GameState, enemy_tags: Tuple[str, ...]) -> bool:
         """
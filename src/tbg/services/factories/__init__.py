@@ -1,17 +1,14 @@
 """Factory helpers for runtime entities."""
 
-from .enemy_factory import create_enemy_instance
+from .enemy_factory import create_enemy_group, create_enemy_instance
 from .id_factory import make_instance_id
 from .player_factory import create_player_from_class_id
 from .summon_factory import create_summon_combatant
 
 __all__ = [
+    "create_enemy_group",
     "create_enemy_instance",
     "create_player_from_class_id",
     "create_summon_combatant",
     "make_instance_id",
 ]
-
-
-
-
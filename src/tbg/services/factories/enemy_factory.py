@@ -1,6 +1,9 @@
 """Factory for creating enemy instances from definitions."""
 from __future__ import annotations
 
+from dataclasses import replace
+from weakref import WeakKeyDictionary
+
 from tbg.core.rng import RNG
 from tbg.data.repositories import ArmourRepository, EnemiesRepository, WeaponsRepository
 from tbg.domain.enemy_scaling import scale_enemy_stats
@@ -10,6 +13,14 @@ from tbg.services.errors import FactoryError
 
 from .id_factory import make_instance_id
 
+# (weapon ids, armour id, armour slot items): everything an enemy's equipment bonus is resolved from.
+_EquipmentLoadout = tuple[tuple[str, ...], str | None, tuple[tuple[str, str], ...]]
+
+# Equipment bonuses per (weapons repo, armour repo, loadout); weak keys let discarded repositories go.
+_EQUIPMENT_BONUSES: WeakKeyDictionary[
+    WeaponsRepository, WeakKeyDictionary[ArmourRepository, dict[_EquipmentLoadout, tuple[int, int]]]
+] = WeakKeyDictionary()
+
 
 def create_enemy_instance(
     enemy_id: str,
@@ -29,6 +40,55 @@ def create_enemy_instance(
     if enemy_def.enemy_ids:
         raise FactoryError(f"Enemy '{enemy_id}' is a group definition and cannot be instantiated directly.")
 
+    base_stats, stats = _build_enemy_stats(enemy_def, weapons_repo, armour_repo, battle_level)
+    return _instantiate_enemy(enemy_def, base_stats, stats, rng)
+
+
+def create_enemy_group(
+    group_id: str,
+    enemies_repo: EnemiesRepository,
+    weapons_repo: WeaponsRepository,
+    armour_repo: ArmourRepository,
+    rng: RNG,
+    *,
+    battle_level: int | None = None,
+) -> list[EnemyInstance]:
+    """Instantiate every member of an enemy group, resolving each distinct member once."""
+    try:
+        group_def = enemies_repo.get_group(group_id)
+    except KeyError as exc:
+        raise FactoryError(f"Enemy group '{group_id}' not found.") from exc
+
+    resolved: dict[str, tuple[EnemyDef, Stats, Stats]] = {}
+    instances: list[EnemyInstance] = []
+    for member_id in group_def.enemy_ids or ():
+        entry = resolved.get(member_id)
+        if entry is None:
+            try:
+                member_def = enemies_repo.get(member_id)
+            except KeyError as exc:
+                raise FactoryError(f"Enemy '{member_id}' not found.") from exc
+            if member_def.enemy_ids:
+                raise FactoryError(
+                    f"Enemy '{member_id}' is a group definition and cannot be instantiated directly."
+                )
+            base_stats, stats = _build_enemy_stats(member_def, weapons_repo, armour_repo, battle_level)
+            entry = (member_def, base_stats, stats)
+            resolved[member_id] = entry
+        member_def, base_template, stats_template = entry
+        # Each member needs its own mutable Stats; only the resolution work is shared.
+        base_stats = replace(base_template)
+        stats = base_stats if stats_template is base_template else replace(stats_template)
+        instances.append(_instantiate_enemy(member_def, base_stats, stats, rng))
+    return instances
+
+
+def _build_enemy_stats(
+    enemy_def: EnemyDef,
+    weapons_repo: WeaponsRepository,
+    armour_repo: ArmourRepository,
+    battle_level: int | None,
+) -> tuple[Stats, Stats]:
     assert (
         enemy_def.hp is not None
         and enemy_def.mp is not None
@@ -37,10 +97,9 @@ def create_enemy_instance(
         and enemy_def.speed is not None
         and enemy_def.rewards_exp is not None
         and enemy_def.rewards_gold is not None
-    ), f"Enemy definition '{enemy_id}' missing combat stats."
+    ), f"Enemy definition '{enemy_def.id}' missing combat stats."
 
-    weapon_attack = _resolve_weapon_attack(enemy_def.weapon_ids, weapons_repo)
-    armour_defense = _resolve_armour_defense(enemy_def, armour_repo)
+    weapon_attack, armour_defense = _equipment_bonus(enemy_def, weapons_repo, armour_repo)
 
     base_stats = Stats(
         max_hp=enemy_def.hp,
@@ -52,11 +111,14 @@ def create_enemy_instance(
         speed=enemy_def.speed,
     )
     stats = base_stats
-    if battle_level is not None:
+    # Level 0 (and below) scaling adds nothing, so the base stats are used as-is.
+    if battle_level is not None and battle_level > 0:
         stats = scale_enemy_stats(base_stats, battle_level=battle_level)
-        stats.hp = stats.max_hp
-        stats.mp = stats.max_mp
+    return base_stats, stats
+
 
+def _instantiate_enemy(enemy_def: EnemyDef, base_stats: Stats, stats: Stats, rng: RNG) -> EnemyInstance:
+    assert enemy_def.rewards_exp is not None and enemy_def.rewards_gold is not None
     instance_id = make_instance_id("enemy", rng)
     return EnemyInstance(
         id=instance_id,
@@ -70,6 +132,25 @@ def create_enemy_instance(
     )
 
 
+def _equipment_bonus(
+    enemy_def: EnemyDef, weapons_repo: WeaponsRepository, armour_repo: ArmourRepository
+) -> tuple[int, int]:
+    by_armour_repo = _EQUIPMENT_BONUSES.get(weapons_repo)
+    if by_armour_repo is None:
+        by_armour_repo = _EQUIPMENT_BONUSES[weapons_repo] = WeakKeyDictionary()
+    bonuses = by_armour_repo.get(armour_repo)
+    if bonuses is None:
+        bonuses = by_armour_repo[armour_repo] = {}
+    loadout = (enemy_def.weapon_ids, enemy_def.armour_id, tuple(enemy_def.armour_slots.items()))
+    bonus = bonuses.get(loadout)
+    if bonus is None:
+        bonus = bonuses[loadout] = (
+            _resolve_weapon_attack(enemy_def.weapon_ids, weapons_repo),
+            _resolve_armour_defense(enemy_def, armour_repo),
+        )
+    return bonus
+
+
 def _resolve_weapon_attack(weapon_ids: tuple[str, ...], weapons_repo: WeaponsRepository) -> int:
     for weapon_id in weapon_ids:
         try:
@@ -96,7 +177,3 @@ def _resolve_armour_defense(enemy_def: EnemyDef, armour_repo: ArmourRepository)
             continue
         total += armour_def.defense
     return total
-
-
-
-
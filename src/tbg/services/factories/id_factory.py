@@ -3,12 +3,15 @@ from __future__ import annotations
 
 from tbg.core.rng import RNG
 
-
-def make_instance_id(prefix: str, rng: RNG) -> str:
-    """Generate a deterministic identifier using the provided RNG."""
-    suffix = rng.randint(100000, 999999)
-    return f"{prefix}_{suffix}"
-
+INSTANCE_ID_MIN = 100000
+INSTANCE_ID_MAX = 999999
 
 
+def make_instance_id(prefix: str, rng: RNG) -> str:
+    """Generate a deterministic identifier using the provided RNG.
 
+    The suffix must come from the game RNG: every later roll (loot, tie-breaks)
+    depends on the stream position, so a process-local counter would change
+    the outcome of existing seeds and saves.
+    """
+    return f"{prefix}_{rng.randint(INSTANCE_ID_MIN, INSTANCE_ID_MAX)}"
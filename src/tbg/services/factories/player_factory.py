@@ -54,14 +54,7 @@ def create_player_from_class_id(
     )
 
     player_id = make_instance_id("player", rng)
-    stats = apply_attribute_scaling(
-        base_stats,
-        attributes,
-        current_hp=base_stats.max_hp,
-        current_mp=base_stats.max_mp,
-    )
-    stats.hp = stats.max_hp
-    stats.mp = stats.max_mp
+    stats = apply_attribute_scaling(base_stats, attributes)
     return Player(
         id=player_id,
         name=name,
@@ -71,7 +64,3 @@ def create_player_from_class_id(
         base_stats=base_stats,
         equipped_summons=[],
     )
-
-
-
-
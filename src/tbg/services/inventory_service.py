@@ -2,13 +2,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Literal, Sequence
+from typing import Dict, Iterable, List, Literal, Sequence
 
 from tbg.data.repositories import ArmourRepository, PartyMembersRepository, WeaponsRepository
 from tbg.domain.attribute_scaling import apply_attribute_scaling, build_attribute_scaling_breakdown
-from tbg.domain.defs import ClassDef, PartyMemberDef
+from tbg.domain.defs import ClassDef, PartyMemberDef, WeaponDef
 from tbg.domain.entities import Attributes, BaseStats, Stats
-from tbg.domain.inventory import ARMOUR_SLOTS, MemberEquipment
+from tbg.domain.inventory import ARMOUR_SLOT_SET, ARMOUR_SLOTS, MemberEquipment
 from tbg.domain.state import GameState
 
 
@@ -74,6 +74,50 @@ class EquipFailedEvent(InventoryEvent):
     message: str
 
 
+# Shared weapon slot index tuples; callers only iterate or index them.
+_SLOT_0: tuple[int, ...] = (0,)
+_SLOT_1: tuple[int, ...] = (1,)
+_SLOTS_BOTH: tuple[int, ...] = (0, 1)
+# Weapon slot indices for each two-bit slot mask, in ascending order.
+_WEAPON_SLOTS_BY_MASK: tuple[tuple[int, ...], ...] = ((), _SLOT_0, _SLOT_1, _SLOTS_BOTH)
+_BOTH_WEAPON_SLOTS_MASK = 0b11
+
+# Event slot labels, built once instead of formatted on every equip/unequip.
+_WEAPON_SLOT_LABELS: tuple[str, ...] = ("weapon_slot_1", "weapon_slot_2")
+_ARMOUR_SLOT_LABELS: Dict[str, str] = {slot: f"armour_{slot}" for slot in ARMOUR_SLOTS}
+
+# Fixed player-facing messages for each equip failure reason, per category and action.
+_WEAPON_EQUIP_FAILURES: Dict[str, str] = {
+    "unknown": "Unable to equip weapon.",
+    "unknown_weapon": "Weapon is not recognized by the data repository.",
+    "invalid_slot": "Please choose a valid weapon slot.",
+    "slot_occupied": "Weapon slot is occupied. Choose a different slot or allow replacement.",
+    "not_in_inventory": "Weapon is not available in the shared inventory.",
+}
+_WEAPON_UNEQUIP_FAILURES: Dict[str, str] = {
+    "invalid_slot": "Invalid weapon slot selected.",
+    "slot_empty": "Weapon slot is already empty.",
+}
+_ARMOUR_EQUIP_FAILURES: Dict[str, str] = {
+    "unknown": "Unable to equip armour.",
+    "unknown_armour": "Armour is not recognized by the data repository.",
+    "invalid_slot": "Armour slot is invalid.",
+    "slot_occupied": "Armour slot already has equipment. Allow replacement to continue.",
+    "not_in_inventory": "Armour is not available in the shared inventory.",
+}
+_ARMOUR_UNEQUIP_FAILURES: Dict[str, str] = {
+    "invalid_slot": "Invalid armour slot selected.",
+    "slot_empty": "Armour slot is already empty.",
+}
+
+
+def _equip_failed(
+    member_id: str, member_name: str, reason: str, messages: Dict[str, str]
+) -> List[InventoryEvent]:
+    message = messages[reason]
+    return [EquipFailedEvent(member_id=member_id, member_name=member_name, reason=reason, message=message)]
+
+
 class InventoryService:
     """Service responsible for shared inventory and equipment operations."""
 
@@ -86,22 +130,26 @@ class InventoryService:
         self._weapons_repo = weapons_repo
         self._armour_repo = armour_repo
         self._party_members_repo = party_members_repo
+        self._summary_cache: tuple[tuple, InventorySummary] | None = None
 
     # ------------------------------------------------------------------ Views
     def list_party_members(self, state: GameState) -> List[PartyMemberView]:
         members: List[PartyMemberView] = []
-        if state.player is not None:
-            members.append(
-                PartyMemberView(member_id=state.player.id, name=state.player.name, is_player=True)
-            )
-        for member_id in state.party_members:
-            members.append(
-                PartyMemberView(
-                    member_id=member_id,
-                    name=self._member_name(state, member_id),
-                    is_player=False,
-                )
-            )
+        player = state.player
+        if player is not None:
+            members.append(PartyMemberView(member_id=player.id, name=player.name, is_player=True))
+        party_ids = state.party_members
+        try:
+            member_defs = self._party_members_repo.get_many(party_ids)
+        except KeyError:
+            # Unknown ids keep the per-member fallback to the raw id.
+            names = [self._member_name(state, member_id) for member_id in party_ids]
+        else:
+            names = [member_defs[member_id].name for member_id in party_ids]
+        members.extend(
+            PartyMemberView(member_id=member_id, name=name, is_player=False)
+            for member_id, name in zip(party_ids, names)
+        )
         return members
 
     def build_member_equipment_view(
@@ -109,11 +157,11 @@ class InventoryService:
         state: GameState,
         member_id: str,
     ) -> tuple[List[WeaponSlotView], List[ArmourSlotView]]:
-        equipment = self._ensure_member_equipment(state, member_id)
+        equipment = state.equipment[member_id]
         weapon_views: List[WeaponSlotView] = []
         for idx, weapon_id in enumerate(equipment.weapon_slots):
             if weapon_id:
-                weapon_def = self._weapons_repo.get(weapon_id)
+                weapon_def = self._slot_weapon_def(equipment, idx, weapon_id)
                 weapon_views.append(
                     WeaponSlotView(
                         slot_index=idx,
@@ -127,35 +175,53 @@ class InventoryService:
                     WeaponSlotView(slot_index=idx, weapon_id=None, weapon_name=None, slot_cost=None)
                 )
 
+        armour_slots = equipment.armour_slots
+        armour_defs = self._armour_repo.get_many(equipment.equipped_armour_ids())
         armour_views: List[ArmourSlotView] = []
         for slot in ARMOUR_SLOTS:
-            armour_id = equipment.armour_slots.get(slot)
+            armour_id = armour_slots.get(slot)
             if armour_id:
-                armour_def = self._armour_repo.get(armour_id)
                 armour_views.append(
-                    ArmourSlotView(slot=slot, armour_id=armour_id, armour_name=armour_def.name)
+                    ArmourSlotView(slot=slot, armour_id=armour_id, armour_name=armour_defs[armour_id].name)
                 )
             else:
                 armour_views.append(ArmourSlotView(slot=slot, armour_id=None, armour_name=None))
         return weapon_views, armour_views
 
     def build_inventory_summary(self, state: GameState) -> InventorySummary:
-        weapons_summary: List[tuple[str, str, int, int]] = []
-        for weapon_id, qty in sorted(state.inventory.weapons.items()):
-            weapon_def = self._weapons_repo.get(weapon_id)
-            weapons_summary.append((weapon_id, weapon_def.name, qty, weapon_def.slot_cost))
-
-        armour_summary: List[tuple[str, str, int, str]] = []
-        for armour_id, qty in sorted(state.inventory.armour.items()):
-            armour_def = self._armour_repo.get(armour_id)
-            armour_summary.append((armour_id, armour_def.name, qty, armour_def.slot))
-
-        items_summary = sorted(state.inventory.items.items())
-        return InventorySummary(
+        inventory = state.inventory
+        # Inventory buckets are also written directly (quests, save loading), so the cache is keyed on
+        # their contents rather than a version counter; equal contents always give an equal summary.
+        cache_key = (
+            tuple(inventory.weapons.items()),
+            tuple(inventory.armour.items()),
+            tuple(inventory.items.items()),
+        )
+        if self._summary_cache is not None and self._summary_cache[0] == cache_key:
+            return self._summary_cache[1]
+
+        weapon_stacks = sorted(inventory.weapons.items())
+        weapon_defs = self._weapons_repo.get_many(weapon_id for weapon_id, _ in weapon_stacks)
+        weapons_summary: List[tuple[str, str, int, int]] = [
+            (weapon_id, weapon_defs[weapon_id].name, qty, weapon_defs[weapon_id].slot_cost)
+            for weapon_id, qty in weapon_stacks
+        ]
+
+        armour_stacks = sorted(inventory.armour.items())
+        armour_defs = self._armour_repo.get_many(armour_id for armour_id, _ in armour_stacks)
+        armour_summary: List[tuple[str, str, int, str]] = [
+            (armour_id, armour_defs[armour_id].name, qty, armour_defs[armour_id].slot)
+            for armour_id, qty in armour_stacks
+        ]
+
+        items_summary = sorted(inventory.items.items())
+        summary = InventorySummary(
             weapons=weapons_summary,
             armour=armour_summary,
             items=items_summary,
         )
+        self._summary_cache = (cache_key, summary)
+        return summary
 
     def build_attribute_breakdown(self, state: GameState, member_id: str):
         base_stats, current_hp, current_mp = self._build_member_base_stats(state, member_id)
@@ -170,24 +236,15 @@ class InventoryService:
     # ----------------------------------------------------------- Initialization
     def initialize_player_loadout(self, state: GameState, player_id: str, class_def: ClassDef) -> None:
         equipment = self._reset_member_equipment(state, player_id)
-        for weapon_id in class_def.starting_weapons or (class_def.starting_weapon_id,):
-            if not self._equip_weapon(
-                state,
-                player_id,
-                weapon_id,
-                slot_index=None,
-                allow_replace=False,
-                consume_from_inventory=False,
-                record_events=False,
-                auto_slot=True,
-            ):
-                state.inventory.add_weapon(weapon_id)
+        member_name = self._member_name(state, player_id)
+        self._equip_starting_weapons(equipment, class_def.starting_weapons or (class_def.starting_weapon_id,))
 
         armour_slots = class_def.starting_armour_slots or {"body": class_def.starting_armour_id}
         for slot, armour_id in armour_slots.items():
             self._equip_armour(
                 state,
                 player_id,
+                member_name,
                 armour_id,
                 allow_replace=True,
                 consume_from_inventory=False,
@@ -204,19 +261,9 @@ class InventoryService:
         member_id: str,
         member_def: PartyMemberDef,
     ) -> None:
-        self._reset_member_equipment(state, member_id)
-        for weapon_id in member_def.weapon_ids:
-            if not self._equip_weapon(
-                state,
-                member_id,
-                weapon_id,
-                slot_index=None,
-                allow_replace=False,
-                consume_from_inventory=False,
-                record_events=False,
-                auto_slot=True,
-            ):
-                state.inventory.add_weapon(weapon_id)
+        equipment = self._reset_member_equipment(state, member_id)
+        member_name = self._member_name(state, member_id)
+        self._equip_starting_weapons(equipment, member_def.weapon_ids)
 
         armour_slots = member_def.armour_slots or {}
         if member_def.armour_id and "body" not in armour_slots:
@@ -225,6 +272,7 @@ class InventoryService:
             self._equip_armour(
                 state,
                 member_id,
+                member_name,
                 armour_id,
                 allow_replace=True,
                 consume_from_inventory=False,
@@ -242,9 +290,11 @@ class InventoryService:
         slot_index: int | None,
         allow_replace: bool = False,
     ) -> List[InventoryEvent]:
+        member_name = self._member_name(state, member_id)
         success, events = self._equip_weapon(
             state,
             member_id,
+            member_name,
             weapon_id,
             slot_index=slot_index,
             allow_replace=allow_replace,
@@ -253,56 +303,36 @@ class InventoryService:
             auto_slot=False,
         )
         if not success and not events:
-            member_name = self._member_name(state, member_id)
-            events = [
-                EquipFailedEvent(
-                    member_id=member_id,
-                    member_name=member_name,
-                    reason="unknown",
-                    message="Unable to equip weapon.",
-                )
-            ]
+            events = _equip_failed(member_id, member_name, "unknown", _WEAPON_EQUIP_FAILURES)
         if success and state.player and member_id == state.player.id:
             self._refresh_player_base_stats(state)
         return events
 
     def unequip_weapon_slot(self, state: GameState, member_id: str, slot_index: int) -> List[InventoryEvent]:
         events: List[InventoryEvent] = []
-        equipment = self._ensure_member_equipment(state, member_id)
+        member_name = self._member_name(state, member_id)
+        equipment = state.equipment[member_id]
         if slot_index not in (0, 1):
-            return [
-                EquipFailedEvent(
-                    member_id=member_id,
-                    member_name=self._member_name(state, member_id),
-                    reason="invalid_slot",
-                    message="Invalid weapon slot selected.",
-                )
-            ]
+            return _equip_failed(member_id, member_name, "invalid_slot", _WEAPON_UNEQUIP_FAILURES)
         weapon_id = equipment.weapon_slots[slot_index]
         if not weapon_id:
-            return [
-                EquipFailedEvent(
-                    member_id=member_id,
-                    member_name=self._member_name(state, member_id),
-                    reason="slot_empty",
-                    message="Weapon slot is already empty.",
-                )
-            ]
+            return _equip_failed(member_id, member_name, "slot_empty", _WEAPON_UNEQUIP_FAILURES)
 
-        weapon_def = self._weapons_repo.get(weapon_id)
+        weapon_def = self._slot_weapon_def(equipment, slot_index, weapon_id)
         slots_to_clear = {slot_index}
         if weapon_def.slot_cost == 2:
             slots_to_clear = {0, 1}
         for idx in slots_to_clear:
             equipment.weapon_slots[idx] = None
+            equipment.weapon_slot_defs[idx] = None
         state.inventory.add_weapon(weapon_id)
         events.append(
             ItemUnequippedEvent(
                 member_id=member_id,
-                member_name=self._member_name(state, member_id),
+                member_name=member_name,
                 item_id=weapon_id,
                 item_name=weapon_def.name,
-                slot=f"weapon_slot_{slot_index + 1}",
+                slot=_WEAPON_SLOT_LABELS[slot_index],
                 category="weapon",
             )
         )
@@ -319,60 +349,43 @@ class InventoryService:
         *,
         allow_replace: bool = False,
     ) -> List[InventoryEvent]:
+        member_name = self._member_name(state, member_id)
         success, events = self._equip_armour(
             state,
             member_id,
+            member_name,
             armour_id,
             allow_replace=allow_replace,
             consume_from_inventory=True,
             record_events=True,
         )
         if not success and not events:
-            events = [
-                EquipFailedEvent(
-                    member_id=member_id,
-                    member_name=self._member_name(state, member_id),
-                    reason="unknown",
-                    message="Unable to equip armour.",
-                )
-            ]
+            events = _equip_failed(member_id, member_name, "unknown", _ARMOUR_EQUIP_FAILURES)
         if success and state.player and member_id == state.player.id:
             self._refresh_player_base_stats(state)
         return events
 
     def unequip_armour_slot(self, state: GameState, member_id: str, slot: str) -> List[InventoryEvent]:
         events: List[InventoryEvent] = []
-        equipment = self._ensure_member_equipment(state, member_id)
-        slot = slot.lower()
-        if slot not in ARMOUR_SLOTS:
-            return [
-                EquipFailedEvent(
-                    member_id=member_id,
-                    member_name=self._member_name(state, member_id),
-                    reason="invalid_slot",
-                    message="Invalid armour slot selected.",
-                )
-            ]
+        member_name = self._member_name(state, member_id)
+        equipment = state.equipment[member_id]
+        if not slot.islower():
+            slot = slot.lower()
+        if slot not in ARMOUR_SLOT_SET:
+            return _equip_failed(member_id, member_name, "invalid_slot", _ARMOUR_UNEQUIP_FAILURES)
         armour_id = equipment.armour_slots.get(slot)
         if not armour_id:
-            return [
-                EquipFailedEvent(
-                    member_id=member_id,
-                    member_name=self._member_name(state, member_id),
-                    reason="slot_empty",
-                    message="Armour slot is already empty.",
-                )
-            ]
+            return _equip_failed(member_id, member_name, "slot_empty", _ARMOUR_UNEQUIP_FAILURES)
         armour_def = self._armour_repo.get(armour_id)
         equipment.armour_slots[slot] = None
         state.inventory.add_armour(armour_id)
         events.append(
             ItemUnequippedEvent(
                 member_id=member_id,
-                member_name=self._member_name(state, member_id),
+                member_name=member_name,
                 item_id=armour_id,
                 item_name=armour_def.name,
-                slot=f"armour_{slot}",
+                slot=_ARMOUR_SLOT_LABELS[slot],
                 category="armour",
             )
         )
@@ -385,6 +398,7 @@ class InventoryService:
         self,
         state: GameState,
         member_id: str,
+        member_name: str,
         weapon_id: str,
         *,
         slot_index: int | None,
@@ -394,80 +408,57 @@ class InventoryService:
         auto_slot: bool,
     ) -> tuple[bool, List[InventoryEvent]]:
         events: List[InventoryEvent] = []
-        member_name = self._member_name(state, member_id)
         try:
             weapon_def = self._weapons_repo.get(weapon_id)
         except KeyError:
-            return False, [
-                EquipFailedEvent(
-                    member_id=member_id,
-                    member_name=member_name,
-                    reason="unknown_weapon",
-                    message="Weapon is not recognized by the data repository.",
-                )
-            ]
+            return False, _equip_failed(member_id, member_name, "unknown_weapon", _WEAPON_EQUIP_FAILURES)
 
-        equipment = self._ensure_member_equipment(state, member_id)
+        equipment = state.equipment[member_id]
         target_slots = self._determine_required_slots(
             weapon_def, slot_index, auto_slot, equipment
         )
         if target_slots is None:
-            return False, [
-                EquipFailedEvent(
-                    member_id=member_id,
-                    member_name=member_name,
-                    reason="invalid_slot",
-                    message="Please choose a valid weapon slot.",
-                )
-            ]
+            return False, _equip_failed(member_id, member_name, "invalid_slot", _WEAPON_EQUIP_FAILURES)
 
+        weapon_slots = equipment.weapon_slots
+        weapon_slot_defs = equipment.weapon_slot_defs
         slots_to_clear = self._slots_to_clear(equipment, target_slots)
-        blocking = [idx for idx in slots_to_clear if equipment.weapon_slots[idx]]
-        if blocking and not allow_replace:
-            return False, [
-                EquipFailedEvent(
-                    member_id=member_id,
-                    member_name=member_name,
-                    reason="slot_occupied",
-                    message="Weapon slot is occupied. Choose a different slot or allow replacement.",
-                )
-            ]
+        if not allow_replace:
+            for idx in slots_to_clear:
+                if weapon_slots[idx]:
+                    return False, _equip_failed(member_id, member_name, "slot_occupied", _WEAPON_EQUIP_FAILURES)
 
         if consume_from_inventory and not state.inventory.remove_weapon(weapon_id):
-            return False, [
-                EquipFailedEvent(
-                    member_id=member_id,
-                    member_name=member_name,
-                    reason="not_in_inventory",
-                    message="Weapon is not available in the shared inventory.",
-                )
-            ]
-
-        removed_weapons: Dict[str, int] = {}
+            return False, _equip_failed(member_id, member_name, "not_in_inventory", _WEAPON_EQUIP_FAILURES)
+
+        # At most two slots are cleared, so removed occupants are tracked in locals; a two-handed
+        # weapon fills both slots and is only returned once.
+        removed_id: str | None = None
+        removed_slot = 0
+        second_removed_id: str | None = None
+        second_removed_slot = 0
         for idx in slots_to_clear:
-            occupant = equipment.weapon_slots[idx]
-            if occupant and occupant not in removed_weapons:
-                removed_weapons[occupant] = idx
-        for idx in slots_to_clear:
-            equipment.weapon_slots[idx] = None
-
-        for removed_weapon_id, removed_slot in removed_weapons.items():
-            state.inventory.add_weapon(removed_weapon_id)
-            if record_events:
-                removed_def = self._weapons_repo.get(removed_weapon_id)
-                events.append(
-                    ItemUnequippedEvent(
-                        member_id=member_id,
-                        member_name=member_name,
-                        item_id=removed_weapon_id,
-                        item_name=removed_def.name,
-                        slot=f"weapon_slot_{removed_slot + 1}",
-                        category="weapon",
-                    )
-                )
+            occupant = weapon_slots[idx]
+            if occupant:
+                if removed_id is None:
+                    removed_id, removed_slot = occupant, idx
+                elif occupant != removed_id:
+                    second_removed_id, second_removed_slot = occupant, idx
+            weapon_slots[idx] = None
+            weapon_slot_defs[idx] = None
+
+        if removed_id is not None:
+            self._return_removed_weapon(
+                state, events, member_id, member_name, removed_id, removed_slot, record_events
+            )
+        if second_removed_id is not None:
+            self._return_removed_weapon(
+                state, events, member_id, member_name, second_removed_id, second_removed_slot, record_events
+            )
 
         for idx in target_slots:
-            equipment.weapon_slots[idx] = weapon_id
+            weapon_slots[idx] = weapon_id
+            weapon_slot_defs[idx] = weapon_def
 
         if record_events:
             events.append(
@@ -476,16 +467,65 @@ class InventoryService:
                     member_name=member_name,
                     item_id=weapon_id,
                     item_name=weapon_def.name,
-                    slot=f"weapon_slot_{target_slots[0] + 1}",
+                    slot=_WEAPON_SLOT_LABELS[target_slots[0]],
                     category="weapon",
                 )
             )
         return True, events
 
+    def _equip_starting_weapons(self, equipment: MemberEquipment, weapon_ids: Iterable[str]) -> None:
+        """Fill a freshly reset loadout in order, skipping weapons that are unknown or do not fit."""
+        get_weapon = self._weapons_repo.get
+        weapon_slots = equipment.weapon_slots
+        weapon_slot_defs = equipment.weapon_slot_defs
+        for weapon_id in weapon_ids:
+            try:
+                weapon_def = get_weapon(weapon_id)
+            except KeyError:
+                continue
+            if weapon_def.slot_cost == 2:
+                if weapon_slots[0] or weapon_slots[1]:
+                    continue
+                target_slots = _SLOTS_BOTH
+            elif weapon_slots[0] is None:
+                target_slots = _SLOT_0
+            elif weapon_slots[1] is None:
+                target_slots = _SLOT_1
+            else:
+                continue
+            for idx in target_slots:
+                weapon_slots[idx] = weapon_id
+                weapon_slot_defs[idx] = weapon_def
+
+    def _return_removed_weapon(
+        self,
+        state: GameState,
+        events: List[InventoryEvent],
+        member_id: str,
+        member_name: str,
+        weapon_id: str,
+        slot_index: int,
+        record_events: bool,
+    ) -> None:
+        state.inventory.add_weapon(weapon_id)
+        if record_events:
+            removed_def = self._weapons_repo.get(weapon_id)
+            events.append(
+                ItemUnequippedEvent(
+                    member_id=member_id,
+                    member_name=member_name,
+                    item_id=weapon_id,
+                    item_name=removed_def.name,
+                    slot=_WEAPON_SLOT_LABELS[slot_index],
+                    category="weapon",
+                )
+            )
+
     def _equip_armour(
         self,
         state: GameState,
         member_id: str,
+        member_name: str,
         armour_id: str,
         *,
         allow_replace: bool,
@@ -494,50 +534,21 @@ class InventoryService:
         target_slot: str | None = None,
     ) -> tuple[bool, List[InventoryEvent]]:
         events: List[InventoryEvent] = []
-        member_name = self._member_name(state, member_id)
         try:
             armour_def = self._armour_repo.get(armour_id)
         except KeyError:
-            return False, [
-                EquipFailedEvent(
-                    member_id=member_id,
-                    member_name=member_name,
-                    reason="unknown_armour",
-                    message="Armour is not recognized by the data repository.",
-                )
-            ]
+            return False, _equip_failed(member_id, member_name, "unknown_armour", _ARMOUR_EQUIP_FAILURES)
 
         slot = target_slot or armour_def.slot
-        if slot not in ARMOUR_SLOTS:
-            return False, [
-                EquipFailedEvent(
-                    member_id=member_id,
-                    member_name=member_name,
-                    reason="invalid_slot",
-                    message="Armour slot is invalid.",
-                )
-            ]
+        if slot not in ARMOUR_SLOT_SET:
+            return False, _equip_failed(member_id, member_name, "invalid_slot", _ARMOUR_EQUIP_FAILURES)
 
-        equipment = self._ensure_member_equipment(state, member_id)
-        occupant = equipment.armour_slots.get(slot)
+        armour_slots = state.equipment[member_id].armour_slots
+        occupant = armour_slots.get(slot)
         if occupant and not allow_replace:
-            return False, [
-                EquipFailedEvent(
-                    member_id=member_id,
-                    member_name=member_name,
-                    reason="slot_occupied",
-                    message="Armour slot already has equipment. Allow replacement to continue.",
-                )
-            ]
+            return False, _equip_failed(member_id, member_name, "slot_occupied", _ARMOUR_EQUIP_FAILURES)
         if consume_from_inventory and not state.inventory.remove_armour(armour_id):
-            return False, [
-                EquipFailedEvent(
-                    member_id=member_id,
-                    member_name=member_name,
-                    reason="not_in_inventory",
-                    message="Armour is not available in the shared inventory.",
-                )
-            ]
+            return False, _equip_failed(member_id, member_name, "not_in_inventory", _ARMOUR_EQUIP_FAILURES)
         if occupant:
             state.inventory.add_armour(occupant)
             if record_events:
@@ -548,11 +559,11 @@ class InventoryService:
                         member_name=member_name,
                         item_id=occupant,
                         item_name=occupied_def.name,
-                        slot=f"armour_{slot}",
+                        slot=_ARMOUR_SLOT_LABELS[slot],
                         category="armour",
                     )
                 )
-        equipment.armour_slots[slot] = armour_id
+        armour_slots[slot] = armour_id
         if record_events:
             events.append(
                 ItemEquippedEvent(
@@ -560,7 +571,7 @@ class InventoryService:
                     member_name=member_name,
                     item_id=armour_id,
                     item_name=armour_def.name,
-                    slot=f"armour_{slot}",
+                    slot=_ARMOUR_SLOT_LABELS[slot],
                     category="armour",
                 )
             )
@@ -576,20 +587,22 @@ class InventoryService:
         except KeyError:
             return member_id
 
-    def _ensure_member_equipment(self, state: GameState, member_id: str) -> MemberEquipment:
-        if member_id not in state.equipment:
-            state.equipment[member_id] = MemberEquipment()
-        return state.equipment[member_id]
+    def _slot_weapon_def(self, equipment: MemberEquipment, slot_index: int, weapon_id: str) -> WeaponDef:
+        cached = equipment.weapon_slot_defs[slot_index]
+        if cached is not None and cached.id == weapon_id:
+            return cached
+        weapon_def = self._weapons_repo.get(weapon_id)
+        equipment.weapon_slot_defs[slot_index] = weapon_def
+        return weapon_def
 
     def _reset_member_equipment(self, state: GameState, member_id: str) -> MemberEquipment:
-        state.equipment[member_id] = MemberEquipment()
-        return state.equipment[member_id]
+        equipment = state.equipment[member_id] = MemberEquipment()
+        return equipment
 
     def _build_member_base_stats(self, state: GameState, member_id: str) -> tuple[BaseStats, int, int]:
-        equipment = self._ensure_member_equipment(state, member_id)
+        equipment = state.equipment[member_id]
         weapon_ids = [weapon_id for weapon_id in equipment.weapon_slots if weapon_id]
-        armour_ids = [equipment.armour_slots.get(slot) for slot in ARMOUR_SLOTS]
-        armour_ids = [armour_id for armour_id in armour_ids if armour_id]
+        armour_ids = equipment.equipped_armour_ids()
         if state.player and member_id == state.player.id:
             base_stats = state.player.base_stats
             attack = self._calculate_attack(weapon_ids, base_stats.attack)
@@ -653,10 +666,9 @@ class InventoryService:
     def _refresh_player_base_stats(self, state: GameState) -> None:
         if not state.player:
             return
-        equipment = self._ensure_member_equipment(state, state.player.id)
+        equipment = state.equipment[state.player.id]
         weapon_ids = [weapon_id for weapon_id in equipment.weapon_slots if weapon_id]
-        armour_ids = [equipment.armour_slots.get(slot) for slot in ARMOUR_SLOTS]
-        armour_ids = [armour_id for armour_id in armour_ids if armour_id]
+        armour_ids = equipment.equipped_armour_ids()
         attack = self._calculate_attack(weapon_ids, state.player.base_stats.attack)
         defense = self._calculate_defense(armour_ids, state.player.base_stats.defense)
         state.player.base_stats = BaseStats(
@@ -679,32 +691,39 @@ class InventoryService:
         slot_index: int | None,
         auto_slot: bool,
         equipment: MemberEquipment,
-    ) -> List[int] | None:
+    ) -> tuple[int, ...] | None:
         if weapon_def.slot_cost == 2:
-            return [0, 1]
+            return _SLOTS_BOTH
         if slot_index is None:
             if auto_slot:
                 if equipment.weapon_slots[0] is None:
-                    return [0]
+                    return _SLOT_0
                 if equipment.weapon_slots[1] is None:
-                    return [1]
-                return [0]
-            return None
-        if slot_index not in (0, 1):
+                    return _SLOT_1
+                return _SLOT_0
             return None
-        return [slot_index]
-
-    def _slots_to_clear(self, equipment: MemberEquipment, target_slots: Sequence[int]) -> set[int]:
-        slots = set(target_slots)
-        for idx in list(slots):
-            occupant = equipment.weapon_slots[idx]
-            if not occupant:
-                continue
-            try:
-                occupant_def = self._weapons_repo.get(occupant)
-            except KeyError:
-                continue
-            if occupant_def.slot_cost == 2:
-                slots.update({0, 1})
-        return slots
+        if slot_index == 0:
+            return _SLOT_0
+        if slot_index == 1:
+            return _SLOT_1
+        return None
+
+    def _slots_to_clear(self, equipment: MemberEquipment, target_slots: Sequence[int]) -> tuple[int, ...]:
+        mask = 0
+        for idx in target_slots:
+            mask |= 1 << idx
+        # Once both slots are targeted, occupants cannot widen the set, so skip the lookups.
+        if mask != _BOTH_WEAPON_SLOTS_MASK:
+            for idx in target_slots:
+                occupant = equipment.weapon_slots[idx]
+                if not occupant:
+                    continue
+                try:
+                    occupant_def = self._slot_weapon_def(equipment, idx, occupant)
+                except KeyError:
+                    continue
+                if occupant_def.slot_cost == 2:
+                    mask = _BOTH_WEAPON_SLOTS_MASK
+                    break
+        return _WEAPON_SLOTS_BY_MASK[mask]
 
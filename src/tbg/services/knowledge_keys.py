@@ -1,8 +1,14 @@
 """Helpers for resolving knowledge keys."""
 from __future__ import annotations
 
+from weakref import WeakKeyDictionary
+
 from tbg.domain.defs import EnemyDef
 
+# Enemy definitions are static once a repository has loaded, so the sorted keys are computed
+# once per repository instance; weak keys let discarded repositories drop their entry.
+_KNOWLEDGE_KEYS_BY_REPO: WeakKeyDictionary[object, tuple[str, ...]] = WeakKeyDictionary()
+
 
 def resolve_enemy_knowledge_key(enemy_def: EnemyDef) -> str:
     """Return the stable knowledge key for an enemy definition."""
@@ -10,5 +16,8 @@ def resolve_enemy_knowledge_key(enemy_def: EnemyDef) -> str:
 
 
 def list_all_knowledge_keys(enemies_repo) -> list[str]:
-    keys = {resolve_enemy_knowledge_key(enemy) for enemy in enemies_repo.all()}
-    return sorted(keys)
+    keys = _KNOWLEDGE_KEYS_BY_REPO.get(enemies_repo)
+    if keys is None:
+        keys = tuple(sorted({resolve_enemy_knowledge_key(enemy) for enemy in enemies_repo.all()}))
+        _KNOWLEDGE_KEYS_BY_REPO[enemies_repo] = keys
+    return list(keys)
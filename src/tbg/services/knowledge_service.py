@@ -1,53 +1,80 @@
 """Knowledge progression and policy service."""
 from __future__ import annotations
 
-from typing import Dict
+from bisect import bisect_right
+from typing import Dict, Tuple
 
 from tbg.data.repositories import KnowledgeRulesRepository
 from tbg.domain.knowledge_models import EnemyHpVisibilityMode, KnowledgeTier
 from tbg.domain.state import GameState
 
 
+# Indexed by how many tier thresholds a kill count has reached.
+_TIERS_BY_THRESHOLDS_MET: Tuple[KnowledgeTier, ...] = (
+    KnowledgeTier.TIER_0,
+    KnowledgeTier.TIER_1,
+    KnowledgeTier.TIER_2,
+    KnowledgeTier.TIER_3,
+)
+
+
 class KnowledgeService:
     """Deterministic knowledge progression service."""
 
     def __init__(self, rules_repo: KnowledgeRulesRepository) -> None:
         self._rules_repo = rules_repo
+        # Resolved lazily from the rules repo; static at runtime unless invalidate_rules() is called.
+        self._thresholds: Tuple[int, int, int] | None = None
+        self._hp_visibility_by_tier: Dict[KnowledgeTier, EnemyHpVisibilityMode] | None = None
+
+    def invalidate_rules(self) -> None:
+        """Drop cached rule values so the next query re-reads the rules repository."""
+        self._thresholds = None
+        self._hp_visibility_by_tier = None
+
+    def _load_rules(self) -> None:
+        rules = self._rules_repo.get_rules()
+        thresholds = rules.thresholds
+        # Tiers are checked from the top, so a tier is reached once any threshold at or above it is met.
+        # Suffix minimums keep that meaning while giving bisect an ascending sequence.
+        tier3_kills = thresholds.tier3_kills
+        tier2_kills = min(thresholds.tier2_kills, tier3_kills)
+        tier1_kills = min(thresholds.tier1_kills, tier2_kills)
+        self._thresholds = (tier1_kills, tier2_kills, tier3_kills)
+        self._hp_visibility_by_tier = rules.hp_visibility_by_tier
 
     def get_kill_count(self, state: GameState, key: str) -> int:
-        count = state.knowledge_kill_counts.get(key, 0)
-        return count if isinstance(count, int) and count >= 0 else 0
+        # Counts are non-negative ints by construction (validated at save load, written only here).
+        return state.knowledge_kill_counts.get(key, 0)
 
     def get_tier_for_key(self, state: GameState, key: str) -> KnowledgeTier:
-        kills = self.get_kill_count(state, key)
-        thresholds = self._rules_repo.get_rules().thresholds
-        if kills >= thresholds.tier3_kills:
-            return KnowledgeTier.TIER_3
-        if kills >= thresholds.tier2_kills:
-            return KnowledgeTier.TIER_2
-        if kills >= thresholds.tier1_kills:
-            return KnowledgeTier.TIER_1
-        return KnowledgeTier.TIER_0
+        thresholds = self._thresholds
+        if thresholds is None:
+            self._load_rules()
+            thresholds = self._thresholds
+            assert thresholds is not None
+        return _TIERS_BY_THRESHOLDS_MET[bisect_right(thresholds, state.knowledge_kill_counts.get(key, 0))]
 
     def get_hp_visibility_mode_for_tier(self, tier: KnowledgeTier) -> EnemyHpVisibilityMode:
-        return self._rules_repo.get_rules().hp_visibility_by_tier[tier]
+        if self._hp_visibility_by_tier is None:
+            self._load_rules()
+            assert self._hp_visibility_by_tier is not None
+        return self._hp_visibility_by_tier[tier]
 
     def get_hp_visibility_mode_for_key(self, state: GameState, key: str) -> EnemyHpVisibilityMode:
         tier = self.get_tier_for_key(state, key)
         return self.get_hp_visibility_mode_for_tier(tier)
 
     def record_kills(self, state: GameState, kills_by_key: Dict[str, int]) -> None:
-        if not isinstance(kills_by_key, dict):
-            return
+        """Add kill increments tallied by the battle service; non-positive increments are ignored.
+
+        Stored counts are validated at save load and only written through this service, so no
+        per-entry type checks are needed here.
+        """
+        counts = state.knowledge_kill_counts
         for key, increment in kills_by_key.items():
-            if not isinstance(key, str):
-                continue
-            if not isinstance(increment, int) or increment <= 0:
-                continue
-            current = state.knowledge_kill_counts.get(key, 0)
-            if not isinstance(current, int) or current < 0:
-                current = 0
-            state.knowledge_kill_counts[key] = current + increment
+            if increment > 0:
+                counts[key] = counts.get(key, 0) + increment
 
     def set_kill_count(self, state: GameState, key: str, value: int) -> int:
         if not isinstance(key, str):
@@ -66,9 +93,9 @@ class KnowledgeService:
         normalized_key = key.strip()
         if not normalized_key:
             return 0
+        current = state.knowledge_kill_counts.get(normalized_key, 0)
         if not isinstance(delta, int):
-            return self.get_kill_count(state, normalized_key)
-        current = self.get_kill_count(state, normalized_key)
+            return current
         total = max(0, current + delta)
         state.knowledge_kill_counts[normalized_key] = total
         return total
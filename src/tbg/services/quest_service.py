@@ -1,8 +1,9 @@
 """Quest system orchestration and progress tracking."""
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
-from typing import Dict, List, Sequence
+from typing import AbstractSet, Dict, List, Sequence
 
 from tbg.data.repositories import (
     ItemsRepository,
@@ -11,6 +12,7 @@ from tbg.data.repositories import (
     QuestsRepository,
 )
 from tbg.domain.defs import QuestDef, QuestObjectiveDef, QuestRewardItemDef
+from tbg.domain.leveling import exp_for_levels, levels_gained
 from tbg.domain.quest_state import QuestObjectiveProgress, QuestProgress
 from tbg.domain.state import GameState
 
@@ -86,13 +88,12 @@ class QuestService:
         party_members_repo: PartyMembersRepository,
     ) -> None:
         self._quests_repo = quests_repo
-        self._items_repo = items_repo
         self._party_members_repo = party_members_repo
 
     def accept_quest(self, state: GameState, quest_id: str) -> QuestUpdate | None:
-        quest = self._quests_repo.get(quest_id)
-        if quest_id in state.quests_turned_in or quest_id in state.quests_active:
+        if quest_id in state.quests_active or quest_id in state.quests_turned_in:
             return None
+        quest = self._quests_repo.get(quest_id)
         prereq_ready, _, _ = self._evaluate_prereqs(state, quest)
         if not prereq_ready:
             raise ValueError(f"Quest '{quest_id}' prerequisites are not met.")
@@ -101,8 +102,7 @@ class QuestService:
             objectives=[QuestObjectiveProgress() for _ in quest.objectives],
         )
         state.quests_active[quest_id] = progress
-        for flag_id in quest.accept_flags:
-            state.flags[flag_id] = True
+        state.flags.update(quest.accept_flag_updates)
         self._refresh_collect_objectives(state, quest, progress)
         self._refresh_visit_objectives(state, quest, progress, state.current_location_id)
         completed = self._mark_completed_if_ready(state, quest, progress)
@@ -116,41 +116,67 @@ class QuestService:
     def record_battle_victory(self, state: GameState, defeated_tags: Sequence[Sequence[str]]) -> None:
         if not state.quests_active:
             return
-        for quest_id, progress in list(state.quests_active.items()):
-            quest = self._quests_repo.get(quest_id)
+        # Only quests with unfinished kill objectives can change; skip the tag count when none exist.
+        quests = self._quests_repo.as_map()
+        kill_quests: List[tuple[QuestDef, QuestProgress]] = []
+        for quest_id, progress in state.quests_active.items():
+            quest = quests[quest_id]
+            if quest.kill_objectives_by_tag and progress.remaining:
+                kill_quests.append((quest, progress))
+        if not kill_quests:
+            return
+        # Each defeated enemy counts once per distinct tag it carries.
+        tag_counts: Counter[str] = Counter()
+        for tags in defeated_tags:
+            tag_counts.update(set(tags))
+        for quest, progress in kill_quests:
             updated = False
-            for index, objective in enumerate(quest.objectives):
-                if objective.objective_type != "kill_tag":
-                    continue
-                count = sum(1 for tags in defeated_tags if objective.tag in tags)
+            for tag, objectives in quest.kill_objectives_by_tag.items():
+                count = tag_counts.get(tag, 0)
                 if count <= 0:
                     continue
-                updated |= self._increment_progress(progress, index, objective, count)
+                for index, objective in objectives:
+                    updated |= self._increment_progress(progress, index, objective, count)
             if updated:
                 self._mark_completed_if_ready(state, quest, progress)
 
     def record_area_visit(self, state: GameState, area_id: str) -> None:
         if not state.quests_active:
             return
-        for quest_id, progress in list(state.quests_active.items()):
-            quest = self._quests_repo.get(quest_id)
+        quests = self._quests_repo.as_map()
+        for quest_id, progress in state.quests_active.items():
+            quest = quests[quest_id]
             if self._refresh_visit_objectives(state, quest, progress, area_id):
                 self._mark_completed_if_ready(state, quest, progress)
 
     def refresh_collect_objectives(self, state: GameState) -> None:
         if not state.quests_active:
             return
-        for quest_id, progress in list(state.quests_active.items()):
-            quest = self._quests_repo.get(quest_id)
+        quests = self._quests_repo.as_map()
+        for quest_id, progress in state.quests_active.items():
+            quest = quests[quest_id]
+            if self._refresh_collect_objectives(state, quest, progress):
+                self._mark_completed_if_ready(state, quest, progress)
+
+    def record_item_delta(self, state: GameState, item_id: str) -> None:
+        """Refresh collect objectives after a single item's inventory count changes."""
+        if not state.quests_active:
+            return
+        quests = self._quests_repo.as_map()
+        for quest_id, progress in state.quests_active.items():
+            quest = quests[quest_id]
+            if item_id not in quest.collect_item_ids:
+                continue
             if self._refresh_collect_objectives(state, quest, progress):
                 self._mark_completed_if_ready(state, quest, progress)
 
     def turn_in_quest(self, state: GameState, quest_id: str) -> QuestUpdate | None:
         if quest_id in state.quests_turned_in:
             return None
-        quest = self._quests_repo.get(quest_id)
+        # Cheap dict probe first; the completed-list scan and repo lookup only run for active quests.
         if quest_id not in state.quests_active or quest_id not in state.quests_completed:
             raise ValueError(f"Quest '{quest_id}' is not ready to turn in.")
+        quest = self._quests_repo.get(quest_id)
         self._consume_collect_objectives(state, quest)
         self._apply_rewards(state, quest)
         state.quests_turned_in.append(quest_id)
@@ -162,16 +188,20 @@ class QuestService:
         )
 
     def build_journal_view(self, state: GameState) -> QuestJournalView:
-        active_views = [
-            self._build_status_view(state, quest_id) for quest_id in sorted(state.quests_active.keys())
-        ]
-        completed_views = [
-            self._build_status_view(state, quest_id)
-            for quest_id in sorted(state.quests_completed)
-            if quest_id in state.quests_active
-        ]
-        turned_in_names = [self._quests_repo.get(qid).name for qid in sorted(state.quests_turned_in)]
-        turn_ins = self._build_turn_in_views(state)
+        # The state keeps ordered lists for saves; membership tests below use set snapshots instead.
+        completed_ids = set(state.quests_completed)
+        turned_in_ids = set(state.quests_turned_in)
+        quests = self._quests_repo.as_map()
+        quests_active = state.quests_active
+        active_views: List[QuestStatusView] = []
+        completed_views: List[QuestStatusView] = []
+        for quest_id in sorted(quests_active):
+            view = self._build_status_view(quests[quest_id], quests_active[quest_id], completed_ids)
+            active_views.append(view)
+            if view.is_completed:
+                completed_views.append(view)
+        turned_in_names = [quests[qid].name for qid in sorted(state.quests_turned_in)]
+        turn_ins = self._build_turn_in_views(state, completed_ids, turned_in_ids)
         return QuestJournalView(
             active=active_views,
             completed=completed_views,
@@ -181,7 +211,8 @@ class QuestService:
 
     def build_debug_view(self, state: GameState) -> QuestDebugView:
         prereqs: List[QuestPrereqView] = []
-        for quest in self._quests_repo.all():
+        all_quests = self._quests_repo.all()
+        for quest in all_quests:
             ready, missing, blocked = self._evaluate_prereqs(state, quest)
             prereqs.append(
                 QuestPrereqView(
@@ -193,7 +224,7 @@ class QuestService:
                 )
             )
         return QuestDebugView(
-            total_definitions=len(self._quests_repo.all()),
+            total_definitions=len(all_quests),
             active_ids=sorted(state.quests_active.keys()),
             completed_ids=sorted(state.quests_completed),
             turned_in_ids=sorted(state.quests_turned_in),
@@ -201,14 +232,17 @@ class QuestService:
         )
 
     def get_definition_summary(self) -> str:
-        return f"Quests loaded: {len(self._quests_repo.all())}"
+        return f"Quests loaded: {len(self._quests_repo.as_map())}"
 
-    def _build_turn_in_views(self, state: GameState) -> List[QuestTurnInView]:
+    def _build_turn_in_views(
+        self, state: GameState, completed_ids: AbstractSet[str], turned_in_ids: AbstractSet[str]
+    ) -> List[QuestTurnInView]:
         options: List[QuestTurnInView] = []
+        quests = self._quests_repo.as_map()
         for quest_id in state.quests_active.keys():
-            if quest_id not in state.quests_completed or quest_id in state.quests_turned_in:
+            if quest_id not in completed_ids or quest_id in turned_in_ids:
                 continue
-            quest = self._quests_repo.get(quest_id)
+            quest = quests[quest_id]
             if not quest.turn_in:
                 continue
             options.append(
@@ -221,14 +255,19 @@ class QuestService:
             )
         return options
 
-    def _build_status_view(self, state: GameState, quest_id: str) -> QuestStatusView:
-        quest = self._quests_repo.get(quest_id)
-        progress = state.quests_active.get(quest_id)
+    def _build_status_view(
+        self, quest: QuestDef, progress: QuestProgress | None, completed_ids: AbstractSet[str]
+    ) -> QuestStatusView:
+        # Loaded saves may carry fewer progress entries than objectives; missing ones read as untouched.
+        entries = progress.objectives if progress else ()
+        entry_count = len(entries)
         objectives: List[QuestObjectiveView] = []
         for index, objective in enumerate(quest.objectives):
-            progress_item = progress.objectives[index] if progress and index < len(progress.objectives) else None
-            current = progress_item.current if progress_item else 0
-            completed = progress_item.completed if progress_item else False
+            if index < entry_count:
+                entry = entries[index]
+                current, completed = entry.current, entry.completed
+            else:
+                current, completed = 0, False
             objectives.append(
                 QuestObjectiveView(
                     label=objective.label,
@@ -237,7 +276,7 @@ class QuestService:
                     completed=completed,
                 )
             )
-        is_completed = quest_id in state.quests_completed
+        is_completed = quest.quest_id in completed_ids
         return QuestStatusView(
             quest_id=quest.quest_id,
             name=quest.name,
@@ -260,21 +299,23 @@ class QuestService:
         entry.current += amount
         if entry.current >= objective.quantity:
             entry.completed = True
+            progress.remaining -= 1
         return True
 
     def _refresh_collect_objectives(self, state: GameState, quest: QuestDef, progress: QuestProgress) -> bool:
         updated = False
-        for index, objective in enumerate(quest.objectives):
-            if objective.objective_type != "collect_item" or not objective.item_id:
-                continue
-            current_count = state.inventory.items.get(objective.item_id, 0)
-            if index >= len(progress.objectives):
+        items = state.inventory.items
+        entries = progress.objectives
+        for index, objective in quest.collect_objectives:
+            if index >= len(entries):
                 continue
-            entry = progress.objectives[index]
+            current_count = items.get(objective.item_id, 0)
+            entry = entries[index]
             if current_count > entry.current:
                 entry.current = current_count
             if entry.current >= objective.quantity and not entry.completed:
                 entry.completed = True
+                progress.remaining -= 1
             updated = True
         return updated
 
@@ -282,27 +323,23 @@ class QuestService:
         self, state: GameState, quest: QuestDef, progress: QuestProgress, area_id: str
     ) -> bool:
         updated = False
-        for index, objective in enumerate(quest.objectives):
-            if objective.objective_type != "visit_area" or not objective.area_id:
-                continue
-            if objective.area_id != area_id:
-                continue
+        for index, _ in quest.visit_objectives_by_area.get(area_id, ()):
             if index >= len(progress.objectives):
                 continue
             entry = progress.objectives[index]
             if not entry.completed:
                 entry.current = max(entry.current, 1)
                 entry.completed = True
+                progress.remaining -= 1
                 updated = True
         return updated
 
     def _mark_completed_if_ready(self, state: GameState, quest: QuestDef, progress: QuestProgress) -> bool:
         if quest.quest_id in state.quests_completed:
             return False
-        if all(entry.completed for entry in progress.objectives):
+        if progress.remaining == 0:
             state.quests_completed.append(quest.quest_id)
-            for flag_id in quest.complete_flags:
-                state.flags[flag_id] = True
+            state.flags.update(quest.complete_flag_updates)
             return True
         return False
 
@@ -312,32 +349,34 @@ class QuestService:
         self._grant_party_exp(state, reward.party_exp)
         for item in reward.items:
             self._add_item(state, item)
-        for flag_id, value in reward.set_flags:
-            state.flags[flag_id] = value
+        state.flags.update(reward.set_flags)
 
     def _consume_collect_objectives(self, state: GameState, quest: QuestDef) -> None:
-        for objective in quest.objectives:
-            if objective.objective_type != "collect_item" or not objective.item_id:
-                continue
-            current = state.inventory.items.get(objective.item_id, 0)
+        items = state.inventory.items
+        for _, objective in quest.collect_objectives:
+            current = items.get(objective.item_id, 0)
             if current < objective.quantity:
                 raise ValueError(f"Quest '{quest.quest_id}' is missing required items.")
             remaining = current - objective.quantity
             if remaining > 0:
-                state.inventory.items[objective.item_id] = remaining
+                items[objective.item_id] = remaining
             else:
-                state.inventory.items.pop(objective.item_id, None)
+                items.pop(objective.item_id, None)
 
     def _grant_party_exp(self, state: GameState, amount: int) -> None:
         if amount <= 0:
             return
-        member_ids = self._active_party_ids(state)
-        if not member_ids:
+        # The player (if any) comes first and takes the remainder; no id list is built.
+        player_id = state.player.id if state.player else None
+        party_members = state.party_members
+        member_count = len(party_members) + (1 if player_id is not None else 0)
+        if not member_count:
             return
-        base = amount // len(member_ids)
-        remainder = amount % len(member_ids)
-        for member_id in member_ids:
-            share = base + (remainder if state.player and member_id == state.player.id else 0)
+        base, remainder = divmod(amount, member_count)
+        if player_id is not None and base + remainder > 0:
+            self._apply_member_exp(state, player_id, base + remainder)
+        for member_id in party_members:
+            share = base + (remainder if member_id == player_id else 0)
             if share <= 0:
                 continue
             self._apply_member_exp(state, member_id, share)
@@ -345,11 +384,11 @@ class QuestService:
     def _apply_member_exp(self, state: GameState, member_id: str, amount: int) -> None:
         level = state.member_levels.get(member_id, 1)
         exp = state.member_exp.get(member_id, 0) + amount
-        threshold = self._xp_to_next_level(level)
-        while exp >= threshold:
-            exp -= threshold
-            level += 1
-            threshold = self._xp_to_next_level(level)
+        gained = levels_gained(level, exp)
+        if gained:
+            exp -= exp_for_levels(level, gained)
+            level += gained
+            # Restoring is idempotent, so one call covers any number of level-ups.
             self._restore_member_resources(state, member_id)
         state.member_levels[member_id] = level
         state.member_exp[member_id] = exp
@@ -362,29 +401,13 @@ class QuestService:
     def _add_item(self, state: GameState, reward_item: QuestRewardItemDef) -> None:
         if reward_item.quantity <= 0:
             return
-        self._items_repo.get(reward_item.item_id)
-        state.inventory.items[reward_item.item_id] = (
-            state.inventory.items.get(reward_item.item_id, 0) + reward_item.quantity
-        )
+        # Reward item ids are validated against the items repository when quests load.
+        items = state.inventory.items
+        items[reward_item.item_id] = items.get(reward_item.item_id, 0) + reward_item.quantity
 
     def _evaluate_prereqs(self, state: GameState, quest: QuestDef) -> tuple[bool, List[str], List[str]]:
-        missing: List[str] = []
-        blocked: List[str] = []
-        for flag_id in quest.prereqs.required_flags:
-            if not state.flags.get(flag_id, False):
-                missing.append(flag_id)
-        for flag_id in quest.prereqs.forbidden_flags:
-            if state.flags.get(flag_id, False):
-                blocked.append(flag_id)
+        flags = state.flags
+        prereqs = quest.prereqs
+        missing = [flag_id for flag_id in prereqs.required_flags if not flags.get(flag_id, False)]
+        blocked = [flag_id for flag_id in prereqs.forbidden_flags if flags.get(flag_id, False)]
         return not missing and not blocked, missing, blocked
-
-    def _active_party_ids(self, state: GameState) -> List[str]:
-        ids: List[str] = []
-        if state.player:
-            ids.append(state.player.id)
-        ids.extend(state.party_members)
-        return ids
-
-    @staticmethod
-    def _xp_to_next_level(level: int) -> int:
-        return 10 + (level - 1) * 5
@@ -1,7 +1,7 @@
 """Serialization helpers for manual save/load."""
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import time
 from typing import Any, Dict, List, Mapping, Sequence
 
 from tbg.core.rng import RNG, RNGStatePayload
@@ -17,8 +17,9 @@ from tbg.data.repositories import (
     WeaponsRepository,
 )
 from tbg.domain.attribute_scaling import apply_attribute_scaling
+from tbg.domain.defs import ArmourDef, WeaponDef
 from tbg.domain.entities import Attributes, BaseStats, Player, Stats
-from tbg.domain.inventory import ARMOUR_SLOTS, MemberEquipment, PartyInventory
+from tbg.domain.inventory import ARMOUR_SLOTS, EquipmentMap, MemberEquipment, PartyInventory
 from tbg.domain.quest_state import QuestObjectiveProgress, QuestProgress
 from tbg.domain.state import GameState
 from tbg.services.errors import SaveLoadError
@@ -26,7 +27,32 @@ DEFAULT_STARTING_LOCATION_ID = "threshold_inn"
 
 
 SavePayload = Dict[str, Any]
-_VALID_MODES: tuple[GameMode, ...] = ("main_menu", "story", "camp_menu", "battle")
+# ISO 8601 in UTC at whole-second precision; only shown in the slot list, so no aware datetime is needed.
+_SAVED_AT_FORMAT = "%Y-%m-%dT%H:%M:%S+00:00"
+_VALID_MODES: frozenset[GameMode] = frozenset(("main_menu", "story", "camp_menu", "battle"))
+# Field layouts of the fixed-shape save sections, so they are validated in one keyed pass.
+_ATTRIBUTE_KEYS: tuple[str, ...] = ("STR", "DEX", "INT", "VIT", "BOND")
+_ATTRIBUTE_KEY_SET = frozenset(_ATTRIBUTE_KEYS)
+_PLAYER_STAT_KEYS: tuple[str, ...] = ("max_hp", "hp", "max_mp", "mp", "attack", "defense", "speed")
+
+
+def _has_str_keys_and_values_of(mapping: Mapping[str, Any], value_type: type) -> bool:
+    """Cheap gate for well-formed flat sections; the per-entry loops only run to report errors."""
+    return all(type(key) is str for key in mapping) and all(
+        type(entry) is value_type for entry in mapping.values()
+    )
+
+
+def _as_is(value: Any) -> Any:
+    return value
+
+
+def _is_count_map(mapping: Mapping[str, Any]) -> bool:
+    return _has_str_keys_and_values_of(mapping, int) and all(entry >= 0 for entry in mapping.values())
+
+
+def _is_str_list(value: Any) -> bool:
+    return type(value) is list and all(type(entry) is str for entry in value)
 
 
 class SaveService:
@@ -55,13 +81,17 @@ class SaveService:
         self._locations_repo = locations_repo
         self._quests_repo = quests_repo
 
-    def serialize(self, state: GameState) -> SavePayload:
-        """Return a JSON-serializable payload for disk persistence."""
+    def serialize(self, state: GameState, *, copy_containers: bool = True) -> SavePayload:
+        """Return a JSON-serializable payload for disk persistence.
+
+        Pass ``copy_containers=False`` when the payload is encoded right away; flat sections then
+        reference the live state containers instead of copying them.
+        """
         payload: SavePayload = {
             "save_version": self.SAVE_VERSION,
             "metadata": self._build_metadata(state),
             "rng": state.rng.export_state(),
-            "state": self._serialize_state(state),
+            "state": self._serialize_state(state, copy_containers=copy_containers),
         }
         return payload
 
@@ -149,15 +179,11 @@ class SaveService:
                 checkpoint_thread, "state.story_checkpoint_thread_id"
             )
         state.current_location_id = current_location_id
-        state.visited_locations = self._coerce_visited_locations(
-            state_payload.get("visited_locations"), current_location_id
-        )
-        state.location_entry_seen = self._coerce_location_entry_flags(
-            state_payload.get("location_entry_seen"), current_location_id
-        )
-        state.location_visits = self._coerce_location_visits(
-            state_payload.get("location_visits"), current_location_id
-        )
+        (
+            state.visited_locations,
+            state.location_entry_seen,
+            state.location_visits,
+        ) = self._coerce_location_progress(state_payload, current_location_id)
         state.shop_stock_remaining = self._coerce_shop_stock_remaining(
             state_payload.get("shop_stock_remaining")
         )
@@ -195,20 +221,15 @@ class SaveService:
             "mode": state.mode,
             "gold": state.gold,
             "seed": state.seed,
-            "saved_at": datetime.now(timezone.utc).isoformat(),
+            "saved_at": time.strftime(_SAVED_AT_FORMAT, time.gmtime()),
         }
 
-    def _serialize_state(self, state: GameState) -> Dict[str, Any]:
-        equipment_payload = {
-            member_id: {
-                "weapon_slots": list(member_equipment.weapon_slots),
-                "armour_slots": dict(member_equipment.armour_slots),
-            }
-            for member_id, member_equipment in state.equipment.items()
-        }
-        pending_narration = [
-            {"node_id": node_id, "text": text} for node_id, text in state.pending_narration
-        ]
+    def _serialize_state(self, state: GameState, *, copy_containers: bool) -> Dict[str, Any]:
+        # Flat sections are copied unless the caller encodes the payload before state can change.
+        own_dict = dict if copy_containers else _as_is
+        own_list = list if copy_containers else _as_is
+        serialize_attributes = self._serialize_attributes
+        player = state.player
         return {
             "seed": state.seed,
             "mode": state.mode,
@@ -219,59 +240,68 @@ class SaveService:
             "player_attribute_points_debug_bonus": state.player_attribute_points_debug_bonus,
             "gold": state.gold,
             "exp": state.exp,
-            "flags": dict(state.flags),
-            "knowledge_kill_counts": dict(state.knowledge_kill_counts),
-            "party_members": list(state.party_members),
-            "player_attributes": self._serialize_attributes(state.player.attributes) if state.player else None,
+            "flags": own_dict(state.flags),
+            "knowledge_kill_counts": own_dict(state.knowledge_kill_counts),
+            "party_members": own_list(state.party_members),
+            "player_attributes": serialize_attributes(player.attributes) if player else None,
             "party_member_attributes": {
-                member_id: self._serialize_attributes(attributes)
+                member_id: serialize_attributes(attributes)
                 for member_id, attributes in state.party_member_attributes.items()
             },
             "pending_story_node_id": state.pending_story_node_id,
-            "pending_narration": pending_narration,
+            "pending_narration": [
+                {"node_id": node_id, "text": text} for node_id, text in state.pending_narration
+            ],
             "inventory": {
-                "weapons": dict(state.inventory.weapons),
-                "armour": dict(state.inventory.armour),
-                "items": dict(state.inventory.items),
+                "weapons": own_dict(state.inventory.weapons),
+                "armour": own_dict(state.inventory.armour),
+                "items": own_dict(state.inventory.items),
             },
-            "equipment": equipment_payload,
-            "member_levels": dict(state.member_levels),
-            "member_exp": dict(state.member_exp),
-            "owned_summons": dict(state.owned_summons),
+            "equipment": {
+                member_id: {
+                    "weapon_slots": list(member_equipment.weapon_slots),
+                    "armour_slots": dict(member_equipment.armour_slots),
+                }
+                for member_id, member_equipment in state.equipment.items()
+            },
+            "member_levels": own_dict(state.member_levels),
+            "member_exp": own_dict(state.member_exp),
+            "owned_summons": own_dict(state.owned_summons),
             "party_member_summon_loadouts": {
                 member_id: list(loadout)
                 for member_id, loadout in state.party_member_summon_loadouts.items()
             },
             "camp_message": state.camp_message,
-            "player": self._serialize_player(state.player) if state.player else None,
-            "visited_locations": list(state.visited_locations),
-            "location_entry_seen": dict(state.location_entry_seen),
-            "location_visits": dict(state.location_visits),
-            "shop_stock_remaining": dict(state.shop_stock_remaining),
-            "shop_stock_visit_index": dict(state.shop_stock_visit_index),
+            "player": self._serialize_player(player) if player else None,
+            "visited_locations": own_list(state.visited_locations),
+            "location_entry_seen": own_dict(state.location_entry_seen),
+            "location_visits": own_dict(state.location_visits),
+            "shop_stock_remaining": own_dict(state.shop_stock_remaining),
+            "shop_stock_visit_index": own_dict(state.shop_stock_visit_index),
             "story_checkpoint_node_id": state.story_checkpoint_node_id,
             "story_checkpoint_location_id": state.story_checkpoint_location_id,
             "story_checkpoint_thread_id": state.story_checkpoint_thread_id,
             "quests_active": self._serialize_quests_active(state),
-            "quests_completed": list(state.quests_completed),
-            "quests_turned_in": list(state.quests_turned_in),
+            "quests_completed": own_list(state.quests_completed),
+            "quests_turned_in": own_list(state.quests_turned_in),
         }
 
     @staticmethod
     def _serialize_player(player: Player) -> Dict[str, Any]:
+        stats = player.stats
         return {
             "id": player.id,
             "name": player.name,
             "class_id": player.class_id,
             "equipped_summons": list(player.equipped_summons),
             "stats": {
-                "max_hp": player.stats.max_hp,
-                "hp": player.stats.hp,
-                "max_mp": player.stats.max_mp,
-                "mp": player.stats.mp,
-                "attack": player.stats.attack,
-                "defense": player.stats.defense,
-                "speed": player.stats.speed,
+                "max_hp": stats.max_hp,
+                "hp": stats.hp,
+                "max_mp": stats.max_mp,
+                "mp": stats.mp,
+                "attack": stats.attack,
+                "defense": stats.defense,
+                "speed": stats.speed,
             },
         }
 
@@ -294,18 +324,24 @@ class SaveService:
         return {"version": version, "state": state_values, "gauss": gauss}
 
     def _require_mode(self, value: Any) -> GameMode:
-        if value not in _VALID_MODES:
+        # The type check comes first so unhashable payload values fail validation instead of hashing.
+        if type(value) is not str or value not in _VALID_MODES:
             raise SaveLoadError(f"Invalid mode value: {value}")
         return value
 
     @staticmethod
     def _require_str(value: Any, context: str) -> str:
+        # Exact type checks first: decoded JSON only ever yields the builtin types.
+        if type(value) is str:
+            return value
         if not isinstance(value, str):
             raise SaveLoadError(f"{context} must be a string.")
         return value
 
     @staticmethod
     def _require_int(value: Any, context: str) -> int:
+        if type(value) is int:
+            return value
         if not isinstance(value, int):
             raise SaveLoadError(f"{context} must be an integer.")
         return value
@@ -332,6 +368,8 @@ class SaveService:
         if value is None:
             return self._default_owned_summons(player_payload)
         mapping = self._require_dict(value, "state.owned_summons")
+        if _is_count_map(mapping):
+            return dict(mapping)
         result: Dict[str, int] = {}
         for summon_id, count in mapping.items():
             summon_key = self._require_str(summon_id, "state.owned_summons key")
@@ -356,6 +394,9 @@ class SaveService:
             )
         for member_id, entries in mapping.items():
             member_key = self._require_str(member_id, "state.party_member_summon_loadouts key")
+            if _is_str_list(entries):
+                result[member_key] = list(entries)
+                continue
             if not isinstance(entries, list):
                 raise SaveLoadError(
                     f"state.party_member_summon_loadouts[{member_key}] must be a list."
@@ -398,6 +439,8 @@ class SaveService:
 
     def _coerce_bool_dict(self, value: Any, context: str) -> Dict[str, bool]:
         mapping = self._require_dict(value, context)
+        if _has_str_keys_and_values_of(mapping, bool):
+            return dict(mapping)
         result: Dict[str, bool] = {}
         for key, entry in mapping.items():
             if not isinstance(key, str):
@@ -409,6 +452,8 @@ class SaveService:
 
     def _coerce_int_dict(self, value: Any, context: str) -> Dict[str, int]:
         mapping = self._require_dict(value, context)
+        if _has_str_keys_and_values_of(mapping, int):
+            return dict(mapping)
         result: Dict[str, int] = {}
         for key, entry in mapping.items():
             if not isinstance(key, str):
@@ -422,6 +467,8 @@ class SaveService:
         if value is None:
             return {}
         mapping = self._require_dict(value, context)
+        if _is_count_map(mapping):
+            return dict(mapping)
         result: Dict[str, int] = {}
         for key, entry in mapping.items():
             if not isinstance(key, str):
@@ -435,34 +482,31 @@ class SaveService:
 
     def _coerce_attributes(self, value: Any, context: str) -> Attributes:
         mapping = self._require_dict(value, context)
-        expected = {"STR", "DEX", "INT", "VIT", "BOND"}
-        actual = set(mapping.keys())
-        if actual != expected:
-            missing = expected - actual
-            extra = actual - expected
+        if mapping.keys() != _ATTRIBUTE_KEY_SET:
+            actual = set(mapping.keys())
+            missing = _ATTRIBUTE_KEY_SET - actual
+            extra = actual - _ATTRIBUTE_KEY_SET
             msg_parts: list[str] = []
             if missing:
                 msg_parts.append(f"missing keys: {sorted(missing)}")
             if extra:
                 msg_parts.append(f"unknown keys: {sorted(extra)}")
             raise SaveLoadError(f"{context} has schema issues ({'; '.join(msg_parts)}).")
-        values: dict[str, int] = {}
-        for key in expected:
-            value_int = self._require_int(mapping.get(key), f"{context}.{key}")
+        values = [mapping[key] for key in _ATTRIBUTE_KEYS]
+        if all(type(value_int) is int and value_int >= 0 for value_int in values):
+            return Attributes(*values)
+        for index, key in enumerate(_ATTRIBUTE_KEYS):
+            value_int = self._require_int(values[index], f"{context}.{key}")
             if value_int < 0:
                 raise SaveLoadError(f"{context}.{key} must be a non-negative integer.")
-            values[key] = value_int
-        return Attributes(
-            STR=values["STR"],
-            DEX=values["DEX"],
-            INT=values["INT"],
-            VIT=values["VIT"],
-            BOND=values["BOND"],
-        )
+            values[index] = value_int
+        return Attributes(*values)
 
     def _coerce_str_list(self, value: Any, context: str) -> List[str]:
         if value is None:
             return []
+        if _is_str_list(value):
+            return list(value)
         if not isinstance(value, list):
             raise SaveLoadError(f"{context} must be a list.")
         result: List[str] = []
@@ -475,66 +519,93 @@ class SaveService:
     def _coerce_party_members(self, value: Any) -> List[str]:
         if not isinstance(value, list):
             raise SaveLoadError("state.party_members must be a list.")
+        known_members = self._party_members_repo.as_map()
         members: List[str] = []
         for entry in value:
             member_id = self._require_str(entry, "state.party_members[]")
-            try:
-                self._party_members_repo.get(member_id)
-            except KeyError as exc:
-                raise SaveLoadError(f"Save incompatible with current definitions: party member '{member_id}' missing.") from exc
+            if member_id not in known_members:
+                raise SaveLoadError(
+                    f"Save incompatible with current definitions: party member '{member_id}' missing."
+                )
             members.append(member_id)
         return members
 
-    def _coerce_visited_locations(self, value: Any, current_location_id: str) -> List[str]:
+    def _coerce_location_progress(
+        self, state_payload: Mapping[str, Any], current_location_id: str
+    ) -> tuple[List[str], Dict[str, bool], Dict[str, int]]:
+        """Coerce the visited list, entry-seen flags, and visit counts against one location map."""
+        known_locations = self._locations_repo.as_map()
+        visited = self._coerce_visited_locations(
+            state_payload.get("visited_locations"), current_location_id, known_locations
+        )
+        entry_seen = self._coerce_location_entry_flags(
+            state_payload.get("location_entry_seen"), current_location_id, known_locations
+        )
+        visits = self._coerce_location_visits(
+            state_payload.get("location_visits"), current_location_id, known_locations
+        )
+        return visited, entry_seen, visits
+
+    def _coerce_visited_locations(
+        self, value: Any, current_location_id: str, known_locations: Mapping[str, Any]
+    ) -> List[str]:
         if value is None:
             return [current_location_id]
         if not isinstance(value, list):
             raise SaveLoadError("state.visited_locations must be a list.")
         visited: List[str] = []
+        seen: set[str] = set()
         for entry in value:
             location_id = self._require_str(entry, "state.visited_locations[]")
-            self._validate_location_id(location_id)
-            if location_id not in visited:
-                visited.append(location_id)
-        if not visited:
-            visited.append(current_location_id)
-        if current_location_id not in visited:
+            if location_id in seen:
+                continue
+            if location_id not in known_locations:
+                raise self._unknown_location(location_id)
+            seen.add(location_id)
+            visited.append(location_id)
+        if current_location_id not in seen:
             visited.append(current_location_id)
         return visited
 
     def _coerce_location_entry_flags(
-        self, value: Any, current_location_id: str
+        self, value: Any, current_location_id: str, known_locations: Mapping[str, Any]
     ) -> Dict[str, bool]:
         if value is None:
             return {current_location_id: True}
         mapping = self._require_dict(value, "state.location_entry_seen")
-        result: Dict[str, bool] = {}
-        for key, entry in mapping.items():
-            location_id = self._require_str(key, "state.location_entry_seen key")
-            self._validate_location_id(location_id)
-            if not isinstance(entry, bool):
-                raise SaveLoadError(f"state.location_entry_seen[{location_id}] must be a boolean.")
-            result[location_id] = entry
-        if current_location_id not in result:
-            result[current_location_id] = True
+        if _has_str_keys_and_values_of(mapping, bool) and mapping.keys() <= known_locations.keys():
+            result = dict(mapping)
+        else:
+            result = {}
+            for key, entry in mapping.items():
+                location_id = self._require_str(key, "state.location_entry_seen key")
+                if location_id not in known_locations:
+                    raise self._unknown_location(location_id)
+                if not isinstance(entry, bool):
+                    raise SaveLoadError(f"state.location_entry_seen[{location_id}] must be a boolean.")
+                result[location_id] = entry
+        result.setdefault(current_location_id, True)
         return result
 
     def _coerce_location_visits(
-        self, value: Any, current_location_id: str
+        self, value: Any, current_location_id: str, known_locations: Mapping[str, Any]
     ) -> Dict[str, int]:
         if value is None:
             return {current_location_id: 0}
         mapping = self._require_dict(value, "state.location_visits")
-        result: Dict[str, int] = {}
-        for key, entry in mapping.items():
-            location_id = self._require_str(key, "state.location_visits key")
-            self._validate_location_id(location_id)
-            count = self._require_int(entry, f"state.location_visits[{location_id}]")
-            if count < 0:
-                raise SaveLoadError("state.location_visits values must be non-negative.")
-            result[location_id] = count
-        if current_location_id not in result:
-            result[current_location_id] = 0
+        if _is_count_map(mapping) and mapping.keys() <= known_locations.keys():
+            result = dict(mapping)
+        else:
+            result = {}
+            for key, entry in mapping.items():
+                location_id = self._require_str(key, "state.location_visits key")
+                if location_id not in known_locations:
+                    raise self._unknown_location(location_id)
+                count = self._require_int(entry, f"state.location_visits[{location_id}]")
+                if count < 0:
+                    raise SaveLoadError("state.location_visits values must be non-negative.")
+                result[location_id] = count
+        result.setdefault(current_location_id, 0)
         return result
 
     def _coerce_shop_stock_remaining(
@@ -543,6 +614,19 @@ class SaveService:
         if value is None:
             return {}
         mapping = self._require_dict(value, "state.shop_stock_remaining")
+        if all(
+            type(location_id) is str
+            and type(shop_map) is dict
+            and all(
+                type(shop_id) is str and type(stock_map) is dict and _is_count_map(stock_map)
+                for shop_id, stock_map in shop_map.items()
+            )
+            for location_id, shop_map in mapping.items()
+        ):
+            return {
+                location_id: {shop_id: dict(stock_map) for shop_id, stock_map in shop_map.items()}
+                for location_id, shop_map in mapping.items()
+            }
         output: Dict[str, Dict[str, Dict[str, int]]] = {}
         for location_id, shop_map in mapping.items():
             location_key = self._require_str(location_id, "state.shop_stock_remaining key")
@@ -553,19 +637,20 @@ class SaveService:
                 item_mapping = self._require_dict(
                     stock_map, f"state.shop_stock_remaining[{location_key}][{shop_key}]"
                 )
-                output[location_key][shop_key] = {}
+                shop_stock: Dict[str, int] = {}
                 for item_id, remaining in item_mapping.items():
-                    item_key = self._require_str(
+                    item_key = item_id if type(item_id) is str else self._require_str(
                         item_id,
                         f"state.shop_stock_remaining[{location_key}][{shop_key}] item key",
                     )
-                    qty = self._require_int(
+                    qty = remaining if type(remaining) is int else self._require_int(
                         remaining,
                         f"state.shop_stock_remaining[{location_key}][{shop_key}][{item_key}]",
                     )
                     if qty < 0:
                         raise SaveLoadError("shop_stock_remaining quantities must be non-negative.")
-                    output[location_key][shop_key][item_key] = qty
+                    shop_stock[item_key] = qty
+                output[location_key][shop_key] = shop_stock
         return output
 
     def _coerce_shop_stock_visit_index(
@@ -574,14 +659,21 @@ class SaveService:
         if value is None:
             return {}
         mapping = self._require_dict(value, "state.shop_stock_visit_index")
+        if all(
+            type(location_id) is str and type(shop_map) is dict and _is_count_map(shop_map)
+            for location_id, shop_map in mapping.items()
+        ):
+            return {location_id: dict(shop_map) for location_id, shop_map in mapping.items()}
         output: Dict[str, Dict[str, int]] = {}
         for location_id, shop_map in mapping.items():
             location_key = self._require_str(location_id, "state.shop_stock_visit_index key")
             shop_mapping = self._require_dict(shop_map, f"state.shop_stock_visit_index[{location_key}]")
             output[location_key] = {}
             for shop_id, visit in shop_mapping.items():
-                shop_key = self._require_str(shop_id, f"state.shop_stock_visit_index[{location_key}] shop key")
-                visit_value = self._require_int(
+                shop_key = shop_id if type(shop_id) is str else self._require_str(
+                    shop_id, f"state.shop_stock_visit_index[{location_key}] shop key"
+                )
+                visit_value = visit if type(visit) is int else self._require_int(
                     visit,
                     f"state.shop_stock_visit_index[{location_key}][{shop_key}]",
                 )
@@ -593,21 +685,29 @@ class SaveService:
     def _coerce_narration(self, value: Any) -> List[tuple[str, str]]:
         if not isinstance(value, list):
             raise SaveLoadError("state.pending_narration must be a list.")
+        known_nodes = self._story_repo.as_map()
         narration: List[tuple[str, str]] = []
         for entry in value:
             if not isinstance(entry, Mapping):
                 raise SaveLoadError("Each pending narration entry must be an object.")
             node_id = self._require_str(entry.get("node_id"), "pending_narration.node_id")
             text = self._require_str(entry.get("text"), "pending_narration.text")
-            self._validate_story_node(node_id)
+            if node_id not in known_nodes:
+                raise self._missing_story_node(node_id)
             narration.append((node_id, text))
         return narration
 
     def _coerce_inventory(self, value: Any) -> PartyInventory:
         inventory_data = self._require_dict(value, "state.inventory")
-        weapons = self._coerce_item_counts(inventory_data.get("weapons"), "state.inventory.weapons", self._weapons_repo.get)
-        armour = self._coerce_item_counts(inventory_data.get("armour"), "state.inventory.armour", self._armour_repo.get)
-        items = self._coerce_item_counts(inventory_data.get("items"), "state.inventory.items", self._items_repo.get)
+        weapons = self._coerce_item_counts(
+            inventory_data.get("weapons"), "state.inventory.weapons", self._weapons_repo.as_map()
+        )
+        armour = self._coerce_item_counts(
+            inventory_data.get("armour"), "state.inventory.armour", self._armour_repo.as_map()
+        )
+        items = self._coerce_item_counts(
+            inventory_data.get("items"), "state.inventory.items", self._items_repo.as_map()
+        )
         inventory = PartyInventory()
         inventory.weapons = weapons
         inventory.armour = armour
@@ -617,66 +717,76 @@ class SaveService:
     def _coerce_quests_active(self, value: Any) -> Dict[str, QuestProgress]:
         if value is None:
             return {}
-        mapping = self._require_dict(value, "state.quests_active")
+        require_dict = self._require_dict
+        require_int = self._require_int
+        validate_quest_id = self._validate_quest_id
+        mapping = require_dict(value, "state.quests_active")
         result: Dict[str, QuestProgress] = {}
         for quest_id, payload in mapping.items():
             if not isinstance(quest_id, str):
                 raise SaveLoadError("state.quests_active keys must be strings.")
-            if self._quests_repo:
-                self._validate_quest_id(quest_id)
-            progress_map = self._require_dict(payload, f"state.quests_active['{quest_id}']")
+            validate_quest_id(quest_id)
+            progress_map = require_dict(payload, f"state.quests_active['{quest_id}']")
             objectives_data = progress_map.get("objectives", [])
             if not isinstance(objectives_data, list):
                 raise SaveLoadError(f"state.quests_active['{quest_id}'].objectives must be a list.")
             objectives: List[QuestObjectiveProgress] = []
             for index, entry in enumerate(objectives_data):
-                entry_map = self._require_dict(
+                # Well-formed entries skip the helpers, so their error contexts are only formatted
+                # for values that actually need the slower checks.
+                entry_map = entry if type(entry) is dict else require_dict(
                     entry, f"state.quests_active['{quest_id}'].objectives[{index}]"
                 )
-                current = self._require_int(
-                    entry_map.get("current"),
-                    f"state.quests_active['{quest_id}'].objectives[{index}].current",
-                )
+                current = entry_map.get("current")
+                if type(current) is not int:
+                    current = require_int(
+                        current, f"state.quests_active['{quest_id}'].objectives[{index}].current"
+                    )
                 completed = entry_map.get("completed")
                 if not isinstance(completed, bool):
                     raise SaveLoadError(
                         f"state.quests_active['{quest_id}'].objectives[{index}].completed must be a boolean."
                     )
-                objectives.append(QuestObjectiveProgress(current=current, completed=completed))
+                objectives.append(QuestObjectiveProgress(current, completed))
             result[quest_id] = QuestProgress(quest_id=quest_id, objectives=objectives)
         return result
 
-    def _serialize_quests_active(self, state: GameState) -> Dict[str, Any]:
-        payload: Dict[str, Any] = {}
-        for quest_id, progress in state.quests_active.items():
-            payload[quest_id] = {
+    @staticmethod
+    def _serialize_quests_active(state: GameState) -> Dict[str, Any]:
+        return {
+            quest_id: {
                 "objectives": [
                     {"current": obj.current, "completed": obj.completed} for obj in progress.objectives
                 ]
             }
-        return payload
+            for quest_id, progress in state.quests_active.items()
+        }
 
-    def _coerce_item_counts(self, value: Any, context: str, validate_fn) -> Dict[str, int]:
+    def _coerce_item_counts(self, value: Any, context: str, known_ids: Mapping[str, Any]) -> Dict[str, int]:
         mapping = self._require_dict(value, context)
-        result: Dict[str, int] = {}
-        for key, entry in mapping.items():
-            item_id = self._require_str(key, f"{context} key")
-            quantity = self._require_int(entry, f"{context}[{item_id}]")
-            if quantity < 0:
-                raise SaveLoadError(f"{context}[{item_id}] cannot be negative.")
-            try:
-                validate_fn(item_id)
-            except KeyError as exc:
-                raise SaveLoadError(f"Save incompatible with current definitions: '{item_id}' missing.") from exc
-            result[item_id] = quantity
+        if _is_count_map(mapping):
+            result = dict(mapping)
+        else:
+            result = {}
+            for key, entry in mapping.items():
+                item_id = self._require_str(key, f"{context} key")
+                quantity = self._require_int(entry, f"{context}[{item_id}]")
+                if quantity < 0:
+                    raise SaveLoadError(f"{context}[{item_id}] cannot be negative.")
+                result[item_id] = quantity
+        if not result.keys() <= known_ids.keys():
+            missing = ", ".join(f"'{item_id}'" for item_id in sorted(result.keys() - known_ids.keys()))
+            raise SaveLoadError(f"Save incompatible with current definitions: {missing} missing.")
         return result
 
-    def _coerce_equipment(self, value: Any, state: GameState) -> Dict[str, MemberEquipment]:
+    def _coerce_equipment(self, value: Any, state: GameState) -> EquipmentMap:
         mapping = self._require_dict(value, "state.equipment")
         valid_member_ids = set(state.party_members)
         if state.player:
             valid_member_ids.add(state.player.id)
-        equipment: Dict[str, MemberEquipment] = {}
+        coerce_weapon = self._coerce_optional_weapon_id
+        coerce_armour = self._coerce_optional_armour_id
+        equipment = EquipmentMap()
         for member_id, entry in mapping.items():
             if not isinstance(member_id, str):
                 raise SaveLoadError("Equipment member ids must be strings.")
@@ -688,16 +798,16 @@ class SaveService:
             if not isinstance(weapon_slots, list) or len(weapon_slots) != 2:
                 raise SaveLoadError(f"Equipment for '{member_id}' must define two weapon slots.")
             armour_mapping = self._require_dict(armour_slots, f"state.equipment[{member_id}].armour_slots")
-            member_equipment = MemberEquipment()
-            member_equipment.weapon_slots = [
-                self._coerce_optional_weapon_id(slot_value, member_id, slot_index)
-                for slot_index, slot_value in enumerate(weapon_slots)
-            ]
-            member_equipment.armour_slots = {
-                slot: self._coerce_optional_armour_id(armour_mapping.get(slot), member_id, slot)
-                for slot in ARMOUR_SLOTS
-            }
-            equipment[member_id] = member_equipment
+            armour: Dict[str, str | None] = {}
+            for slot in ARMOUR_SLOTS:
+                armour[slot] = coerce_armour(armour_mapping.get(slot), member_id, slot)
+            equipment[member_id] = MemberEquipment(
+                weapon_slots=[
+                    coerce_weapon(weapon_slots[0], member_id, 0),
+                    coerce_weapon(weapon_slots[1], member_id, 1),
+                ],
+                armour_slots=armour,
+            )
         return equipment
 
     def _coerce_party_member_attributes(
@@ -715,6 +825,7 @@ class SaveService:
             raise SaveLoadError(
                 f"state.party_member_attributes references unknown members: {sorted(extra_members)}."
             )
+        member_defs = self._party_members_repo.as_map()
         attributes: Dict[str, Attributes] = {}
         for member_id in party_members:
             if member_id in payload:
@@ -723,12 +834,11 @@ class SaveService:
                     f"state.party_member_attributes.{member_id}",
                 )
                 continue
-            try:
-                member_def = self._party_members_repo.get(member_id)
-            except KeyError as exc:
+            member_def = member_defs.get(member_id)
+            if member_def is None:
                 raise SaveLoadError(
                     f"Save incompatible with current definitions: party member '{member_id}' missing."
-                ) from exc
+                )
             attributes[member_id] = Attributes(
                 STR=member_def.starting_attributes.STR,
                 DEX=member_def.starting_attributes.DEX,
@@ -742,24 +852,16 @@ class SaveService:
         if value is None:
             return None
         weapon_id = self._require_str(value, f"equipment[{member_id}].weapon_slots[{slot_index}]")
-        try:
-            self._weapons_repo.get(weapon_id)
-        except KeyError as exc:
-            raise SaveLoadError(
-                f"Save incompatible with current definitions: weapon '{weapon_id}' missing."
-            ) from exc
+        if weapon_id not in self._weapons_repo.as_map():
+            raise SaveLoadError(f"Save incompatible with current definitions: weapon '{weapon_id}' missing.")
         return weapon_id
 
     def _coerce_optional_armour_id(self, value: Any, member_id: str, slot: str) -> str | None:
         if value is None:
             return None
         armour_id = self._require_str(value, f"equipment[{member_id}].armour_slots.{slot}")
-        try:
-            self._armour_repo.get(armour_id)
-        except KeyError as exc:
-            raise SaveLoadError(
-                f"Save incompatible with current definitions: armour '{armour_id}' missing."
-            ) from exc
+        if armour_id not in self._armour_repo.as_map():
+            raise SaveLoadError(f"Save incompatible with current definitions: armour '{armour_id}' missing.")
         return armour_id
 
     def _coerce_player(self, value: Any, *, attributes: Attributes | None) -> Player:
@@ -778,14 +880,12 @@ class SaveService:
                 f"Save incompatible with current definitions: class '{class_id}' missing."
             ) from exc
         stats_mapping = self._require_dict(mapping.get("stats"), "state.player.stats")
+        require_int = self._require_int
         stats = Stats(
-            max_hp=self._require_int(stats_mapping.get("max_hp"), "state.player.stats.max_hp"),
-            hp=self._require_int(stats_mapping.get("hp"), "state.player.stats.hp"),
-            max_mp=self._require_int(stats_mapping.get("max_mp"), "state.player.stats.max_mp"),
-            mp=self._require_int(stats_mapping.get("mp"), "state.player.stats.mp"),
-            attack=self._require_int(stats_mapping.get("attack"), "state.player.stats.attack"),
-            defense=self._require_int(stats_mapping.get("defense"), "state.player.stats.defense"),
-            speed=self._require_int(stats_mapping.get("speed"), "state.player.stats.speed"),
+            **{
+                key: require_int(stats_mapping.get(key), f"state.player.stats.{key}")
+                for key in _PLAYER_STAT_KEYS
+            }
         )
         if attributes is None:
             attributes = Attributes(
@@ -826,20 +926,15 @@ class SaveService:
         armour_ids = []
         if equipment:
             weapon_ids = [weapon_id for weapon_id in equipment.weapon_slots if weapon_id]
-            for slot in ARMOUR_SLOTS:
-                armour_id = equipment.armour_slots.get(slot)
-                if armour_id:
-                    armour_ids.append(armour_id)
-        try:
-            fallback_attack = self._weapons_repo.get(class_def.starting_weapon_id).attack
-        except KeyError:
-            fallback_attack = state.player.base_stats.attack
-        try:
-            fallback_defense = self._armour_repo.get(class_def.starting_armour_id).defense
-        except KeyError:
-            fallback_defense = state.player.base_stats.defense
-        base_attack = self._calculate_attack_from_weapons(weapon_ids, fallback_attack)
-        base_defense = self._calculate_defense_from_armour(armour_ids, fallback_defense)
+            armour_ids = equipment.equipped_armour_ids()
+        weapon_defs = self._weapons_repo.as_map()
+        armour_defs = self._armour_repo.as_map()
+        starting_weapon = weapon_defs.get(class_def.starting_weapon_id)
+        fallback_attack = starting_weapon.attack if starting_weapon else state.player.base_stats.attack
+        starting_armour = armour_defs.get(class_def.starting_armour_id)
+        fallback_defense = starting_armour.defense if starting_armour else state.player.base_stats.defense
+        base_attack = self._calculate_attack_from_weapons(weapon_ids, weapon_defs, fallback_attack)
+        base_defense = self._calculate_defense_from_armour(armour_ids, armour_defs, fallback_defense)
         base_stats = Stats(
             max_hp=class_def.base_hp,
             hp=state.player.stats.hp,
@@ -863,79 +958,83 @@ class SaveService:
             current_mp=state.player.stats.mp,
         )
 
-    def _calculate_attack_from_weapons(self, weapon_ids: List[str], fallback: int) -> int:
+    @staticmethod
+    def _calculate_attack_from_weapons(
+        weapon_ids: List[str], weapon_defs: Mapping[str, WeaponDef], fallback: int
+    ) -> int:
         for weapon_id in weapon_ids:
-            try:
-                weapon_def = self._weapons_repo.get(weapon_id)
-            except KeyError:
-                continue
-            return max(1, weapon_def.attack)
+            weapon_def = weapon_defs.get(weapon_id)
+            if weapon_def is not None:
+                return max(1, weapon_def.attack)
         return max(1, fallback)
 
-    def _calculate_defense_from_armour(self, armour_ids: List[str], fallback: int) -> int:
+    @staticmethod
+    def _calculate_defense_from_armour(
+        armour_ids: List[str], armour_defs: Mapping[str, ArmourDef], fallback: int
+    ) -> int:
         total = 0
         for armour_id in armour_ids:
-            try:
-                armour_def = self._armour_repo.get(armour_id)
-            except KeyError:
-                continue
-            total += armour_def.defense
+            armour_def = armour_defs.get(armour_id)
+            if armour_def is not None:
+                total += armour_def.defense
         return total if total > 0 else max(0, fallback)
 
     def _validate_story_node(self, node_id: str) -> None:
-        try:
-            self._story_repo.get(node_id)
-        except KeyError as exc:
-            raise SaveLoadError(
-                f"Save incompatible with current definitions: story node '{node_id}' missing."
-            ) from exc
+        if node_id not in self._story_repo.as_map():
+            raise self._missing_story_node(node_id)
+
+    @staticmethod
+    def _missing_story_node(node_id: str) -> SaveLoadError:
+        return SaveLoadError(f"Save incompatible with current definitions: story node '{node_id}' missing.")
 
     def _validate_progress_consistency(self, state: GameState) -> None:
         member_ids = set(state.party_members)
         if state.player:
             member_ids.add(state.player.id)
-        for member_id in state.member_levels.keys():
-            if member_id not in member_ids:
-                raise SaveLoadError(f"Member level references unknown id '{member_id}'.")
-        for member_id in state.member_exp.keys():
-            if member_id not in member_ids:
-                raise SaveLoadError(f"Member EXP references unknown id '{member_id}'.")
-
-        equipment_keys = set(state.equipment.keys())
-        extra_equipment = equipment_keys - member_ids
-        if extra_equipment:
+        # issuperset walks the dict keys in C; offenders are only looked up to build the error.
+        if not member_ids.issuperset(state.member_levels):
+            member_id = next(key for key in state.member_levels if key not in member_ids)
+            raise SaveLoadError(f"Member level references unknown id '{member_id}'.")
+        if not member_ids.issuperset(state.member_exp):
+            member_id = next(key for key in state.member_exp if key not in member_ids)
+            raise SaveLoadError(f"Member EXP references unknown id '{member_id}'.")
+        if not member_ids.issuperset(state.equipment):
+            extra_equipment = state.equipment.keys() - member_ids
             raise SaveLoadError(f"Equipment references unknown members: {sorted(extra_equipment)}.")
 
     def _validate_quest_state(self, state: GameState) -> None:
         if not self._quests_repo:
             return
-        for quest_id in state.quests_active.keys():
-            self._validate_quest_id(quest_id)
-        for quest_id in state.quests_completed:
-            self._validate_quest_id(quest_id)
-        for quest_id in state.quests_turned_in:
-            self._validate_quest_id(quest_id)
+        known_quests = self._quests_repo.as_map()
+        # Active quest ids were already checked while coercing quests_active.
+        for quest_ids in (state.quests_completed, state.quests_turned_in):
+            for quest_id in quest_ids:
+                if quest_id not in known_quests:
+                    raise self._missing_quest(quest_id)
 
     def _validate_quest_id(self, quest_id: str) -> None:
         if not self._quests_repo:
             return
-        try:
-            self._quests_repo.get(quest_id)
-        except KeyError as exc:
-            raise SaveLoadError(
-                f"Save incompatible with current definitions: quest '{quest_id}' missing."
-            ) from exc
+        if quest_id not in self._quests_repo.as_map():
+            raise self._missing_quest(quest_id)
+
+    @staticmethod
+    def _missing_quest(quest_id: str) -> SaveLoadError:
+        return SaveLoadError(f"Save incompatible with current definitions: quest '{quest_id}' missing.")
 
     def _validate_location_id(self, location_id: str) -> None:
-        try:
-            self._locations_repo.get(location_id)
-        except KeyError as exc:
-            raise SaveLoadError(
-                f"Save references unknown location: {location_id}"
-            ) from exc
+        if location_id not in self._locations_repo.as_map():
+            raise self._unknown_location(location_id)
+
+    @staticmethod
+    def _unknown_location(location_id: str) -> SaveLoadError:
+        return SaveLoadError(f"Save references unknown location: {location_id}")
 
     @staticmethod
     def _require_dict(value: Any, context: str) -> Dict[str, Any]:
+        # Plain dicts are returned as-is; callers only read them and build fresh containers for state.
+        if type(value) is dict:
+            return value
         if not isinstance(value, Mapping):
             raise SaveLoadError(f"{context} must be an object.")
         return dict(value)
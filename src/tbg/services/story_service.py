@@ -13,6 +13,7 @@ from tbg.data.repositories import (
     WeaponsRepository,
 )
 from tbg.domain.defs import StoryEffectDef, StoryNodeDef
+from tbg.domain.leveling import exp_for_levels, levels_gained
 from tbg.domain.state import GameState
 from tbg.services.factories import create_player_from_class_id
 from tbg.services.inventory_service import InventoryService
@@ -317,7 +318,7 @@ class StoryService:
                 if not state.inventory.remove_item(item_id, quantity):
                     raise ValueError(f"remove_item could not remove {quantity} of '{item_id}'.")
                 if self._quest_service:
-                    self._quest_service.refresh_collect_objectives(state)
+                    self._quest_service.record_item_delta(state, item_id)
             elif effect_type == "branch_on_flag":
                 flag_id = self._require_str(effect.data.get("flag_id"), "branch_on_flag.flag_id")
                 expected = effect.data.get("expected", True)
@@ -393,16 +394,11 @@ class StoryService:
         if amount <= 0:
             return []
         events: List[StoryEvent] = []
-        current_level = state.member_levels.get(member_id, 1)
-        current_exp = state.member_exp.get(member_id, 0)
-        current_exp += amount
-        leveled: List[int] = []
-        threshold = self._xp_to_next_level(current_level)
-        while current_exp >= threshold:
-            current_exp -= threshold
-            current_level += 1
-            leveled.append(current_level)
-            threshold = self._xp_to_next_level(current_level)
+        start_level = state.member_levels.get(member_id, 1)
+        current_exp = state.member_exp.get(member_id, 0) + amount
+        gained = levels_gained(start_level, current_exp)
+        current_exp -= exp_for_levels(start_level, gained)
+        current_level = start_level + gained
         state.member_levels[member_id] = current_level
         state.member_exp[member_id] = current_exp
         member_name = self._resolve_member_name(state, member_id)
@@ -414,7 +410,7 @@ class StoryService:
                 new_level=current_level,
             )
         )
-        for level in leveled:
+        for level in range(start_level + 1, current_level + 1):
             events.append(
                 PartyLevelUpEvent(
                     member_id=member_id,
@@ -422,6 +418,7 @@ class StoryService:
                     new_level=level,
                 )
             )
+        if gained:
             self._restore_member_resources(state, member_id, restore_hp=True, restore_mp=True)
         return events
 
@@ -434,10 +431,6 @@ class StoryService:
         except KeyError:
             return member_id
 
-    @staticmethod
-    def _xp_to_next_level(level: int) -> int:
-        return 10 + (level - 1) * 5
-
     def _active_party_ids(self, state: GameState) -> List[str]:
         ids: List[str] = []
         if state.player:
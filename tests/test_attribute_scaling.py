@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from tbg.domain.attribute_scaling import apply_attribute_scaling
+from tbg.domain.attribute_scaling import apply_attribute_scaling, build_attribute_scaling_breakdown
 from tbg.domain.entities import Attributes, BaseStats, Stats
 
 
@@ -26,3 +26,22 @@ def test_attribute_scaling_clamps_hp_mp() -> None:
     scaled = apply_attribute_scaling(base, attributes, current_hp=99, current_mp=42)
     assert scaled.hp == scaled.max_hp
     assert scaled.mp == scaled.max_mp
+
+
+def test_attribute_scaling_defaults_to_full_hp_mp() -> None:
+    base = BaseStats(max_hp=10, max_mp=5, attack=1, defense=0, speed=1)
+    attributes = Attributes(STR=0, DEX=0, INT=2, VIT=2, BOND=0)
+    scaled = apply_attribute_scaling(base, attributes)
+    assert scaled.hp == scaled.max_hp == 16
+    assert scaled.mp == scaled.max_mp == 9
+
+
+def test_attribute_scaling_matches_contribution_breakdown() -> None:
+    base = BaseStats(max_hp=18, max_mp=6, attack=4, defense=2, speed=3)
+    attributes = Attributes(STR=5, DEX=2, INT=4, VIT=3, BOND=1)
+    breakdown = build_attribute_scaling_breakdown(base, attributes, current_hp=10, current_mp=50)
+    scaled = apply_attribute_scaling(base, attributes, current_hp=10, current_mp=50)
+    assert scaled == breakdown.final_stats
+    assert scaled.max_hp == base.max_hp + breakdown.contributions.max_hp
+    assert scaled.attack == base.attack + breakdown.contributions.attack
+    assert scaled.speed == base.speed + breakdown.contributions.speed
@@ -1,6 +1,8 @@
 """Test battle controller is UI-agnostic and doesn't depend on presentation layer."""
 from __future__ import annotations
 
+import pytest
+
 from tbg.core.rng import RNG
 from tbg.domain.battle_models import BattleState, Combatant
 from tbg.domain.entities import Attributes, BaseStats, Stats, Player
@@ -106,6 +108,51 @@ def test_controller_identifies_player_turn() -> None:
     assert controller.is_enemy_turn(battle_state) is False
 
 
+def test_controller_identifies_turn_side_after_ally_joins() -> None:
+    controller, state, battle_state = _build_battle_controller()
+    assert controller.is_enemy_turn(battle_state) is False
+
+    summon = Combatant(
+        instance_id="summon_1",
+        display_name="Summon",
+        side="allies",
+        stats=Stats(max_hp=8, hp=8, max_mp=0, mp=0, attack=3, defense=0, speed=2),
+        owner_id="hero",
+    )
+    battle_state.allies.append(summon)
+    battle_state.current_actor_id = "summon_1"
+
+    assert controller.is_ally_ai_turn(battle_state, state) is True
+    assert controller.is_enemy_turn(battle_state) is False
+
+    battle_state.current_actor_id = "enemy_1"
+    assert controller.is_ally_ai_turn(battle_state, state) is False
+    assert controller.is_enemy_turn(battle_state) is True
+
+
+def test_side_lookup_tracks_replaced_combatants() -> None:
+    controller, _state, battle_state = _build_battle_controller()
+    battle_state.current_actor_id = "enemy_1"
+    assert controller.is_enemy_turn(battle_state) is True
+
+    replacement = Combatant(
+        instance_id="enemy_2",
+        display_name="Replacement",
+        side="enemies",
+        stats=Stats(max_hp=8, hp=8, max_mp=0, mp=0, attack=3, defense=0, speed=2),
+    )
+    enemy_count = len(battle_state.enemies)
+    battle_state.enemies[0] = replacement
+    assert len(battle_state.enemies) == enemy_count
+
+    assert battle_state.side_of("enemy_1") is None
+    battle_state.current_actor_id = "enemy_2"
+    assert controller.is_enemy_turn(battle_state) is True
+
+    battle_state.enemies = []
+    assert battle_state.side_of("enemy_2") is None
+
+
 def test_controller_provides_available_actions() -> None:
     """Verify controller exposes available actions as structured data."""
     controller, state, battle_state = _build_battle_controller()
@@ -129,6 +176,47 @@ def test_controller_lists_items_when_available() -> None:
     assert len(actions["items"]) == 1
 
 
+def test_controller_reuses_available_actions_until_an_action_is_applied() -> None:
+    controller, state, battle_state = _build_battle_controller()
+    state.inventory.add_item("potion_hp_small", 1)
+
+    first = controller.get_available_actions(battle_state, state)
+    assert controller.get_available_actions(battle_state, state) is first
+
+    hero = battle_state.allies[0]
+    action = BattleAction(action_type="item", item_id="potion_hp_small", target_id=hero.instance_id)
+    controller.apply_player_action(battle_state, state, action)
+    battle_state.current_actor_id = hero.instance_id
+
+    refreshed = controller.get_available_actions(battle_state, state)
+    assert refreshed is not first
+    assert refreshed["can_use_item"] is False
+
+
+def test_controller_reuses_party_talk_preview_until_knowledge_refresh() -> None:
+    controller, state, battle_state = _build_battle_controller()
+
+    first = controller.party_talk_preview(battle_state, state, "hero")
+    assert controller.party_talk_preview(battle_state, state, "hero") is first
+
+    controller.refresh_knowledge_snapshot(battle_state, state)
+
+    assert controller.party_talk_preview(battle_state, state, "hero") is not first
+
+
+def test_controller_reuses_battle_view_until_an_action_is_applied() -> None:
+    controller, state, battle_state = _build_battle_controller()
+
+    first = controller.get_battle_view(battle_state)
+    assert controller.get_battle_view(battle_state) is first
+
+    controller.apply_player_action(battle_state, state, BattleAction(action_type="attack", target_id="enemy_1"))
+
+    refreshed = controller.get_battle_view(battle_state)
+    assert refreshed is not first
+    assert refreshed.enemies[0].current_hp == battle_state.enemies[0].stats.hp < first.enemies[0].current_hp
+
+
 def test_controller_applies_action_and_returns_events() -> None:
     """Verify controller applies actions and returns events without printing."""
     controller, state, battle_state = _build_battle_controller()
@@ -140,6 +228,30 @@ def test_controller_applies_action_and_returns_events() -> None:
     assert any(isinstance(evt, AttackResolvedEvent) for evt in events)
 
 
+def test_battle_action_rejects_missing_fields_at_construction() -> None:
+    with pytest.raises(ValueError, match="requires target_id"):
+        BattleAction(action_type="attack")
+    with pytest.raises(ValueError, match="requires skill_id and target_ids"):
+        BattleAction(action_type="skill", skill_id="skill_power_slash")
+    with pytest.raises(ValueError, match="requires speaker_id"):
+        BattleAction(action_type="talk")
+    with pytest.raises(ValueError, match="requires item_id and target_id"):
+        BattleAction(action_type="item", item_id="potion_hp_small")
+    with pytest.raises(ValueError, match="Unknown action type"):
+        BattleAction(action_type="flee")  # type: ignore[arg-type]
+
+
+def test_battle_action_is_immutable_and_hashable() -> None:
+    action = BattleAction(action_type="skill", skill_id="skill_ember_wave", target_ids=["enemy_1", "enemy_2"])
+
+    assert action.target_ids == ("enemy_1", "enemy_2")
+    assert hash(action) == hash(
+        BattleAction(action_type="skill", skill_id="skill_ember_wave", target_ids=("enemy_1", "enemy_2"))
+    )
+    with pytest.raises(AttributeError):
+        action.skill_id = "skill_power_slash"  # type: ignore[misc]
+
+
 def test_controller_applies_item_action() -> None:
     controller, state, battle_state = _build_battle_controller()
     state.inventory.add_item("potion_hp_small", 1)
@@ -32,14 +32,19 @@ from tbg.domain.enemy_scaling import (
 )
 from tbg.domain.entities import Attributes
 from tbg.domain.entities.stats import Stats
+from tbg.domain.leveling import exp_to_next_level
 from tbg.domain.state import GameState
 from tbg.services.battle_service import (
     ANTI_REPEAT_IGNORE_GAP,
     AttackResolvedEvent,
+    BattleExpRewardEvent,
+    BattleLevelUpEvent,
     BattleResolvedEvent,
+    BattleRewardsHeaderEvent,
     BattleService,
     DebuffAppliedEvent,
     DebuffExpiredEvent,
+    EnemyTargetingDebugEvent,
     GuardAppliedEvent,
     ItemUsedEvent,
     LootAcquiredEvent,
@@ -569,6 +574,32 @@ def test_party_talk_tier0_without_hp_knowledge_has_no_numbers() -> None:
     assert not re.search(r"\d", talk_event.text)
 
 
+def test_party_has_knowledge_reindexes_replaced_entries() -> None:
+    service = _make_battle_service()
+    state = _make_state()
+    service._knowledge_repo._ensure_loaded()  # type: ignore[attr-defined]
+    service._knowledge_repo._definitions["emma"] = []  # type: ignore[attr-defined]
+
+    assert service.party_has_knowledge(state, ("goblin",)) is False
+    assert service.party_has_knowledge(state, ()) is False
+
+    service._knowledge_repo._definitions["emma"] = [
+        KnowledgeEntry(
+            knowledge_keys=(),
+            enemy_tags=("beast", "goblin"),
+            max_level=None,
+            hp_range=None,
+            speed_hint=None,
+            behavior=None,
+        )
+    ]  # type: ignore[attr-defined]
+
+    assert service.party_has_knowledge(state, ("undead", "goblin")) is True
+    assert service.party_has_knowledge(state, ("undead",)) is False
+    state.party_members = []
+    assert service.party_has_knowledge(state, ("goblin",)) is False
+
+
 def test_party_talk_tier1_mentions_static_range() -> None:
     service = _make_battle_service()
     state = _make_state()
@@ -730,6 +761,19 @@ def test_enemy_ai_prefers_higher_aggro_target() -> None:
     assert target_id == ally_a.instance_id
 
 
+def test_enemy_basic_attack_events_lead_with_targeting_debug() -> None:
+    service = _make_battle_service()
+    battle_state, enemy, ally_a, _ = _make_threat_test_battle()
+    service._initialize_enemy_aggro(battle_state)
+
+    events = service.run_enemy_turn(battle_state, RNG(5))
+
+    assert isinstance(events[0], EnemyTargetingDebugEvent)
+    assert events[0].attacker_id == enemy.instance_id
+    assert isinstance(events[1], AttackResolvedEvent)
+    assert events[1].target_id == events[0].target_id == ally_a.instance_id
+
+
 def test_enemy_targets_highest_damage_source() -> None:
     service = _make_battle_service()
     battle_state, enemy, ally_a, ally_b = _make_threat_test_battle()
@@ -876,6 +920,42 @@ def test_level_up_restores_player_hp_and_mp() -> None:
     assert state.player.stats.mp == state.player.stats.max_mp
 
 
+def test_award_exp_appends_into_provided_event_list() -> None:
+    service = _make_battle_service()
+    state = _make_state()
+    assert state.player is not None
+    events = [BattleRewardsHeaderEvent()]
+
+    returned = service._award_exp(state, state.player.id, 5, events)
+
+    assert returned is events
+    assert isinstance(events[0], BattleRewardsHeaderEvent)
+    assert isinstance(events[1], BattleExpRewardEvent)
+
+
+def test_large_exp_grant_matches_per_level_thresholds() -> None:
+    service = _make_battle_service()
+    state = _make_state()
+    assert state.player is not None
+    player_id = state.player.id
+    state.member_levels[player_id] = 3
+    state.member_exp[player_id] = 4
+    grant = 400
+
+    expected_level = 3
+    expected_exp = 4 + grant
+    while expected_exp >= exp_to_next_level(expected_level):
+        expected_exp -= exp_to_next_level(expected_level)
+        expected_level += 1
+
+    events = service._award_exp(state, player_id, grant)
+
+    assert state.member_levels[player_id] == expected_level
+    assert state.member_exp[player_id] == expected_exp
+    level_ups = [evt.new_level for evt in events if isinstance(evt, BattleLevelUpEvent)]
+    assert level_ups == list(range(4, expected_level + 1))
+
+
 def test_level_up_recalculates_attribute_scaled_stats() -> None:
     service = _make_battle_service()
     state = _make_state()
@@ -1226,6 +1306,16 @@ def test_skill_eligibility_by_weapon_tags() -> None:
     assert "skill_brace" in skill_ids
 
 
+def test_available_skills_are_stable_across_repeated_lookups() -> None:
+    service = _make_battle_service()
+    state = _make_state(with_party=False)
+    battle_state, _ = service.start_battle("goblin_grunt", state)
+    first = service.get_available_skills(battle_state, state.player.id)
+    first.clear()
+    second = service.get_available_skills(battle_state, state.player.id)
+    assert {skill.id for skill in second} >= {"skill_power_slash", "skill_brace"}
+
+
 def test_single_target_skill_applies_damage_and_cost() -> None:
     service = _make_battle_service()
     state = _make_state(with_party=False)
@@ -1274,6 +1364,19 @@ def test_multi_target_skill_hits_up_to_three_targets() -> None:
         assert enemy.stats.hp == initial_hp[enemy.instance_id] - expected[enemy.instance_id]
 
 
+def test_multi_target_skill_rejects_duplicate_targets() -> None:
+    service = _make_battle_service()
+    state = _make_state(with_party=False, class_id="mage")
+    battle_state, _ = service.start_battle("goblin_pack_3", state)
+    enemy_id = battle_state.enemies[0].instance_id
+    initial_mp = state.player.stats.mp
+
+    with pytest.raises(ValueError, match="Duplicate targets"):
+        service.use_skill(battle_state, state.player.id, "skill_ember_wave", [enemy_id, enemy_id])
+
+    assert state.player.stats.mp == initial_mp
+
+
 def test_magic_skill_uses_int_not_str_for_action_attack() -> None:
     service = _make_battle_service()
     state = _make_state(with_party=False, class_id="mage")
@@ -1,3 +1,5 @@
+import pytest
+
 from tbg.core.rng import RNG
 from tbg.domain.state import GameState
 from tbg.presentation.cli import app, config
@@ -341,6 +343,86 @@ def test_load_game_delete_flow(monkeypatch, tmp_path) -> None:
     assert not (tmp_path / "slot_1.json").exists()
 
 
+def test_slot_store_round_trips_compact_payload(tmp_path) -> None:
+    (
+        story_service,
+        _battle_service,
+        _inventory_service,
+        save_service,
+        area_service,
+        _quest_service,
+        _shop_service,
+        _summon_loadout_service,
+        _attribute_service,
+    ) = app._build_services()
+    state = story_service.start_new_game(seed=3, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+
+    slot_store = SaveSlotStore(base_dir=tmp_path, slot_count=1)
+    slot_store.write_slot(1, payload)
+
+    assert "\n" not in (tmp_path / "slot_1.json").read_text(encoding="utf-8")
+    assert slot_store.read_slot(1) == payload
+    restored = save_service.deserialize(slot_store.read_slot(1))
+    assert restored.player_name == "Hero"
+
+
+@pytest.mark.parametrize("player_name", ["Zoë", "H\udcff"])
+def test_slot_store_round_trips_non_ascii_names(tmp_path, player_name) -> None:
+    slot_store = SaveSlotStore(base_dir=tmp_path, slot_count=1)
+    payload = {"metadata": {"player_name": player_name}, "save_version": 2}
+    slot_store.write_slot(1, payload)
+
+    assert slot_store.read_slot(1) == payload
+    assert slot_store.list_slots()[0].metadata == {"player_name": player_name}
+
+
+def test_slot_listing_reads_metadata_header(tmp_path) -> None:
+    slot_store = SaveSlotStore(base_dir=tmp_path, slot_count=3)
+    metadata = {"player_name": "Hero", "current_node_id": "class_select"}
+    slot_store.write_slot(1, {"metadata": metadata, "save_version": 2, "state": {"gold": 5}})
+    (tmp_path / "slot_2.json").write_text(
+        '{\n  "metadata": {"player_name": "Legacy"},\n  "save_version": 2\n}', encoding="utf-8"
+    )
+    (tmp_path / "slot_3.json").write_text('{"metadata":{"player_name":', encoding="utf-8")
+
+    slots = slot_store.list_slots()
+
+    assert slots[0].metadata == metadata
+    assert slots[1].metadata == {"player_name": "Legacy"}
+    assert slots[2].is_corrupt
+
+
+def test_load_game_truncated_body_offers_delete(monkeypatch, tmp_path, capsys) -> None:
+    (
+        story_service,
+        _battle_service,
+        _inventory_service,
+        save_service,
+        area_service,
+        _quest_service,
+        _shop_service,
+        _summon_loadout_service,
+        _attribute_service,
+    ) = app._build_services()
+    state = story_service.start_new_game(seed=4, player_name="Hero")
+    area_service.initialize_state(state)
+    slot_store = SaveSlotStore(base_dir=tmp_path, slot_count=1)
+    slot_store.write_slot(1, save_service.serialize(state))
+    slot_path = tmp_path / "slot_1.json"
+    text = slot_path.read_text(encoding="utf-8")
+    slot_path.write_text(text[: len(text) // 2], encoding="utf-8")
+    assert not slot_store.list_slots()[0].is_corrupt
+
+    selections = iter(["1", "1", "2", "y", "2"])
+    monkeypatch.setattr("builtins.input", lambda _: next(selections))
+    assert app._load_game_flow(save_service, slot_store) is None
+
+    assert "Slot data is corrupt" in capsys.readouterr().out
+    assert not slot_path.exists()
+
+
 def test_load_game_corrupt_allows_delete(monkeypatch, tmp_path) -> None:
     (
         _story_service,
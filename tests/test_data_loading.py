@@ -66,6 +66,39 @@ def test_weapons_repo_get_missing_raises(tmp_path: Path) -> None:
         repo.get("missing_weapon")
 
 
+def test_weapons_repo_get_many_resolves_ids_and_raises_on_missing(tmp_path: Path) -> None:
+    definitions_dir = _make_definitions_dir(tmp_path)
+    _write_json(
+        definitions_dir / "weapons.json",
+        {
+            "training_sword": {"name": "Training Sword", "attack": 3, "value": 1},
+            "oak_staff": {"name": "Oak Staff", "attack": 2, "value": 1},
+        },
+    )
+    repo = WeaponsRepository(base_path=definitions_dir)
+
+    resolved = repo.get_many(["oak_staff", "training_sword", "oak_staff"])
+
+    assert list(resolved) == ["oak_staff", "training_sword"]
+    assert resolved["oak_staff"] is repo.get("oak_staff")
+    with pytest.raises(KeyError):
+        repo.get_many(["training_sword", "missing_weapon"])
+
+
+def test_repository_as_map_exposes_loaded_definitions(tmp_path: Path) -> None:
+    definitions_dir = _make_definitions_dir(tmp_path)
+    _write_json(
+        definitions_dir / "weapons.json",
+        {"training_sword": {"name": "Training Sword", "attack": 3, "value": 1}},
+    )
+    repo = WeaponsRepository(base_path=definitions_dir)
+
+    definitions = repo.as_map()
+
+    assert list(definitions) == ["training_sword"]
+    assert definitions["training_sword"] is repo.get("training_sword")
+
+
 def test_validation_rejects_unknown_field(tmp_path: Path) -> None:
     definitions_dir = _make_definitions_dir(tmp_path)
     _write_json(
@@ -25,6 +25,7 @@ def test_scale_enemy_stats_applies_flat_increases() -> None:
     base = Stats(max_hp=20, hp=20, max_mp=0, mp=0, attack=5, defense=2, speed=4)
     scaled = scale_enemy_stats(base, battle_level=2)
     assert scaled.max_hp == 44
+    assert scaled.hp == scaled.max_hp
     assert scaled.attack == 9
     assert scaled.defense == 4
     assert scaled.speed == 6
@@ -7,6 +7,7 @@ from tbg.core.rng import RNG
 from tbg.data.repositories import ArmourRepository, ClassesRepository, EnemiesRepository, WeaponsRepository
 from tbg.services.errors import FactoryError
 from tbg.services.factories import (
+    create_enemy_group,
     create_enemy_instance,
     create_player_from_class_id,
     make_instance_id,
@@ -77,6 +78,152 @@ def test_create_enemy_instance_builds_expected_stats_and_rewards(tmp_path: Path)
     assert enemy.id.startswith("enemy_")
 
 
+def test_create_enemy_group_builds_independent_members(tmp_path: Path) -> None:
+    definitions_dir = _make_definitions_dir(tmp_path)
+    _seed_minimal_enemy_definitions(definitions_dir, with_group=True)
+    enemies_repo = EnemiesRepository(base_path=definitions_dir)
+    weapons_repo = WeaponsRepository(base_path=definitions_dir)
+    armour_repo = ArmourRepository(base_path=definitions_dir)
+
+    group = create_enemy_group(
+        "slime_pack",
+        enemies_repo=enemies_repo,
+        weapons_repo=weapons_repo,
+        armour_repo=armour_repo,
+        rng=RNG(999),
+        battle_level=2,
+    )
+    single_rng = RNG(999)
+    singles = [
+        create_enemy_instance(
+            "slime",
+            enemies_repo=enemies_repo,
+            weapons_repo=weapons_repo,
+            armour_repo=armour_repo,
+            rng=single_rng,
+            battle_level=2,
+        )
+        for _ in range(3)
+    ]
+
+    assert [enemy.stats for enemy in group] == [enemy.stats for enemy in singles]
+    assert [enemy.id for enemy in group] == [enemy.id for enemy in singles]
+    group[0].stats.hp -= 5
+    assert group[1].stats.hp == group[1].stats.max_hp
+    assert group[0].base_stats is not group[1].base_stats
+
+
+def test_create_enemy_instance_at_level_zero_matches_unscaled(tmp_path: Path) -> None:
+    definitions_dir = _make_definitions_dir(tmp_path)
+    _seed_minimal_enemy_definitions(definitions_dir)
+    enemies_repo = EnemiesRepository(base_path=definitions_dir)
+    weapons_repo = WeaponsRepository(base_path=definitions_dir)
+    armour_repo = ArmourRepository(base_path=definitions_dir)
+
+    unscaled = create_enemy_instance(
+        "slime", enemies_repo=enemies_repo, weapons_repo=weapons_repo, armour_repo=armour_repo, rng=RNG(5)
+    )
+    level_zero = create_enemy_instance(
+        "slime",
+        enemies_repo=enemies_repo,
+        weapons_repo=weapons_repo,
+        armour_repo=armour_repo,
+        rng=RNG(5),
+        battle_level=0,
+    )
+
+    assert level_zero.stats == unscaled.stats
+    assert level_zero.stats.hp == level_zero.stats.max_hp
+
+
+def test_create_enemy_instance_resolves_equipment_once_per_definition(tmp_path: Path) -> None:
+    definitions_dir = _make_definitions_dir(tmp_path)
+    _seed_minimal_enemy_definitions(definitions_dir)
+    enemies_repo = EnemiesRepository(base_path=definitions_dir)
+    weapons_repo = WeaponsRepository(base_path=definitions_dir)
+    armour_repo = ArmourRepository(base_path=definitions_dir)
+    rng = RNG(3)
+
+    create_enemy_instance(
+        "slime", enemies_repo=enemies_repo, weapons_repo=weapons_repo, armour_repo=armour_repo, rng=rng
+    )
+
+    def _fail(_def_id: str) -> object:
+        raise AssertionError("equipment should not be resolved again")
+
+    weapons_repo.get = _fail  # type: ignore[method-assign]
+    armour_repo.get = _fail  # type: ignore[method-assign]
+    enemy = create_enemy_instance(
+        "slime", enemies_repo=enemies_repo, weapons_repo=weapons_repo, armour_repo=armour_repo, rng=rng
+    )
+    assert enemy.stats.attack == 2
+
+
+def test_create_enemy_instance_resolves_equipment_per_repository(tmp_path: Path) -> None:
+    enemies_dir = _make_definitions_dir(tmp_path)
+    _seed_minimal_enemy_definitions(enemies_dir, weapon_ids=["fang"])
+    enemies_repo = EnemiesRepository(base_path=enemies_dir)
+    attacks = []
+    for fang_attack in (3, 5):
+        equipment_dir = tmp_path / f"equipment_{fang_attack}"
+        equipment_dir.mkdir()
+        _write_json(
+            equipment_dir / "weapons.json",
+            {"fang": {"name": "Fang", "attack": fang_attack, "value": 0, "tags": []}},
+        )
+        _write_json(equipment_dir / "armour.json", {})
+        enemy = create_enemy_instance(
+            "slime",
+            enemies_repo=enemies_repo,
+            weapons_repo=WeaponsRepository(base_path=equipment_dir),
+            armour_repo=ArmourRepository(base_path=equipment_dir),
+            rng=RNG(4),
+        )
+        attacks.append(enemy.stats.attack)
+
+    assert attacks == [5, 7]
+
+
+def test_create_enemy_instance_resolves_equipment_per_enemy_repository(tmp_path: Path) -> None:
+    equipment_dir = _make_definitions_dir(tmp_path)
+    _write_json(
+        equipment_dir / "weapons.json",
+        {"fang": {"name": "Fang", "attack": 5, "value": 0, "tags": []}},
+    )
+    _write_json(equipment_dir / "armour.json", {})
+    weapons_repo = WeaponsRepository(base_path=equipment_dir)
+    armour_repo = ArmourRepository(base_path=equipment_dir)
+    attacks = []
+    for name, weapon_ids in (("unarmed", None), ("armed", ["fang"])):
+        enemies_dir = tmp_path / name
+        enemies_dir.mkdir()
+        _seed_minimal_enemy_definitions(enemies_dir, weapon_ids=weapon_ids)
+        enemy = create_enemy_instance(
+            "slime",
+            enemies_repo=EnemiesRepository(base_path=enemies_dir),
+            weapons_repo=weapons_repo,
+            armour_repo=armour_repo,
+            rng=RNG(4),
+        )
+        attacks.append(enemy.stats.attack)
+
+    assert attacks == [2, 7]
+
+
+def test_create_enemy_group_missing_group_raises_clean_error(tmp_path: Path) -> None:
+    definitions_dir = _make_definitions_dir(tmp_path)
+    _seed_minimal_enemy_definitions(definitions_dir)
+
+    with pytest.raises(FactoryError):
+        create_enemy_group(
+            "missing_pack",
+            enemies_repo=EnemiesRepository(base_path=definitions_dir),
+            weapons_repo=WeaponsRepository(base_path=definitions_dir),
+            armour_repo=ArmourRepository(base_path=definitions_dir),
+            rng=RNG(1),
+        )
+
+
 def test_instance_ids_deterministic_for_same_seed() -> None:
     rng_a = RNG(321)
     rng_b = RNG(321)
@@ -87,6 +234,16 @@ def test_instance_ids_deterministic_for_same_seed() -> None:
     assert ids_a == ids_b
 
 
+def test_instance_ids_advance_rng_like_a_single_randint() -> None:
+    rng_ids = RNG(77)
+    rng_plain = RNG(77)
+
+    make_instance_id("enemy", rng_ids)
+    rng_plain.randint(100000, 999999)
+
+    assert rng_ids.random() == rng_plain.random()
+
+
 def test_create_player_missing_class_raises_clean_error(tmp_path: Path) -> None:
     definitions_dir = _make_definitions_dir(tmp_path)
     _seed_minimal_player_definitions(definitions_dir)
@@ -161,23 +318,27 @@ def _seed_minimal_player_definitions(definitions_dir: Path) -> None:
     )
 
 
-def _seed_minimal_enemy_definitions(definitions_dir: Path) -> None:
-    _write_json(
-        definitions_dir / "enemies.json",
-        {
-            "slime": {
-                "name": "Slime",
-                "hp": 20,
-                "mp": 0,
-                "attack": 2,
-                "defense": 0,
-                "speed": 1,
-                "rewards_exp": 5,
-                "rewards_gold": 3,
-                "tags": ["ooze"],
-            }
-        },
-    )
+def _seed_minimal_enemy_definitions(
+    definitions_dir: Path, *, with_group: bool = False, weapon_ids: list[str] | None = None
+) -> None:
+    enemies: dict[str, object] = {
+        "slime": {
+            "name": "Slime",
+            "hp": 20,
+            "mp": 0,
+            "attack": 2,
+            "defense": 0,
+            "speed": 1,
+            "rewards_exp": 5,
+            "rewards_gold": 3,
+            "tags": ["ooze"],
+        }
+    }
+    if weapon_ids is not None:
+        enemies["slime"]["equipment"] = {"weapons": weapon_ids}  # type: ignore[index]
+    if with_group:
+        enemies["slime_pack"] = {"name": "Slime Pack", "enemy_ids": ["slime", "slime", "slime"]}
+    _write_json(definitions_dir / "enemies.json", enemies)
 
 
 def _write_json(path: Path, data: dict[str, object]) -> None:
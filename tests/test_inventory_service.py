@@ -1,5 +1,6 @@
 from tbg.core.rng import RNG
 from tbg.data.repositories import ArmourRepository, ClassesRepository, PartyMembersRepository, WeaponsRepository
+from tbg.domain.inventory import EquipmentMap, MemberEquipment
 from tbg.domain.state import GameState
 from tbg.services.factories import create_player_from_class_id
 from tbg.services.inventory_service import (
@@ -73,6 +74,45 @@ def test_equip_two_handed_weapon_replaces_existing_slots() -> None:
     assert any(isinstance(event, ItemEquippedEvent) for event in events)
 
 
+def test_equip_one_handed_weapon_over_two_handed_clears_both_slots() -> None:
+    state, inventory_service, *_ = _make_state_and_service(class_id="warrior", with_party=False)
+    player_id = state.player.id
+    equipment = state.equipment[player_id]
+    equipment.weapon_slots = ["fire_staff", "fire_staff"]
+    state.inventory.weapons.clear()
+    state.inventory.add_weapon("iron_dagger")
+
+    events = inventory_service.equip_weapon(
+        state, player_id, "iron_dagger", slot_index=1, allow_replace=True
+    )
+
+    assert equipment.weapon_slots == [None, "iron_dagger"]
+    assert state.inventory.weapons == {"fire_staff": 1}
+    unequipped = [event for event in events if isinstance(event, ItemUnequippedEvent)]
+    assert [event.slot for event in unequipped] == ["weapon_slot_1"]
+
+
+def test_equip_two_handed_weapon_returns_each_distinct_occupant() -> None:
+    state, inventory_service, *_ = _make_state_and_service(class_id="warrior", with_party=False)
+    player_id = state.player.id
+    equipment = state.equipment[player_id]
+    equipment.weapon_slots = ["iron_dagger", "iron_sword"]
+    state.inventory.weapons.clear()
+    state.inventory.add_weapon("fire_staff")
+
+    events = inventory_service.equip_weapon(
+        state, player_id, "fire_staff", slot_index=None, allow_replace=True
+    )
+
+    assert equipment.weapon_slots == ["fire_staff", "fire_staff"]
+    assert state.inventory.weapons == {"iron_dagger": 1, "iron_sword": 1}
+    assert [(type(event), event.item_id, event.slot) for event in events] == [
+        (ItemUnequippedEvent, "iron_dagger", "weapon_slot_1"),
+        (ItemUnequippedEvent, "iron_sword", "weapon_slot_2"),
+        (ItemEquippedEvent, "fire_staff", "weapon_slot_1"),
+    ]
+
+
 def test_shared_inventory_prevents_double_equip() -> None:
     state, inventory_service, *_ = _make_state_and_service(class_id="warrior", with_party=True)
     player_id = state.player.id
@@ -122,3 +162,148 @@ def test_unequip_weapon_returns_to_inventory() -> None:
     assert state.inventory.weapons
 
 
+def test_unequip_armour_slot_normalizes_case_and_rejects_unknown_slot() -> None:
+    state, inventory_service, *_ = _make_state_and_service(class_id="warrior", with_party=False)
+    player_id = state.player.id
+    equipment = state.equipment[player_id]
+    armour_id = equipment.armour_slots["hands"]
+    assert armour_id is not None
+
+    events = inventory_service.unequip_armour_slot(state, player_id, "Hands")
+
+    assert isinstance(events[0], ItemUnequippedEvent)
+    assert events[0].slot == "armour_hands"
+    assert equipment.armour_slots["hands"] is None
+    assert state.inventory.armour[armour_id] >= 1
+
+    failed = inventory_service.unequip_armour_slot(state, player_id, "cape")
+    assert isinstance(failed[0], EquipFailedEvent)
+    assert failed[0].reason == "invalid_slot"
+
+
+def test_equip_resolves_member_name_once_per_action() -> None:
+    state, inventory_service, _, _, party_repo = _make_state_and_service()
+    equipment = state.equipment["emma"]
+    occupied_weapon = equipment.weapon_slots[0]
+    assert occupied_weapon is not None
+    state.inventory.add_weapon(occupied_weapon)
+    expected_name = party_repo.get("emma").name
+    calls = 0
+    original_get = party_repo.get
+
+    def _counting_get(member_id: str):
+        nonlocal calls
+        calls += 1
+        return original_get(member_id)
+
+    party_repo.get = _counting_get  # type: ignore[method-assign]
+
+    events = inventory_service.equip_weapon(
+        state, "emma", occupied_weapon, slot_index=0, allow_replace=True
+    )
+
+    assert calls == 1
+    assert [type(event) for event in events] == [ItemUnequippedEvent, ItemEquippedEvent]
+    assert all(event.member_name == expected_name for event in events)
+
+
+def test_equipment_view_reuses_resolved_weapon_defs_until_slots_change() -> None:
+    state, inventory_service, weapons_repo, *_ = _make_state_and_service(class_id="warrior", with_party=False)
+    player_id = state.player.id
+    equipment = state.equipment[player_id]
+    equipped_weapon = equipment.weapon_slots[0]
+    assert equipped_weapon is not None
+    original_get = weapons_repo.get
+    requested: list[str] = []
+
+    def _recording_get(weapon_id: str):
+        requested.append(weapon_id)
+        return original_get(weapon_id)
+
+    weapons_repo.get = _recording_get  # type: ignore[method-assign]
+
+    weapon_views, _ = inventory_service.build_member_equipment_view(state, player_id)
+    assert weapon_views[0].weapon_id == equipped_weapon
+    assert equipped_weapon not in requested
+
+    equipment.weapon_slots = ["iron_dagger", None]
+    weapon_views, _ = inventory_service.build_member_equipment_view(state, player_id)
+    assert weapon_views[0].weapon_name == original_get("iron_dagger").name
+    assert requested == ["iron_dagger"]
+
+
+def test_inventory_summary_is_reused_until_contents_change() -> None:
+    state, inventory_service, *_ = _make_state_and_service(class_id="warrior", with_party=False)
+
+    first = inventory_service.build_inventory_summary(state)
+    assert inventory_service.build_inventory_summary(state) is first
+
+    state.inventory.items["potion_hp_small"] = state.inventory.items.get("potion_hp_small", 0) + 2
+    refreshed = inventory_service.build_inventory_summary(state)
+
+    assert refreshed is not first
+    assert dict(refreshed.items)["potion_hp_small"] == dict(first.items).get("potion_hp_small", 0) + 2
+
+
+def test_list_party_members_resolves_names_and_falls_back_to_ids() -> None:
+    state, inventory_service, _, _, party_repo = _make_state_and_service()
+
+    members = inventory_service.list_party_members(state)
+    assert [(member.member_id, member.name, member.is_player) for member in members] == [
+        (state.player.id, "Tester", True),
+        ("emma", party_repo.get("emma").name, False),
+    ]
+
+    state.party_members = ["emma", "stranger"]
+    names = [member.name for member in inventory_service.list_party_members(state)]
+    assert names == ["Tester", party_repo.get("emma").name, "stranger"]
+
+
+def test_equipped_armour_ids_follow_slot_order() -> None:
+    equipment = MemberEquipment()
+    equipment.armour_slots["boots"] = "leather_boots"
+    equipment.armour_slots["head"] = "iron_helm"
+
+    assert equipment.equipped_armour_ids() == ["iron_helm", "leather_boots"]
+
+
+def test_equipment_map_creates_empty_loadout_on_first_access() -> None:
+    equipment = EquipmentMap()
+
+    created = equipment["emma"]
+
+    assert created == MemberEquipment()
+    assert equipment["emma"] is created
+    assert equipment.get("stranger") is None
+    assert "stranger" not in equipment
+
+
+def test_required_weapon_slots_are_shared_tuples() -> None:
+    _, inventory_service, weapons_repo, _, _ = _make_state_and_service()
+    one_handed = next(weapon for weapon in weapons_repo.all() if weapon.slot_cost == 1)
+    two_handed = next(weapon for weapon in weapons_repo.all() if weapon.slot_cost == 2)
+    equipment = MemberEquipment()
+
+    determine = inventory_service._determine_required_slots
+    assert determine(two_handed, None, False, equipment) == (0, 1)
+    assert determine(one_handed, 1, False, equipment) == (1,)
+    assert determine(one_handed, None, True, equipment) == (0,)
+    assert determine(one_handed, 2, False, equipment) is None
+    assert determine(one_handed, None, False, equipment) is None
+    assert determine(one_handed, 0, False, equipment) is determine(one_handed, 0, False, equipment)
+
+
+def test_starting_weapons_fill_free_slots_in_order() -> None:
+    _, inventory_service, weapons_repo, _, _ = _make_state_and_service()
+    equipment = MemberEquipment()
+
+    inventory_service._equip_starting_weapons(
+        equipment, ["iron_dagger", "missing_weapon", "shortbow", "iron_sword", "wooden_shield"]
+    )
+
+    assert equipment.weapon_slots == ["iron_dagger", "iron_sword"]
+    assert equipment.weapon_slot_defs == [weapons_repo.get("iron_dagger"), weapons_repo.get("iron_sword")]
+
+    two_handed = MemberEquipment()
+    inventory_service._equip_starting_weapons(two_handed, ["shortbow", "iron_dagger"])
+    assert two_handed.weapon_slots == ["shortbow", "shortbow"]
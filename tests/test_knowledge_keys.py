@@ -35,3 +35,18 @@ def test_list_all_knowledge_keys_sorted() -> None:
     keys = list_all_knowledge_keys(repo)
     assert keys == sorted(keys)
     assert "goblin_grunt" in keys
+
+
+def test_list_all_knowledge_keys_resolves_repo_once() -> None:
+    definitions_dir = Path(__file__).parent / "fixtures" / "data" / "definitions"
+    repo = EnemiesRepository(base_path=definitions_dir)
+    first = list_all_knowledge_keys(repo)
+
+    def _fail() -> list[EnemyDef]:
+        raise AssertionError("enemy definitions should not be walked again")
+
+    repo.all = _fail  # type: ignore[method-assign]
+    second = list_all_knowledge_keys(repo)
+
+    assert second == first
+    assert second is not first
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
 from tbg.core.rng import RNG
-from tbg.domain.knowledge_models import EnemyHpVisibilityMode, KnowledgeTier
+from tbg.domain.knowledge_models import EnemyHpVisibilityMode, KnowledgeThresholds, KnowledgeTier
 from tbg.domain.state import GameState
 from tbg.data.repositories import KnowledgeRulesRepository
 from tbg.services.knowledge_service import KnowledgeService
@@ -63,6 +65,9 @@ def test_record_kills_accumulates() -> None:
     service.record_kills(state, {"k_x": 3})
     assert state.knowledge_kill_counts["k_x"] == 5
 
+    service.record_kills(state, {"k_x": 0, "k_y": 0})
+    assert state.knowledge_kill_counts == {"k_x": 5}
+
 
 def test_set_kill_count_overwrites() -> None:
     service = _build_service()
@@ -93,3 +98,59 @@ def test_knowledge_service_does_not_consume_rng() -> None:
 
     after = state.rng.export_state()
     assert after == before
+
+
+def test_rules_are_read_once_until_invalidated() -> None:
+    repo = KnowledgeRulesRepository()
+    service = KnowledgeService(repo)
+    state = _build_state()
+    state.knowledge_kill_counts["k_test"] = 25
+    calls = 0
+    original_get_rules = repo.get_rules
+
+    def _counting_get_rules():
+        nonlocal calls
+        calls += 1
+        return original_get_rules()
+
+    repo.get_rules = _counting_get_rules  # type: ignore[method-assign]
+
+    assert service.get_tier_for_key(state, "k_test") == KnowledgeTier.TIER_1
+    assert service.get_tier_for_key(state, "k_test") == KnowledgeTier.TIER_1
+    assert service.get_hp_visibility_mode_for_tier(KnowledgeTier.TIER_1) == EnemyHpVisibilityMode.STATIC_RANGE
+    assert calls == 1
+
+    service.invalidate_rules()
+    service.get_tier_for_key(state, "k_test")
+    assert calls == 2
+
+
+def test_kill_count_lookup_does_not_insert_missing_keys() -> None:
+    service = _build_service()
+    state = _build_state()
+
+    assert service.get_kill_count(state, "k_missing") == 0
+    assert service.get_tier_for_key(state, "k_missing") == KnowledgeTier.TIER_0
+    assert state.knowledge_kill_counts == {}
+
+
+def test_tier_lookup_handles_out_of_order_thresholds() -> None:
+    repo = KnowledgeRulesRepository()
+    rules = replace(
+        repo.get_rules(),
+        thresholds=KnowledgeThresholds(tier1_kills=50, tier2_kills=10, tier3_kills=100),
+    )
+    repo.get_rules = lambda: rules  # type: ignore[method-assign]
+    service = KnowledgeService(repo)
+    state = _build_state()
+
+    expected = {
+        0: KnowledgeTier.TIER_0,
+        9: KnowledgeTier.TIER_0,
+        10: KnowledgeTier.TIER_2,
+        60: KnowledgeTier.TIER_2,
+        100: KnowledgeTier.TIER_3,
+    }
+    for kills, tier in expected.items():
+        state.knowledge_kill_counts["k_test"] = kills
+        assert service.get_tier_for_key(state, "k_test") == tier
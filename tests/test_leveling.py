@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from tbg.domain.leveling import exp_for_levels, exp_to_next_level, levels_gained
+
+
+def test_exp_to_next_level_grows_linearly() -> None:
+    assert [exp_to_next_level(level) for level in (1, 2, 3, 10)] == [10, 15, 20, 55]
+
+
+def test_levels_gained_matches_step_by_step_thresholds() -> None:
+    for start_level in range(1, 30):
+        for exp in range(0, 600):
+            level, remaining = start_level, exp
+            while remaining >= exp_to_next_level(level):
+                remaining -= exp_to_next_level(level)
+                level += 1
+            gained = levels_gained(start_level, exp)
+            assert gained == level - start_level
+            assert exp - exp_for_levels(start_level, gained) == remaining
+
+
+def test_levels_gained_handles_very_large_grants() -> None:
+    gained = levels_gained(1, 10**15)
+    assert exp_for_levels(1, gained) <= 10**15 < exp_for_levels(1, gained + 1)
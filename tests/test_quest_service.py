@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from tbg.core.rng import RNG
 from tbg.data.repositories import (
     ArmourRepository,
@@ -12,6 +14,8 @@ from tbg.data.repositories import (
     StoryRepository,
     WeaponsRepository,
 )
+from tbg.domain.defs import QuestDef, QuestObjectiveDef, QuestPrereqDef, QuestRewardDef, QuestRewardItemDef
+from tbg.domain.quest_state import QuestObjectiveProgress, QuestProgress
 from tbg.domain.state import GameState
 from tbg.services.factories import create_player_from_class_id
 from tbg.services.quest_service import QuestService
@@ -91,6 +95,19 @@ def test_kill_progress_is_deterministic() -> None:
     progress = state.quests_active["cerel_kill_hunt"]
     assert progress.objectives[0].current == 2
     assert progress.objectives[1].current == 1
+    assert progress.remaining == 2
+
+
+def test_kill_progress_counts_each_enemy_once_per_tag() -> None:
+    quest_service = _build_quest_service()
+    state = _make_state()
+    state.flags["flag_sq_cerel_offered"] = True
+    quest_service.accept_quest(state, "cerel_kill_hunt")
+    quest_service.record_battle_victory(state, [("goblin", "goblin", "orc"), ("beast",)])
+
+    progress = state.quests_active["cerel_kill_hunt"]
+    assert progress.objectives[0].current == 1
+    assert progress.objectives[1].current == 1
 
 
 def test_dana_shoreline_rumor_quest_flow() -> None:
@@ -132,3 +149,183 @@ def test_dana_wolf_teeth_quest_flow() -> None:
     assert state.inventory.items.get("wolf_tooth", 0) == 0
     assert state.flags.get("flag_sq_dana_completed") is True
     assert state.flags.get("flag_sq_dana_ready") is False
+
+
+def test_quest_def_prebuilds_objective_indexes_and_flag_updates() -> None:
+    goblins = QuestObjectiveDef(objective_type="kill_tag", label="Goblins", tag="goblin", quantity=3)
+    teeth = QuestObjectiveDef(objective_type="collect_item", label="Teeth", item_id="wolf_tooth")
+    ruins = QuestObjectiveDef(objective_type="visit_area", label="Ruins", area_id="shoreline_ruins")
+    more_goblins = QuestObjectiveDef(objective_type="kill_tag", label="More goblins", tag="goblin")
+    quest = QuestDef(
+        quest_id="q_indexed",
+        name="Indexed",
+        prereqs=QuestPrereqDef(required_flags=(), forbidden_flags=()),
+        objectives=(goblins, teeth, ruins, more_goblins),
+        turn_in=None,
+        rewards=QuestRewardDef(gold=0, party_exp=0, items=(), set_flags=()),
+        accept_flags=("flag_accepted",),
+        complete_flags=("flag_ready", "flag_done"),
+    )
+
+    assert quest.accept_flag_updates == {"flag_accepted": True}
+    assert quest.complete_flag_updates == {"flag_ready": True, "flag_done": True}
+    assert quest.kill_objectives_by_tag == {"goblin": ((0, goblins), (3, more_goblins))}
+    assert quest.visit_objectives_by_area == {"shoreline_ruins": ((2, ruins),)}
+    assert quest.collect_objectives == ((1, teeth),)
+
+
+def test_journal_view_buckets_completed_quests_and_turn_ins() -> None:
+    quest_service = _build_quest_service()
+    state = _make_state()
+    state.flags["flag_sq_cerel_offered"] = True
+    state.flags["flag_sq_dana_offered"] = True
+    quest_service.accept_quest(state, "cerel_kill_hunt")
+    quest_service.accept_quest(state, "dana_wolf_teeth")
+    quest_service.record_battle_victory(state, [["goblin"]] * 10 + [["orc"]] * 5)
+
+    journal = quest_service.build_journal_view(state)
+
+    assert [view.quest_id for view in journal.active] == ["cerel_kill_hunt", "dana_wolf_teeth"]
+    assert [view.is_completed for view in journal.active] == [True, False]
+    assert [view.quest_id for view in journal.completed] == ["cerel_kill_hunt"]
+    assert journal.completed[0] is journal.active[0]
+    assert [option.quest_id for option in journal.turn_ins] == ["cerel_kill_hunt"]
+    assert journal.turned_in == []
+
+
+def test_member_exp_levels_up_across_several_thresholds_at_once() -> None:
+    quest_service = _build_quest_service()
+    state = _make_state()
+    state.player.stats.hp = 1
+    state.member_exp[state.player.id] = 3
+
+    # Thresholds from level 1 are 10, 15, 20, 25: 3 + 60 clears three levels with 18 left over.
+    quest_service._apply_member_exp(state, state.player.id, 60)
+
+    assert state.member_levels[state.player.id] == 4
+    assert state.member_exp[state.player.id] == 18
+    assert state.player.stats.hp == state.player.stats.max_hp
+
+
+def test_party_exp_shares_give_the_player_the_remainder() -> None:
+    quest_service = _build_quest_service()
+    state = _make_state()
+    state.party_members = ["emma", "niale"]
+
+    quest_service._grant_party_exp(state, 11)
+
+    assert state.member_exp == {state.player.id: 5, "emma": 3, "niale": 3}
+
+
+def test_debug_view_reports_prereqs_for_every_definition() -> None:
+    quest_service = _build_quest_service()
+    state = _make_state()
+    state.flags["flag_sq_cerel_offered"] = True
+
+    debug_view = quest_service.build_debug_view(state)
+
+    assert debug_view.total_definitions == len(debug_view.prereqs) > 0
+    assert quest_service.get_definition_summary() == f"Quests loaded: {debug_view.total_definitions}"
+    cerel = next(entry for entry in debug_view.prereqs if entry.quest_id == "cerel_kill_hunt")
+    assert cerel.ready is True
+    assert cerel.missing_required == []
+
+
+def test_quest_progress_tracks_remaining_objectives() -> None:
+    progress = QuestProgress(
+        quest_id="q_remaining",
+        objectives=[QuestObjectiveProgress(current=3, completed=True), QuestObjectiveProgress()],
+    )
+    assert progress.remaining == 1
+    assert QuestProgress(quest_id="q_empty").remaining == 0
+
+    quest_service = _build_quest_service()
+    state = _make_state()
+    state.flags["flag_sq_cerel_offered"] = True
+    quest_service.accept_quest(state, "cerel_kill_hunt")
+    quest_service.record_battle_victory(state, [["goblin"]] * 10)
+
+    cerel = state.quests_active["cerel_kill_hunt"]
+    assert cerel.remaining == 1
+    assert "cerel_kill_hunt" not in state.quests_completed
+    quest_service.record_battle_victory(state, [["orc"]] * 5)
+    assert cerel.remaining == 0
+    assert "cerel_kill_hunt" in state.quests_completed
+
+
+def test_turn_in_rejects_quests_that_are_not_ready() -> None:
+    quest_service = _build_quest_service()
+    state = _make_state()
+    state.flags["flag_sq_cerel_offered"] = True
+    quest_service.accept_quest(state, "cerel_kill_hunt")
+
+    with pytest.raises(ValueError):
+        quest_service.turn_in_quest(state, "cerel_kill_hunt")
+    with pytest.raises(ValueError):
+        quest_service.turn_in_quest(state, "not_a_quest")
+    assert state.quests_turned_in == []
+
+
+def test_repeat_accept_returns_none_without_new_progress() -> None:
+    quest_service = _build_quest_service()
+    state = _make_state()
+    state.flags["flag_sq_cerel_offered"] = True
+    quest_service.accept_quest(state, "cerel_kill_hunt")
+    progress = state.quests_active["cerel_kill_hunt"]
+
+    assert quest_service.accept_quest(state, "cerel_kill_hunt") is None
+    assert state.quests_active["cerel_kill_hunt"] is progress
+
+
+def test_battle_victory_skips_tag_counting_without_kill_objectives() -> None:
+    quest_service = _build_quest_service()
+    state = _make_state()
+    state.flags["flag_protoquest_offered"] = True
+    quest_service.accept_quest(state, "dana_shoreline_rumor")
+
+    class _UncountedTags(list):
+        def __iter__(self):
+            raise AssertionError("defeated tags should not be counted")
+
+    quest_service.record_battle_victory(state, _UncountedTags([["goblin"]]))
+    assert state.quests_active["dana_shoreline_rumor"].remaining == 1
+
+
+def test_item_delta_only_refreshes_quests_collecting_that_item() -> None:
+    quest_service = _build_quest_service()
+    state = _make_state()
+    state.flags["flag_sq_dana_offered"] = True
+    quest_service.accept_quest(state, "dana_wolf_teeth")
+    state.inventory.items["wolf_tooth"] = 3
+
+    quest_service.record_item_delta(state, "potion_hp_small")
+    assert "dana_wolf_teeth" not in state.quests_completed
+
+    quest_service.record_item_delta(state, "wolf_tooth")
+    assert "dana_wolf_teeth" in state.quests_completed
+
+
+def test_journal_status_view_tolerates_short_progress_lists() -> None:
+    quest_service = _build_quest_service()
+    state = _make_state()
+    state.quests_active["cerel_kill_hunt"] = QuestProgress(
+        quest_id="cerel_kill_hunt",
+        objectives=[QuestObjectiveProgress(current=4, completed=False)],
+    )
+
+    view = quest_service.build_journal_view(state).active[0]
+
+    assert [(entry.current, entry.completed) for entry in view.objectives] == [(4, False), (0, False)]
+    assert view.is_completed is False
+
+
+def test_reward_items_stack_onto_existing_inventory() -> None:
+    quest_service = _build_quest_service()
+    state = _make_state()
+    state.inventory.items["potion_hp_small"] = 2
+
+    quest_service._add_item(state, QuestRewardItemDef(item_id="potion_hp_small", quantity=3))
+    quest_service._add_item(state, QuestRewardItemDef(item_id="wolf_tooth", quantity=1))
+
+    assert state.inventory.items["potion_hp_small"] == 5
+    assert state.inventory.items["wolf_tooth"] == 1
@@ -1,3 +1,5 @@
+import pytest
+
 from tbg.core.rng import RNG
 
 
@@ -26,3 +28,22 @@ def test_rng_different_seed() -> None:
 
     assert draws_a != draws_b
 
+
+def test_rng_export_restore_round_trip() -> None:
+    rng = RNG(424242)
+    rng.random()
+    snapshot = rng.export_state()
+    expected = [rng.randint(1, 1000) for _ in range(5)]
+
+    restored = RNG(1)
+    restored.restore_state(snapshot)
+    assert [restored.randint(1, 1000) for _ in range(5)] == expected
+    assert all(type(value) is int for value in snapshot["state"])
+
+
+def test_rng_restore_rejects_non_integer_state() -> None:
+    rng = RNG(7)
+    snapshot = rng.export_state()
+    snapshot["state"][0] = "not-a-number"
+    with pytest.raises(ValueError, match="state elements must be integers"):
+        rng.restore_state(snapshot)
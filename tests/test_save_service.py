@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
+
 import pytest
 
-from tbg.domain.inventory import MemberEquipment
+from tbg.domain.inventory import EquipmentMap, MemberEquipment
 from tbg.domain.quest_state import QuestObjectiveProgress, QuestProgress
 from tbg.services.battle_service import BattleService
 from tbg.services.inventory_service import InventoryService
@@ -185,6 +187,7 @@ def test_save_round_trip_preserves_state() -> None:
     assert restored.inventory.armour == state.inventory.armour
     assert restored.inventory.items == state.inventory.items
     assert restored.equipment[state.player.id].weapon_slots == [weapon_id, None]
+    assert isinstance(restored.equipment, EquipmentMap)
     assert restored.pending_narration == state.pending_narration
     assert restored.pending_story_node_id == state.pending_story_node_id
     assert restored.camp_message == state.camp_message
@@ -573,3 +576,305 @@ def test_missing_quest_fields_default_empty() -> None:
     assert restored.quests_completed == []
     assert restored.quests_turned_in == []
 
+
+def test_player_attributes_schema_issues_are_reported() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=7, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+    payload["state"]["player_attributes"] = {"STR": 1, "DEX": 1, "INT": 1, "VIT": 1, "LUCK": 1}
+    with pytest.raises(SaveLoadError, match=r"missing keys: \['BOND'\]; unknown keys: \['LUCK'\]"):
+        save_service.deserialize(payload)
+
+
+@pytest.mark.parametrize(
+    ("path", "value", "message"),
+    [
+        (("party_members",), ["missing_member"], "party member 'missing_member' missing"),
+        (("inventory", "items"), {"missing_item": 1}, "'missing_item' missing"),
+        (("pending_story_node_id",), "missing_node", "story node 'missing_node' missing"),
+        (("quests_completed",), ["missing_quest"], "quest 'missing_quest' missing"),
+    ],
+)
+def test_deserialize_reports_missing_definitions(path, value, message) -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=11, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+    target = payload["state"]
+    for key in path[:-1]:
+        target = target[key]
+    target[path[-1]] = value
+    with pytest.raises(SaveLoadError, match=message):
+        save_service.deserialize(payload)
+
+
+def test_deserialize_does_not_alias_payload_containers() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=13, player_name="Hero")
+    area_service.initialize_state(state)
+    state.flags["flag_test"] = True
+    payload = save_service.serialize(state)
+    restored = save_service.deserialize(payload)
+
+    payload["state"]["flags"]["flag_test"] = False
+    payload["state"]["inventory"]["items"]["potion_small"] = 99
+    payload["state"]["location_visits"].clear()
+
+    assert restored.flags["flag_test"] is True
+    assert restored.inventory.items.get("potion_small") != 99
+    assert restored.location_visits
+
+
+def test_visited_locations_dedupe_keeps_first_seen_order() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=17, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+    payload["state"]["current_location_id"] = "threshold_inn"
+    payload["state"]["visited_locations"] = ["floor_one_gate", "threshold_inn", "floor_one_gate"]
+    restored = save_service.deserialize(payload)
+    assert restored.visited_locations == ["floor_one_gate", "threshold_inn"]
+
+    payload["state"]["visited_locations"] = ["floor_one_gate", "floor_one_gate"]
+    restored = save_service.deserialize(payload)
+    assert restored.visited_locations == ["floor_one_gate", "threshold_inn"]
+
+
+def test_nested_coercion_errors_keep_field_context() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=19, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+
+    payload["state"]["shop_stock_remaining"] = {"threshold_inn": {"shop": {"potion": "3"}}}
+    with pytest.raises(SaveLoadError, match=r"shop_stock_remaining\[threshold_inn\]\[shop\]\[potion\]"):
+        save_service.deserialize(payload)
+
+    payload["state"]["shop_stock_remaining"] = {"threshold_inn": {"shop": {"potion": 3}}}
+    restored = save_service.deserialize(payload)
+    assert restored.shop_stock_remaining == {"threshold_inn": {"shop": {"potion": 3}}}
+
+
+def test_flat_sections_still_report_bad_entries() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=23, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+
+    payload["state"]["flags"] = {"flag_ok": True, "flag_bad": 1}
+    with pytest.raises(SaveLoadError, match=r"state\.flags\.flag_bad must be a boolean"):
+        save_service.deserialize(payload)
+
+    payload["state"]["flags"] = {"flag_ok": True}
+    payload["state"]["knowledge_kill_counts"] = {"goblin": -1}
+    with pytest.raises(SaveLoadError, match="must be non-negative"):
+        save_service.deserialize(payload)
+
+
+@pytest.mark.parametrize("mode", ["town", ["story"], None])
+def test_deserialize_rejects_invalid_mode(mode) -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=29, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+    payload["state"]["mode"] = mode
+    with pytest.raises(SaveLoadError, match="Invalid mode value"):
+        save_service.deserialize(payload)
+
+
+def test_serialize_payload_does_not_alias_state() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=31, player_name="Hero")
+    area_service.initialize_state(state)
+    state.flags["flag_test"] = True
+    payload = save_service.serialize(state)
+
+    payload["state"]["flags"]["flag_test"] = False
+    payload["state"]["inventory"]["weapons"]["unknown_weapon"] = 1
+    payload["state"]["visited_locations"].append("elsewhere")
+
+    assert state.flags["flag_test"] is True
+    assert "unknown_weapon" not in state.inventory.weapons
+    assert "elsewhere" not in state.visited_locations
+
+
+def test_deserialize_rejects_progress_for_unknown_members() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=37, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+
+    payload["state"]["member_levels"] = {"stranger": 2}
+    with pytest.raises(SaveLoadError, match="Member level references unknown id 'stranger'"):
+        save_service.deserialize(payload)
+
+    payload["state"]["member_levels"] = {}
+    payload["state"]["member_exp"] = {"stranger": 5}
+    with pytest.raises(SaveLoadError, match="Member EXP references unknown id 'stranger'"):
+        save_service.deserialize(payload)
+
+
+def test_saved_at_is_utc_iso_timestamp() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=41, player_name="Hero")
+    area_service.initialize_state(state)
+    saved_at = save_service.serialize(state)["metadata"]["saved_at"]
+    parsed = datetime.fromisoformat(saved_at)
+    assert parsed.tzinfo is not None
+    assert parsed.utcoffset() == timezone.utc.utcoffset(None)
+    assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 60
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("visited_locations", ["threshold_inn", "missing_location"]),
+        ("location_entry_seen", {"missing_location": True}),
+        ("location_visits", {"missing_location": 1}),
+    ],
+)
+def test_location_sections_reject_unknown_locations(field, value) -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=43, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+    payload["state"][field] = value
+    with pytest.raises(SaveLoadError, match="unknown location: missing_location"):
+        save_service.deserialize(payload)
+
+
+def test_deserialize_rejects_unknown_active_quest() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=47, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+    payload["state"]["quests_active"] = {"missing_quest": {"objectives": []}}
+    with pytest.raises(SaveLoadError, match="quest 'missing_quest' missing"):
+        save_service.deserialize(payload)
+
+
+def test_inventory_counts_reject_bad_quantities() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=53, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+    items = payload["state"]["inventory"]["items"]
+
+    items["potion_hp_small"] = -1
+    with pytest.raises(SaveLoadError, match=r"state\.inventory\.items\[potion_hp_small\] cannot be negative"):
+        save_service.deserialize(payload)
+
+    items["potion_hp_small"] = "2"
+    with pytest.raises(SaveLoadError, match="must be an integer"):
+        save_service.deserialize(payload)
+
+    items["potion_hp_small"] = 2
+    assert save_service.deserialize(payload).inventory.items["potion_hp_small"] == 2
+
+
+def test_inventory_reports_every_missing_definition() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=59, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+    payload["state"]["inventory"]["armour"] = {"zz_missing": 1, "aa_missing": 2}
+    with pytest.raises(SaveLoadError, match="'aa_missing', 'zz_missing' missing"):
+        save_service.deserialize(payload)
+
+
+def test_list_and_count_sections_still_report_bad_entries() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=61, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+
+    payload["state"]["quests_completed"] = ["ok", 3]
+    with pytest.raises(SaveLoadError, match="state.quests_completed entries must be strings"):
+        save_service.deserialize(payload)
+
+    payload["state"]["quests_completed"] = []
+    payload["state"]["owned_summons"] = {"micro_raptor": -2}
+    with pytest.raises(SaveLoadError, match="state.owned_summons values must be non-negative"):
+        save_service.deserialize(payload)
+
+    payload["state"]["owned_summons"] = {"micro_raptor": 2}
+    assert save_service.deserialize(payload).owned_summons == {"micro_raptor": 2}
+
+
+def test_shop_sections_copy_nested_maps() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=67, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+    payload["state"]["shop_stock_remaining"] = {"threshold_inn": {"shop": {"potion": 3}}}
+    payload["state"]["shop_stock_visit_index"] = {"threshold_inn": {"shop": 2}}
+
+    restored = save_service.deserialize(payload)
+    payload["state"]["shop_stock_remaining"]["threshold_inn"]["shop"]["potion"] = 0
+    payload["state"]["shop_stock_visit_index"]["threshold_inn"]["shop"] = 9
+
+    assert restored.shop_stock_remaining == {"threshold_inn": {"shop": {"potion": 3}}}
+    assert restored.shop_stock_visit_index == {"threshold_inn": {"shop": 2}}
+
+    payload["state"]["shop_stock_visit_index"] = {"threshold_inn": {"shop": -1}}
+    with pytest.raises(SaveLoadError, match="shop_stock_visit_index values must be non-negative"):
+        save_service.deserialize(payload)
+
+
+def test_serialize_without_copies_matches_copied_payload() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=71, player_name="Hero")
+    area_service.initialize_state(state)
+    state.flags["flag_test"] = True
+
+    copied = save_service.serialize(state)
+    shared = save_service.serialize(state, copy_containers=False)
+
+    assert shared["state"] == copied["state"]
+    assert shared["state"]["flags"] is state.flags
+    assert copied["state"]["flags"] is not state.flags
+
+
+def test_player_attributes_reject_negative_values() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=73, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+    payload["state"]["player_attributes"] = {"STR": 1, "DEX": 2, "INT": 3, "VIT": -4, "BOND": 5}
+    with pytest.raises(SaveLoadError, match=r"state\.player_attributes\.VIT must be a non-negative integer"):
+        save_service.deserialize(payload)
+
+
+def test_pending_narration_rejects_unknown_story_node() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=79, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+    payload["state"]["pending_narration"] = [{"node_id": "missing_node", "text": "..."}]
+    with pytest.raises(SaveLoadError, match="story node 'missing_node' missing"):
+        save_service.deserialize(payload)
+
+
+def test_location_progress_defaults_include_current_location() -> None:
+    story_service, _, _, save_service, area_service, _ = _build_test_services()
+    state = story_service.start_new_game(seed=83, player_name="Hero")
+    area_service.initialize_state(state)
+    payload = save_service.serialize(state)
+    payload["state"]["current_location_id"] = "threshold_inn"
+    payload["state"]["visited_locations"] = ["floor_one_gate"]
+    payload["state"]["location_entry_seen"] = {"floor_one_gate": False}
+    payload["state"]["location_visits"] = {"floor_one_gate": 3}
+
+    restored = save_service.deserialize(payload)
+
+    assert restored.visited_locations == ["floor_one_gate", "threshold_inn"]
+    assert restored.location_entry_seen == {"floor_one_gate": False, "threshold_inn": True}
+    assert restored.location_visits == {"floor_one_gate": 3, "threshold_inn": 0}
+
+    for key in ("visited_locations", "location_entry_seen", "location_visits"):
+        payload["state"].pop(key)
+    restored = save_service.deserialize(payload)
+    assert restored.visited_locations == ["threshold_inn"]
+    assert restored.location_entry_seen == {"threshold_inn": True}
+    assert restored.location_visits == {"threshold_inn": 0}
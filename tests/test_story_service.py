@@ -19,6 +19,8 @@ from tbg.domain.defs import StoryEffectDef
 from tbg.services.story_service import (
     BattleRequestedEvent,
     GameMenuEnteredEvent,
+    PartyExpGrantedEvent,
+    PartyLevelUpEvent,
     PartyMemberJoinedEvent,
     PlayerClassSetEvent,
     StoryService,
@@ -657,3 +659,17 @@ def test_northern_ridge_path_triggers_rampager_after_accept() -> None:
     assert battle_events
     assert battle_events[0].enemy_id == "goblin_rampager"
 
+
+def test_party_exp_grant_reports_every_level_gained() -> None:
+    service = _make_story_service()
+    state = service.start_new_game(seed=777, player_name="Tester")
+    state.member_levels["emma"] = 2
+    state.member_exp["emma"] = 5
+
+    # From level 2 the thresholds are 15, 20, 25: 5 + 60 clears three levels with 5 left over.
+    events = service._award_party_exp(state, "emma", 60)
+
+    assert isinstance(events[0], PartyExpGrantedEvent)
+    assert events[0].new_level == 5
+    assert [event.new_level for event in events[1:] if isinstance(event, PartyLevelUpEvent)] == [3, 4, 5]
+    assert state.member_exp["emma"] == 5